@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark the BSA programme-grid pipeline on synthetic (or supplied) workbooks.
+
+- Synthesises a valid programme-grid XLSX of configurable size (stdlib only).
+- Times each stage separately (best/mean over --repeat runs), including the
+  columnar grid snapshot round trip next to the XLSX parse it replaces.
+- Measures per-stage peak Python memory with tracemalloc in a separate pass.
+- Prints a JSON report so parser regressions show up as numbers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import generate_networking_data_from_programme_grid as networking
+import generate_seed_from_programme_grid as seed
+from bsa_grid import (
+    GRID_COLUMNS,
+    GRID_WINDOW,
+    CellGrid,
+    ProgrammeGrid,
+    iter_first_sheet_rows,
+    read_first_sheet_cells,
+    read_grid_snapshot,
+    run_sinks,
+    write_grid_snapshot,
+)
+from bsa_grid.synthetic import MAX_DAYS, MAX_ROOMS, SyntheticGridSpec, write_synthetic_workbook
+
+Stage = Callable[[Dict[str, object]], object]
+
+
+def clear_caches() -> None:
+    seed.cache_clear()
+    networking.cache_clear()
+
+
+def build_stages(xlsx_path: Path, snapshot_path: Path) -> List[tuple]:
+    # (name, function of the shared context, context key for the result)
+    return [
+        ("read_first_sheet_cells", lambda ctx: read_first_sheet_cells(xlsx_path), None),
+        (
+            "read_cell_grid",
+            lambda ctx: CellGrid.build(iter_first_sheet_rows(xlsx_path, GRID_WINDOW), GRID_COLUMNS),
+            "cells",
+        ),
+        ("write_grid_snapshot", lambda ctx: write_grid_snapshot(snapshot_path, ctx["cells"]), None),
+        ("read_grid_snapshot", lambda ctx: read_grid_snapshot(snapshot_path), None),
+        ("index_grid", lambda ctx: ProgrammeGrid.from_cells(ctx["cells"], source=xlsx_path), "grid"),
+        ("generate_events", lambda ctx: seed.generate_events(ctx["grid"]), "event_result"),
+        ("to_sql", lambda ctx: seed.to_sql(*_sql_args(ctx["event_result"])), "sql"),
+        ("generate_networking_data", lambda ctx: networking.generate_networking_data(ctx["grid"]), "payload"),
+        (
+            "combined_walk",
+            lambda ctx: run_sinks(ctx["grid"], [seed.EventSink(ctx["grid"]), networking.TopicSink(ctx["grid"])]),
+            None,
+        ),
+    ]
+
+
+def _sql_args(event_result: tuple) -> tuple:
+    events, code_to_name, _name_to_code, day_labels = event_result
+    return events, code_to_name, day_labels
+
+
+def time_stage(fn: Stage, ctx: Dict[str, object], repeat: int) -> Dict[str, float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        clear_caches()
+        started = time.perf_counter()
+        fn(ctx)
+        timings.append(time.perf_counter() - started)
+    return {
+        "wall_seconds_best": round(min(timings), 6),
+        "wall_seconds_mean": round(sum(timings) / len(timings), 6),
+    }
+
+
+def measure_stage_memory(fn: Stage, ctx: Dict[str, object]) -> Dict[str, object]:
+    clear_caches()
+    tracemalloc.start()
+    try:
+        baseline, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = fn(ctx)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_bytes": peak - baseline, "result": result}
+
+
+def run_benchmark(xlsx_path: Path, snapshot_path: Path, repeat: int) -> Dict[str, object]:
+    ctx: Dict[str, object] = {}
+    stages: List[Dict[str, object]] = []
+
+    for name, fn, key in build_stages(xlsx_path, snapshot_path):
+        memory = measure_stage_memory(fn, ctx)
+        if key:
+            ctx[key] = memory["result"]
+        stage = {"name": name}
+        stage.update(time_stage(fn, ctx, repeat))
+        stage["peak_bytes"] = memory["peak_bytes"]
+        stages.append(stage)
+
+    cells: CellGrid = ctx["cells"]
+    payload = ctx["payload"]
+    return {
+        "stages": stages,
+        "counts": {
+            "grid_rows": len(cells),
+            "events": len(ctx["event_result"][0]),
+            "sql_bytes": len(ctx["sql"].encode("utf-8")),
+            "grid_snapshot_bytes": snapshot_path.stat().st_size,
+            "topics": payload["topic_count"],
+            "people": payload["total_people"],
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the BSA programme-grid generators")
+    parser.add_argument("--input", type=Path, help="Benchmark an existing XLSX instead of a synthetic one")
+    parser.add_argument("--days", type=int, default=MAX_DAYS, help=f"Conference days (1-{MAX_DAYS})")
+    parser.add_argument("--rooms", type=int, default=MAX_ROOMS, help=f"Rooms per day (1-{MAX_ROOMS})")
+    parser.add_argument("--slots-per-day", type=int, default=20, help="Time slots per day")
+    parser.add_argument("--detail-rows", type=int, default=6, help="Detail rows under each slot")
+    parser.add_argument("--lines-per-cell", type=int, default=4, help="Lines in each detail cell")
+    parser.add_argument("--people", type=int, default=2000, help="Distinct presenter names to draw from")
+    parser.add_argument(
+        "--shared-string-ratio",
+        type=float,
+        default=0.9,
+        help="Fraction of cells stored as shared strings (rest inline)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic grid")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage")
+    parser.add_argument("--keep-workbook", type=Path, help="Write the synthetic XLSX here and keep it")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here as well as stdout")
+    args = parser.parse_args()
+
+    spec: Optional[SyntheticGridSpec] = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        xlsx_path = args.input
+        if xlsx_path is None:
+            spec = SyntheticGridSpec(
+                days=args.days,
+                rooms=args.rooms,
+                slots_per_day=args.slots_per_day,
+                detail_rows=args.detail_rows,
+                lines_per_cell=args.lines_per_cell,
+                people=args.people,
+                shared_string_ratio=args.shared_string_ratio,
+                seed=args.seed,
+            )
+            try:
+                spec.validate()
+            except ValueError as error:
+                parser.error(str(error))
+            xlsx_path = args.keep_workbook or Path(tmp_dir) / "synthetic-programme-grid.xlsx"
+            write_synthetic_workbook(xlsx_path, spec)
+
+        report: Dict[str, object] = {
+            "python": platform.python_version(),
+            "workbook": {"path": str(xlsx_path), "bytes": xlsx_path.stat().st_size},
+            "spec": asdict(spec) if spec else None,
+            "repeat": args.repeat,
+        }
+        snapshot_path = Path(tmp_dir) / "programme-grid.bsagrid"
+        report.update(run_benchmark(xlsx_path, snapshot_path, max(args.repeat, 1)))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
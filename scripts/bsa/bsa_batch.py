@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Build one seed SQL file and one networking JSON from many programme grids.
+
+- Takes any number of workbooks, each optionally narrowed to sheets with
+  ``PATH::SHEET`` (sheet name, 1-based position, or ``*`` for every sheet).
+- Parses the sheets in a process pool, one sheet per task.
+- Merges days, themes, rooms and events into a single seed, and pools topic
+  people into a single networking dataset.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import generate_networking_data_from_programme_grid as networking
+import generate_seed_from_programme_grid as seed
+from bsa_grid import LayoutProfile, ProgrammeGrid, list_sheets, resolve_sheet_target, run_sinks
+from bsa_grid.cli import positive_int
+from bsa_grid.layout import read_layout_profile
+
+SHEET_SEPARATOR = "::"
+ALL_SHEETS = "*"
+
+SheetJob = Tuple[Path, Optional[str]]
+
+
+def parse_input_spec(spec: str) -> Tuple[Path, Optional[str]]:
+    path, separator, sheet = spec.partition(SHEET_SEPARATOR)
+    return Path(path), (sheet if separator else None)
+
+
+def expand_jobs(specs: List[str]) -> List[SheetJob]:
+    jobs: List[SheetJob] = []
+    for spec in specs:
+        path, sheet = parse_input_spec(spec)
+        if sheet == ALL_SHEETS:
+            with zipfile.ZipFile(path) as archive:
+                jobs.extend((path, name) for name, _target in list_sheets(archive))
+        else:
+            if sheet is not None:
+                with zipfile.ZipFile(path) as archive:
+                    resolve_sheet_target(archive, sheet)
+            jobs.append((path, sheet))
+    return jobs
+
+
+def job_label(job: SheetJob) -> str:
+    path, sheet = job
+    return f"{path.name} ({sheet})" if sheet else f"{path.name} (first worksheet)"
+
+
+def process_sheet(
+    job: SheetJob,
+    layout: Optional[LayoutProfile] = None,
+) -> Tuple[seed.EventResult, Dict[str, object]]:
+    # Runs in a worker process; everything returned is plain picklable data.
+    # Without a pinned layout each sheet's layout is detected independently.
+    path, sheet = job
+    grid = ProgrammeGrid.load(path, sheet, layout)
+    event_result, payload = run_sinks(grid, [seed.EventSink(grid), networking.TopicSink(grid)])
+    return event_result, payload
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Merge many BSA programme grids into one seed and networking dataset")
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        metavar="PATH[::SHEET]",
+        help="Workbook, optionally with a sheet name, 1-based sheet number, or * for all sheets",
+    )
+    parser.add_argument(
+        "--sql-output",
+        type=Path,
+        default=seed.DEFAULT_OUTPUT,
+        help="Output SQL file",
+    )
+    parser.add_argument(
+        "--json-output",
+        type=Path,
+        default=networking.DEFAULT_OUTPUT,
+        help="Output networking JSON path",
+    )
+    parser.add_argument(
+        "--sql-format",
+        choices=sorted(seed.SEED_FORMATS),
+        default="sql",
+        help="sql: plain insert statements; copy: COPY FROM STDIN blocks for psql",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=seed.DEFAULT_BATCH_SIZE,
+        help=f"Events per insert statement (default {seed.DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "--layout",
+        type=Path,
+        help="Layout profile JSON applied to every sheet instead of per-sheet detection",
+    )
+    args = parser.parse_args()
+
+    try:
+        jobs = expand_jobs(args.inputs)
+        layout = read_layout_profile(args.layout) if args.layout else None
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as error:
+        parser.error(str(error))
+    process = partial(process_sheet, layout=layout)
+
+    started = time.perf_counter()
+    workers = min(args.jobs, len(jobs))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(process, jobs))
+    else:
+        results = [process(job) for job in jobs]
+
+    events, code_to_name, _name_to_code, day_labels = seed.merge_event_results([result[0] for result in results])
+    payload = networking.merge_payloads(
+        [result[1] for result in results],
+        generated_from="; ".join(job_label(job) for job in jobs),
+    )
+
+    seed.write_sql(args.sql_output, seed.SEED_FORMATS[args.sql_format], events, code_to_name, day_labels, args.batch_size)
+    networking.write_json(args.json_output, payload)
+
+    for job, (event_result, _payload) in zip(jobs, results):
+        print(f"{job_label(job)}: {len(event_result[0])} events")
+    print(f"Merged {len(jobs)} sheets with {workers} worker(s) in {time.perf_counter() - started:.3f}s")
+    print(f"Generated {len(events)} events across {len(day_labels)} days")
+    print(f"Generated topics: {payload['topic_count']}")
+    print(f"Total unique people: {payload['total_people']}")
+    print(f"Wrote: {args.sql_output}")
+    print(f"Wrote: {args.json_output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Build every BSA output from one parse of the programme grid XLSX.
+
+- Reads the workbook once into a shared ProgrammeGrid.
+- Walks the slot cells once, feeding the schedule-event and networking sinks.
+- Writes the seed SQL and the networking JSON in the same run, plus the
+  co-presence graph with --copresence (its session sink joins the same walk).
+- Reuses the shared build cache, so an unchanged workbook is a no-op.
+- With --watch, rebuilds after each save and rewrites only the outputs that changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Dict, Optional
+
+import generate_networking_data_from_programme_grid as networking
+import generate_seed_from_programme_grid as seed
+from bsa_grid import LayoutProfile, ProgrammeGrid, run_sinks, write_grid_snapshot
+from bsa_grid.cache import DEFAULT_CACHE_DIR, BuildCache, derived_cache_key, grid_cache_key
+from bsa_grid.cli import positive_int
+from bsa_grid.encoding import write_encoded
+from bsa_grid.layout import add_layout_arguments, layout_to_dict, load_layout_option, write_layout_profile
+from bsa_grid.names import print_cache_stats
+from bsa_grid.profiling import add_profile_arguments, run_profiled
+from bsa_grid.watch import add_watch_arguments, watch
+
+
+def load_grid(
+    args: argparse.Namespace,
+    cache: Optional[BuildCache],
+    grid_key: Optional[str],
+    layout: Optional[LayoutProfile],
+) -> ProgrammeGrid:
+    if cache is not None:
+        return cache.load_grid(args.input, grid_key, layout)
+    return ProgrammeGrid.load(args.input, layout=layout)
+
+
+def build(args: argparse.Namespace, state: Dict[str, object]) -> None:
+    plain_sql = not (args.since or args.snapshot)
+    layout = load_layout_option(args.layout)
+    cache = None if args.no_cache else BuildCache(args.cache_dir)
+    grid = event_result = payload = graph = None
+    sql_current = json_current = False
+    graph_current = not args.copresence
+    if cache is not None:
+        grid_key = grid_cache_key(args.input)
+        layout_option = layout_to_dict(layout) if layout else None
+        events_key = derived_cache_key(grid_key, Path(seed.__file__), layout=layout_option)
+        payload_key = derived_cache_key(grid_key, Path(networking.__file__), layout=layout_option)
+        sql_key = derived_cache_key(
+            grid_key,
+            Path(seed.__file__),
+            format=args.sql_format,
+            batch_size=args.batch_size,
+            layout=layout_option,
+        )
+        sql_current = plain_sql and cache.output_is_current(args.sql_output, sql_key)
+        json_current = cache.output_is_current(args.json_output, payload_key)
+        graph_key = derived_cache_key(payload_key, Path(networking.__file__), top_k=args.top_k)
+        graph_current = graph_current or cache.output_is_current(args.copresence, graph_key)
+        if sql_current and json_current and graph_current and not args.save_grid:
+            outputs = [args.sql_output, args.json_output, *([args.copresence] if args.copresence else [])]
+            print(f"Up to date: {', '.join(str(path) for path in outputs)}")
+            return
+        cached_events = cache.load(events_key, "events")
+        event_result = seed.event_result_from_cache(cached_events) if cached_events is not None else None
+        payload = cache.load(payload_key, "networking")
+        if args.copresence:
+            graph = cache.load(graph_key, "copresence")
+
+    if event_result is None or payload is None or (args.copresence and graph is None):
+        grid = load_grid(args, cache, grid_key if cache is not None else None, layout)
+        sinks = [seed.EventSink(grid), networking.TopicSink(grid)]
+        if args.copresence:
+            sinks.append(networking.SessionSink(grid))
+        results = run_sinks(grid, sinks)
+        event_result, payload = results[0], results[1]
+        if args.copresence:
+            graph = networking.copresence_graph(payload, results[2], args.top_k)
+        if cache is not None:
+            cache.store(events_key, "events", seed.event_result_to_cache(event_result))
+            cache.store(payload_key, "networking", payload)
+            if graph is not None:
+                cache.store(graph_key, "copresence", graph)
+    events, code_to_name, _name_to_code, day_labels = event_result
+    if args.save_grid:
+        if grid is None:
+            grid = load_grid(args, cache, grid_key if cache is not None else None, layout)
+        write_grid_snapshot(args.save_grid, grid.cells)
+
+    # Only rewrite the outputs whose content changed since the previous --watch build.
+    content = networking.payload_content(payload)
+    sql_current = sql_current or (plain_sql and state.get("result") == event_result and args.sql_output.exists())
+    json_current = json_current or (state.get("content") == content and args.json_output.exists())
+    state["result"], state["content"] = event_result, content
+    graph_data = networking.encode_copresence(graph) if graph is not None else None
+    graph_current = graph_current or (state.get("copresence") == graph_data and args.copresence.exists())
+    state["copresence"] = graph_data
+
+    print(f"Generated {len(events)} events")
+    print(f"Generated topics: {payload['topic_count']}")
+    print(f"Total unique people: {payload['total_people']}")
+
+    if sql_current:
+        print(f"Unchanged: {args.sql_output}")
+    elif args.since:
+        diff = seed.diff_events(seed.read_event_snapshot(args.since), events)
+        seed.write_sql(args.sql_output, seed.write_incremental_sql, diff, code_to_name, day_labels, args.batch_size)
+        print(f"Changes since {args.since}: {len(diff.inserted)} inserted, {len(diff.updated)} updated, {len(diff.deleted)} deleted")
+        print(f"Wrote: {args.sql_output}")
+    else:
+        seed.write_sql(
+            args.sql_output, seed.SEED_FORMATS[args.sql_format], events, code_to_name, day_labels, args.batch_size
+        )
+        if cache is not None:
+            cache.record_output(args.sql_output, sql_key)
+        print(f"Wrote: {args.sql_output}")
+
+    if json_current:
+        print(f"Unchanged: {args.json_output}")
+    else:
+        networking.write_json(args.json_output, payload)
+        if cache is not None:
+            cache.record_output(args.json_output, payload_key)
+        print(f"Wrote: {args.json_output}")
+
+    if args.copresence:
+        if graph_current:
+            print(f"Unchanged: {args.copresence}")
+        else:
+            write_encoded(args.copresence, graph_data)
+            if cache is not None:
+                cache.record_output(args.copresence, graph_key)
+            print(f"Wrote: {args.copresence}")
+
+    if args.snapshot:
+        seed.write_event_snapshot(args.snapshot, events)
+        print(f"Wrote: {args.snapshot}")
+    if args.save_grid:
+        print(f"Wrote: {args.save_grid}")
+    if args.cache_stats:
+        print_cache_stats(cache_stats())
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    stats = {f"seed.{name}": counters for name, counters in seed.cache_stats().items()}
+    stats.update({f"networking.{name}": counters for name, counters in networking.cache_stats().items()})
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate BSA seed SQL and networking JSON from programme XLSX")
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=seed.DEFAULT_INPUT,
+        help="Path to source XLSX (or a .bsagrid snapshot of it)",
+    )
+    parser.add_argument(
+        "--sql-output",
+        type=Path,
+        default=seed.DEFAULT_OUTPUT,
+        help="Output SQL file",
+    )
+    parser.add_argument(
+        "--json-output",
+        type=Path,
+        default=networking.DEFAULT_OUTPUT,
+        help="Output networking JSON path",
+    )
+    parser.add_argument(
+        "--sql-format",
+        choices=sorted(seed.SEED_FORMATS),
+        default="sql",
+        help="sql: plain insert statements; copy: COPY FROM STDIN blocks for psql",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=seed.DEFAULT_BATCH_SIZE,
+        help=f"Events per insert statement (default {seed.DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--copresence",
+        type=Path,
+        nargs="?",
+        const=networking.DEFAULT_COPRESENCE_OUTPUT,
+        metavar="PATH",
+        help=f"Also write the top-k co-presence graph between people (default {networking.DEFAULT_COPRESENCE_OUTPUT})",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=positive_int,
+        default=networking.DEFAULT_TOP_K,
+        help=f"Neighbours kept per person in the co-presence graph (default {networking.DEFAULT_TOP_K})",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        help="Also write the generated events to this JSON snapshot (input for a later --since run)",
+    )
+    parser.add_argument(
+        "--since",
+        type=Path,
+        help="Previous event snapshot; write only the event inserts/updates/deletes since it",
+    )
+    parser.add_argument(
+        "--save-grid",
+        type=Path,
+        help="Also write the parsed cell grid as a .bsagrid snapshot (loadable via --input)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Build cache directory (parsed grid and derived data keyed by input hash)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the workbook and rewrite both outputs",
+    )
+    add_layout_arguments(parser)
+    add_watch_arguments(parser)
+    add_profile_arguments(parser)
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print name-classifier cache hit/miss counters",
+    )
+    args = parser.parse_args()
+    if args.since and args.sql_format != "sql":
+        parser.error("--since only supports --sql-format sql")
+    if args.write_layout:
+        write_layout_profile(args.write_layout, ProgrammeGrid.load(args.input).layout)
+        print(f"Wrote: {args.write_layout}")
+        return 0
+
+    if args.pstats and not args.profile:
+        parser.error("--pstats needs --profile")
+    if args.profile and args.watch:
+        parser.error("--profile profiles a single build; it cannot be combined with --watch")
+
+    state: Dict[str, object] = {}
+    if args.watch:
+        paths = [args.input, *([args.layout] if args.layout else [])]
+        return watch(paths, lambda: build(args, state), args.poll_interval, args.debounce)
+    if args.profile:
+        run_profiled(args.profile, args.pstats, lambda: build(args, state), cache_stats)
+    else:
+        build(args, state)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
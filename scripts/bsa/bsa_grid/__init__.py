@@ -0,0 +1,114 @@
+"""
+Shared reader for the BSA programme grid XLSX.
+
+Both BSA generators load the workbook through ``ProgrammeGrid`` so a single
+parse can feed the seed SQL and the networking JSON.
+"""
+
+from .cells import CellGrid
+from .grid import (
+    COL_END,
+    COL_START,
+    DAY_LABEL_RE,
+    GRID_COLUMNS,
+    GRID_WINDOW,
+    THEME_TRACK_RE,
+    TIME_RANGE_RE,
+    TIME_SPAN_RE,
+    DaySection,
+    ProgrammeGrid,
+    SlotIndex,
+    SlotRow,
+    build_column_theme_hints,
+    build_day_sections,
+    build_slot_index,
+    build_theme_maps,
+    detect_layout,
+    extract_time_block,
+    load_programme_grid,
+    parse_day_from_label,
+    parse_theme_and_track,
+)
+from .layout import (
+    DEFAULT_LAYOUT,
+    READ_COL_END,
+    LayoutProfile,
+    RoundtableLayout,
+    read_layout_profile,
+    write_layout_profile,
+)
+from .pipeline import SlotCell, SlotSink, iter_slot_cells, run_sinks
+from .snapshot import GridSnapshot, read_grid_snapshot, write_grid_snapshot
+from .text import NON_NAME_TOKENS, normalize_person_key, normalize_space, normalize_theme_key
+from .xlsx import (
+    NS,
+    CellWindow,
+    Rows,
+    SharedStringTable,
+    col_to_num,
+    iter_cols,
+    iter_first_sheet_rows,
+    iter_sheet_rows,
+    list_sheets,
+    num_to_col,
+    parse_shared_strings,
+    read_first_sheet_cells,
+    resolve_first_sheet_target,
+    resolve_sheet_target,
+)
+
+__all__ = [
+    "COL_END",
+    "COL_START",
+    "DAY_LABEL_RE",
+    "DEFAULT_LAYOUT",
+    "GRID_COLUMNS",
+    "GRID_WINDOW",
+    "NON_NAME_TOKENS",
+    "NS",
+    "READ_COL_END",
+    "THEME_TRACK_RE",
+    "TIME_RANGE_RE",
+    "TIME_SPAN_RE",
+    "CellGrid",
+    "CellWindow",
+    "DaySection",
+    "GridSnapshot",
+    "LayoutProfile",
+    "ProgrammeGrid",
+    "RoundtableLayout",
+    "Rows",
+    "SlotIndex",
+    "SlotRow",
+    "SharedStringTable",
+    "SlotCell",
+    "SlotSink",
+    "build_column_theme_hints",
+    "build_day_sections",
+    "build_slot_index",
+    "build_theme_maps",
+    "col_to_num",
+    "detect_layout",
+    "extract_time_block",
+    "iter_cols",
+    "iter_first_sheet_rows",
+    "iter_sheet_rows",
+    "iter_slot_cells",
+    "list_sheets",
+    "load_programme_grid",
+    "normalize_person_key",
+    "normalize_space",
+    "normalize_theme_key",
+    "num_to_col",
+    "parse_day_from_label",
+    "parse_shared_strings",
+    "parse_theme_and_track",
+    "read_first_sheet_cells",
+    "read_grid_snapshot",
+    "read_layout_profile",
+    "resolve_first_sheet_target",
+    "resolve_sheet_target",
+    "run_sinks",
+    "write_grid_snapshot",
+    "write_layout_profile",
+]
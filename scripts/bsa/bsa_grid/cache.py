@@ -0,0 +1,145 @@
+"""
+Content-hash build cache for the programme-grid generators.
+
+Entries are keyed by a digest of the workbook bytes plus the source of the
+code that produced them, so an unchanged input with unchanged generators is a
+cache hit and any edit to either forces a full rebuild.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, TypeVar
+
+from .grid import ProgrammeGrid
+from .layout import LayoutProfile
+from .snapshot import SNAPSHOT_SUFFIX, write_grid_snapshot
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = Path(".cache/bsa")
+MAX_CACHE_ENTRIES = 32
+CACHE_ENTRY_PREFIXES = ("grid-", "events-", "networking-", "copresence-")
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+T = TypeVar("T")
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sources_digest(paths: Iterable[Path]) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(Path(p).resolve() for p in paths):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def grid_cache_key(xlsx_path: Path) -> str:
+    digest = hashlib.sha256(f"grid:{CACHE_VERSION}".encode("utf-8"))
+    digest.update(file_digest(xlsx_path).encode("ascii"))
+    digest.update(sources_digest(PACKAGE_DIR.glob("*.py")).encode("ascii"))
+    return digest.hexdigest()
+
+
+def derived_cache_key(grid_key: str, generator_path: Path, **options: object) -> str:
+    digest = hashlib.sha256(grid_key.encode("ascii"))
+    digest.update(sources_digest([generator_path]).encode("ascii"))
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Grid snapshots and pickled build artefacts, plus a manifest of current outputs."""
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR, max_entries: int = MAX_CACHE_ENTRIES) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.manifest_path = directory / "outputs.json"
+
+    def _entry_path(self, key: str, name: str) -> Path:
+        return self.directory / f"{name}-{key[:32]}.pickle"
+
+    def load(self, key: str, name: str) -> Optional[object]:
+        path = self._entry_path(key, name)
+        try:
+            with path.open("rb") as handle:
+                return pickle.load(handle)
+        except Exception:
+            # Missing, truncated or stale-format entries are all just misses.
+            return None
+
+    def store(self, key: str, name: str, value: object) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key, name)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._prune()
+
+    def get_or_build(self, key: str, name: str, build: Callable[[], T]) -> T:
+        value = self.load(key, name)
+        if value is None:
+            value = build()
+            self.store(key, name, value)
+        return value
+
+    def load_grid(
+        self,
+        xlsx_path: Path,
+        key: Optional[str] = None,
+        layout: Optional[LayoutProfile] = None,
+    ) -> ProgrammeGrid:
+        # The parsed cells are kept as a columnar snapshot; the indexes (and the
+        # detected layout) are rebuilt from them.
+        key = key or grid_cache_key(xlsx_path)
+        path = self.directory / f"grid-{key[:32]}{SNAPSHOT_SUFFIX}"
+        try:
+            return ProgrammeGrid.from_snapshot(path, layout)
+        except (OSError, ValueError):
+            pass
+        grid = ProgrammeGrid.load(xlsx_path, layout=layout)
+        write_grid_snapshot(path, grid.cells)
+        self._prune()
+        return grid
+
+    def output_is_current(self, path: Path, key: str) -> bool:
+        entry = self._read_manifest().get(str(path.resolve()))
+        if not entry or entry.get("key") != key:
+            return False
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        return entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns
+
+    def record_output(self, path: Path, key: str) -> None:
+        manifest = self._read_manifest()
+        stat = path.stat()
+        manifest[str(path.resolve())] = {"key": key, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def _read_manifest(self) -> Dict[str, Dict[str, object]]:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _prune(self) -> None:
+        entries = [path for path in self.directory.iterdir() if path.name.startswith(CACHE_ENTRY_PREFIXES)]
+        entries = sorted(entries, key=lambda p: p.stat().st_mtime_ns, reverse=True)
+        for stale in entries[self.max_entries :]:
+            stale.unlink(missing_ok=True)
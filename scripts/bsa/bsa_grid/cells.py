@@ -0,0 +1,171 @@
+"""
+Dense, array-backed cell grid for a parsed worksheet.
+
+A trailing block of at most ``MAX_DETACHED_ROWS`` rows that follows more
+than ``MAX_ROW_GAP`` blank rows (a footer, a stray note at the bottom of the
+sheet) is detached: kept sparsely, one list per row, so it cannot stretch the
+dense block to millions of empty slots. A block that turns out to be larger,
+or is followed by more rows, is real content and is reattached. Detached rows
+lie outside ``min_row..max_row`` but stay readable through ``get``/``row``,
+``to_rows`` and ``row_numbers``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .xlsx import Rows, col_to_num
+
+MAX_ROW_GAP = 256
+MAX_DETACHED_ROWS = 16
+
+
+class CellGrid:
+    """Worksheet values in one flat list indexed by ``(row - min_row) * ncols + col_idx``.
+
+    Missing cells hold ``""`` and values are interned, so repeated labels share
+    a single string. Row and column slices are plain list slices.
+    """
+
+    __slots__ = ("min_row", "max_row", "columns", "col_index", "ncols", "cells", "detached")
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        min_row: int,
+        max_row: int,
+        cells: List[str],
+        detached: Optional[Dict[int, List[str]]] = None,
+    ) -> None:
+        self.columns: List[str] = list(columns)
+        self.col_index: Dict[str, int] = {col: idx for idx, col in enumerate(self.columns)}
+        self.ncols = len(self.columns)
+        self.min_row = min_row
+        self.max_row = max_row
+        self.cells = cells
+        self.detached: Dict[int, List[str]] = detached or {}
+
+    @classmethod
+    def build(
+        cls,
+        rows: Iterable[Tuple[int, Dict[str, str]]],
+        columns: Sequence[str],
+    ) -> "CellGrid":
+        # ``rows`` must be in ascending row order, as worksheet rows are stored.
+        grid = cls(columns, 0, -1, [])
+        col_index = grid.col_index
+        ncols = grid.ncols
+        cells = grid.cells
+        intern = sys.intern
+        last_row = None
+        detached = grid.detached
+
+        def attach(row_num: int, values: List[str]) -> None:
+            base = (row_num - grid.min_row) * ncols
+            cells.extend([""] * (base + ncols - len(cells)))
+            cells[base : base + ncols] = values
+            grid.max_row = row_num
+
+        for row_num, row_values in rows:
+            if last_row is not None and row_num <= last_row:
+                raise ValueError(f"Rows must be ascending; got {row_num} after {last_row}")
+            last_row = row_num
+            values = [""] * ncols
+            for col, value in row_values.items():
+                idx = col_index.get(col)
+                if idx is not None:
+                    values[idx] = intern(value)
+            if not cells:
+                grid.min_row = row_num
+            if detached or (cells and row_num - grid.max_row > MAX_ROW_GAP + 1):
+                if not any(values):
+                    continue
+                detached[row_num] = values
+                if len(detached) <= MAX_DETACHED_ROWS:
+                    continue
+                # Too many rows for a footer: the block is part of the sheet after all.
+                for pending_row, pending_values in detached.items():
+                    attach(pending_row, pending_values)
+                detached.clear()
+                continue
+            attach(row_num, values)
+
+        return grid
+
+    @classmethod
+    def from_rows(cls, rows: Rows, columns: Optional[Sequence[str]] = None) -> "CellGrid":
+        if columns is None:
+            columns = sorted({col for values in rows.values() for col in values}, key=col_to_num)
+        return cls.build(((row_num, rows[row_num]) for row_num in sorted(rows)), columns)
+
+    def __len__(self) -> int:
+        return self.max_row - self.min_row + 1 if self.cells else 0
+
+    def _offset(self, row_num: int) -> Optional[int]:
+        if not self.cells or not self.min_row <= row_num <= self.max_row:
+            return None
+        return (row_num - self.min_row) * self.ncols
+
+    def get(self, row_num: int, col: str) -> str:
+        base = self._offset(row_num)
+        idx = self.col_index.get(col)
+        if idx is None:
+            return ""
+        if base is None:
+            detached = self.detached.get(row_num)
+            return detached[idx] if detached else ""
+        return self.cells[base + idx]
+
+    def has_row(self, row_num: int) -> bool:
+        return any(self.row(row_num))
+
+    def row(self, row_num: int) -> List[str]:
+        base = self._offset(row_num)
+        if base is None:
+            return list(self.detached.get(row_num) or [""] * self.ncols)
+        return self.cells[base : base + self.ncols]
+
+    def row_dict(self, row_num: int) -> Dict[str, str]:
+        return {col: value for col, value in zip(self.columns, self.row(row_num)) if value}
+
+    def column(self, col: str, first_row: int, last_row: int) -> List[str]:
+        """Values of ``col`` for rows ``first_row..last_row`` inclusive."""
+        if last_row < first_row:
+            return []
+        idx = self.col_index.get(col)
+        if idx is None or not self.cells:
+            return [""] * (last_row - first_row + 1)
+
+        lo = max(first_row, self.min_row)
+        hi = min(last_row, self.max_row)
+        if lo > hi:
+            return [""] * (last_row - first_row + 1)
+
+        start = (lo - self.min_row) * self.ncols + idx
+        stop = (hi - self.min_row) * self.ncols + idx + 1
+        values = [""] * (lo - first_row)
+        values.extend(self.cells[start : stop : self.ncols])
+        values.extend([""] * (last_row - hi))
+        return values
+
+    def iter_column(self, col: str) -> Iterator[Tuple[int, str]]:
+        """Yield ``(row_num, value)`` for every non-empty cell in ``col``."""
+        for offset, value in enumerate(self.column(col, self.min_row, self.max_row)):
+            if value:
+                yield self.min_row + offset, value
+
+    def row_numbers(self) -> Iterator[int]:
+        """Every row a scan should visit: the dense block, then the detached rows."""
+        yield from range(self.min_row, self.max_row + 1)
+        yield from self.detached
+
+    def to_rows(self) -> Rows:
+        rows: Rows = {}
+        for row_num in range(self.min_row, self.max_row + 1):
+            values = self.row_dict(row_num)
+            if values:
+                rows[row_num] = values
+        for row_num in self.detached:
+            rows[row_num] = self.row_dict(row_num)
+        return rows
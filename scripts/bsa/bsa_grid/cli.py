@@ -0,0 +1,14 @@
+"""
+Argument types shared by the BSA command-line scripts.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return number
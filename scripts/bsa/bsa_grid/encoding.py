@@ -0,0 +1,95 @@
+"""
+JSON encodings and pre-compressed siblings for generated payloads.
+
+- ``pretty`` is the indented JSON the generators have always written;
+  ``minified`` drops the whitespace. Payload-specific layouts (such as the
+  networking columnar form) are built by the generator and encoded minified.
+- ``gz`` siblings use the stdlib; ``br`` needs the optional ``brotli``
+  package and is skipped (reported as unavailable) without it.
+- Compression is deterministic (no gzip timestamp), so unchanged payloads
+  produce byte-identical siblings.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+CODECS = ("gz", "br")
+
+
+def load_brotli():
+    # Optional dependency: only .br siblings need it.
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def encode_json(value: object, minified: bool = False) -> bytes:
+    if minified:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return (json.dumps(value, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _brotli(data: bytes) -> Optional[bytes]:
+    brotli = load_brotli()
+    if brotli is None:
+        return None
+    return brotli.compress(data, quality=11)
+
+
+COMPRESSORS: Dict[str, Callable[[bytes], Optional[bytes]]] = {"gz": _gzip, "br": _brotli}
+
+
+def compress(data: bytes, codec: str) -> Optional[bytes]:
+    """Compressed ``data``, or None when the codec's optional package is missing."""
+    return COMPRESSORS[codec](data)
+
+
+def available_codecs(codecs: Sequence[str]) -> List[str]:
+    return [codec for codec in codecs if codec != "br" or load_brotli() is not None]
+
+
+def sibling_path(path: Path, codec: str) -> Path:
+    return path.with_name(f"{path.name}.{codec}")
+
+
+def write_encoded(path: Path, data: bytes, codecs: Sequence[str] = ()) -> List[Path]:
+    """Write ``data`` to ``path`` plus one ``path.<codec>`` sibling per available codec."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    written = [path]
+    for codec in available_codecs(codecs):
+        sibling = sibling_path(path, codec)
+        sibling.write_bytes(compress(data, codec))
+        written.append(sibling)
+    return written
+
+
+def size_report(encodings: Dict[str, bytes]) -> Dict[str, Dict[str, Optional[int]]]:
+    """Byte size of each encoding raw and under every codec (None if unavailable)."""
+    report: Dict[str, Dict[str, Optional[int]]] = {}
+    for name, data in encodings.items():
+        sizes: Dict[str, Optional[int]] = {"raw": len(data)}
+        for codec in CODECS:
+            compressed = compress(data, codec)
+            sizes[codec] = len(compressed) if compressed is not None else None
+        report[name] = sizes
+    return report
+
+
+def print_size_report(report: Dict[str, Dict[str, Optional[int]]]) -> None:
+    for name, sizes in report.items():
+        parts = [f"{sizes['raw']} B raw"]
+        for codec in CODECS:
+            size = sizes[codec]
+            parts.append(f"{size} B {codec}" if size is not None else f"{codec} unavailable")
+        print(f"Size {name}: {', '.join(parts)}")
@@ -0,0 +1,61 @@
+"""
+Sparse weighted co-presence graph over integer person ids.
+
+- ``groups`` are small weighted groups (sessions): they propose each
+  person's candidates, and every shared group adds its weight.
+- ``memberships`` are per-person ids of broad groups (topics, which can hold
+  hundreds of people). They are never expanded pairwise; the overlap is only
+  counted for candidates already proposed by ``groups``, so the work follows
+  session sizes rather than the square of topic sizes.
+- Each person's row is cut to the top ``top_k`` straight away, so memory
+  stays at one score row plus the kept neighbours. Ties go to the lower id.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+Group = Tuple[Sequence[int], int]
+
+
+def top_neighbours(
+    person_count: int,
+    groups: Iterable[Group],
+    top_k: int,
+    memberships: Sequence[Iterable[int]] = (),
+    membership_weight: int = 1,
+) -> Tuple[List[List[int]], List[List[int]]]:
+    """Per person: the ids of their ``top_k`` strongest neighbours and the scores, strongest first."""
+    members: List[Tuple[int, ...]] = []
+    weights: List[int] = []
+    person_groups: List[List[int]] = [[] for _person in range(person_count)]
+    for group, weight in groups:
+        unique = tuple(sorted(set(group)))
+        if len(unique) < 2:
+            continue
+        for person_id in unique:
+            person_groups[person_id].append(len(members))
+        members.append(unique)
+        weights.append(weight)
+    shared = [frozenset(ids) for ids in memberships]
+
+    neighbours: List[List[int]] = []
+    scores: List[List[int]] = []
+    for person_id, group_ids in enumerate(person_groups):
+        counts: Dict[int, Counter] = defaultdict(Counter)
+        for group_id in group_ids:
+            counts[weights[group_id]].update(members[group_id])
+        row: Counter = Counter()
+        for weight, counter in counts.items():
+            row.update(counter if weight == 1 else {other: count * weight for other, count in counter.items()})
+        del row[person_id]
+        if shared:
+            own = shared[person_id]
+            for other in row:
+                row[other] += membership_weight * len(own & shared[other])
+        best = heapq.nsmallest(top_k, row.items(), key=lambda item: (-item[1], item[0]))
+        neighbours.append([other for other, _score in best])
+        scores.append([score for _other, score in best])
+    return neighbours, scores
@@ -0,0 +1,461 @@
+"""
+Parsed programme-grid workbook: day sections, theme legend and column hints.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import re
+import warnings
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .cells import MAX_ROW_GAP, CellGrid
+from .layout import COL_END, COL_START, DEFAULT_LAYOUT, READ_COL_END, LayoutProfile, RoundtableLayout
+from .profiling import compile_regex, span
+from .snapshot import is_grid_snapshot, read_grid_snapshot
+from .text import normalize_space, normalize_theme_key
+from .xlsx import CellWindow, Rows, col_to_num, iter_cols, iter_sheet_rows, num_to_col
+
+DAY_LABEL_RE = compile_regex(
+    r"\b(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+(\d{1,2})\s+"
+    r"(Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|June?|July?|Aug(?:ust)?|"
+    r"Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+(\d{4})\b",
+    re.I,
+)
+TIME_RANGE_RE = compile_regex(r"^\s*(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})(.*)$", re.S)
+TIME_SPAN_RE = compile_regex(r"(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})")
+THEME_CODE_RE = compile_regex(r"[A-Z]{2,6}")
+STREAM_CODE_RE = compile_regex(r"[A-Z]{2,6}\d*")
+THEME_TRACK_RE = compile_regex(r"([A-Z]{2,6})(\d{0,2})")
+ROUNDTABLE_NOTE_RE = compile_regex(r"round\s*table", re.I)
+NOTE_VENUE_RE = compile_regex(r"\(([^)]+)\)")
+# Parentheticals that remark on when, not where: "(Friday)", "(13:30)", "(tbc)".
+NOTE_REMARK_RE = compile_regex(
+    r"\b(?:mon|tues?|wed(?:nes)?|thu(?:rs?)?|fri|sat(?:ur)?|sun)(?:day)?\b|\d{1,2}[:.]\d{2}|\b(?:tbc|tba|tbd)\b",
+    re.I,
+)
+
+# Day labels (A), slot times (B) and room columns up to READ_COL_END are all
+# the generators read; legend and addendum cells fall inside this window, and
+# it leaves room for layouts whose room grid extends past the default C..Y.
+GRID_COLUMNS = ["A", "B", *iter_cols(COL_START, READ_COL_END)]
+GRID_WINDOW = CellWindow(columns=frozenset(GRID_COLUMNS))
+
+
+@dataclass
+class DaySection:
+    row_start: int
+    row_end: int
+    day: dt.date
+    day_label: str
+    room_row: int
+
+
+class SlotRow(NamedTuple):
+    slot_row: int
+    next_slot_row: int
+    start_time: str
+    end_time: str
+    session_block: Optional[str]
+
+
+# Slot rows per day section, keyed by DaySection.row_start.
+SlotIndex = Dict[int, List[SlotRow]]
+
+
+@dataclass
+class ProgrammeGrid:
+    cells: CellGrid
+    sections: List[DaySection]
+    code_to_name: Dict[str, str]
+    name_to_code: Dict[str, str]
+    column_theme_hints: Dict[str, str]
+    slot_index: SlotIndex
+    columns: List[str] = field(default_factory=lambda: iter_cols(COL_START, COL_END))
+    source: Optional[Path] = None
+    layout: LayoutProfile = DEFAULT_LAYOUT
+
+    @classmethod
+    def from_cells(
+        cls,
+        cells: CellGrid,
+        source: Optional[Path] = None,
+        layout: Optional[LayoutProfile] = None,
+    ) -> "ProgrammeGrid":
+        with span("section_build"):
+            sections = build_day_sections(cells)
+            slot_index = build_slot_index(cells, sections)
+        # Without a pinned profile the layout is detected from the cells themselves.
+        if layout is None:
+            with span("layout_detect"):
+                layout = detect_layout(cells, sections, slot_index=slot_index)
+        columns = layout.columns
+        with span("theme_hints"):
+            code_to_name, name_to_code = build_theme_maps(cells, layout)
+            column_theme_hints = build_column_theme_hints(cells, slot_index, name_to_code, columns)
+        return cls(
+            cells=cells,
+            sections=sections,
+            code_to_name=code_to_name,
+            name_to_code=name_to_code,
+            column_theme_hints=column_theme_hints,
+            slot_index=slot_index,
+            columns=columns,
+            source=source,
+            layout=layout,
+        )
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Rows,
+        source: Optional[Path] = None,
+        layout: Optional[LayoutProfile] = None,
+    ) -> "ProgrammeGrid":
+        return cls.from_cells(CellGrid.from_rows(rows, GRID_COLUMNS), source=source, layout=layout)
+
+    @classmethod
+    def from_xlsx(
+        cls,
+        xlsx_path: Path,
+        sheet: Optional[str] = None,
+        layout: Optional[LayoutProfile] = None,
+    ) -> "ProgrammeGrid":
+        # Rows stream out of the parser as CellGrid consumes them; unzip time nests inside.
+        with span("xml_parse"):
+            cells = CellGrid.build(iter_sheet_rows(xlsx_path, GRID_WINDOW, sheet), GRID_COLUMNS)
+        return cls.from_cells(cells, source=xlsx_path, layout=layout)
+
+    @classmethod
+    def from_snapshot(cls, snapshot_path: Path, layout: Optional[LayoutProfile] = None) -> "ProgrammeGrid":
+        with span("snapshot_read"):
+            cells = read_grid_snapshot(snapshot_path)
+        return cls.from_cells(cells, source=snapshot_path, layout=layout)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        sheet: Optional[str] = None,
+        layout: Optional[LayoutProfile] = None,
+    ) -> "ProgrammeGrid":
+        # Accept either the source workbook or a grid snapshot written from it.
+        with span("load_grid"):
+            if is_grid_snapshot(path):
+                return cls.from_snapshot(path, layout)
+            return cls.from_xlsx(path, sheet, layout)
+
+    def slots(self, section: DaySection) -> List[SlotRow]:
+        return self.slot_index.get(section.row_start, [])
+
+    def roundtable_day(self) -> Optional[dt.date]:
+        table = self.layout.roundtable
+        if table is None:
+            return None
+        if table.day is not None:
+            return table.day
+        return self.sections[-1].day if self.sections else None
+
+
+def load_programme_grid(
+    path: Path,
+    sheet: Optional[str] = None,
+    layout: Optional[LayoutProfile] = None,
+) -> ProgrammeGrid:
+    return ProgrammeGrid.load(path, sheet, layout)
+
+
+def parse_day_from_label(label: str) -> dt.date:
+    match = DAY_LABEL_RE.search(label)
+    if not match:
+        raise ValueError(f"Could not parse day label: {label}")
+
+    day = int(match.group(2))
+    month_name = match.group(3)
+    year = int(match.group(4))
+
+    month = dt.datetime.strptime(month_name[:3], "%b").month
+    return dt.date(year, month, day)
+
+
+def build_day_sections(cells: CellGrid) -> List[DaySection]:
+    candidates: List[Tuple[int, dt.date, str]] = []
+
+    for row_num, label in cells.iter_column("A"):
+        if DAY_LABEL_RE.search(label):
+            candidates.append((row_num, parse_day_from_label(label), label))
+
+    # A day or slot in a detached footer block cannot be read as programme; say so.
+    for row_num in cells.detached:
+        label = cells.get(row_num, "A") if DAY_LABEL_RE.search(cells.get(row_num, "A")) else cells.get(row_num, "B")
+        if DAY_LABEL_RE.search(label) or TIME_RANGE_RE.match(label):
+            warnings.warn(
+                f"Row {row_num} ({normalize_space(label)!r}) sits in a small block more than "
+                f"{MAX_ROW_GAP} blank rows below the grid and is not read as part of the programme",
+                stacklevel=2,
+            )
+
+    sections: List[DaySection] = []
+    max_row = cells.max_row
+
+    for idx, (row_num, day_date, day_label) in enumerate(candidates):
+        next_start = candidates[idx + 1][0] if idx + 1 < len(candidates) else max_row + 1
+        row_end = next_start - 1
+
+        room_row = row_num
+        if not cells.get(room_row, "C"):
+            for probe in range(row_num - 2, row_num + 3):
+                if cells.get(probe, "C") and cells.get(probe, "D"):
+                    room_row = probe
+                    break
+
+        sections.append(
+            DaySection(
+                row_start=row_num,
+                row_end=row_end,
+                day=day_date,
+                day_label=day_label,
+                room_row=room_row,
+            )
+        )
+
+    return sections
+
+
+def extract_time_block(cell_value: str) -> Optional[Tuple[str, str, Optional[str]]]:
+    match = TIME_RANGE_RE.match(cell_value or "")
+    if not match:
+        return None
+
+    start_time = match.group(1)
+    end_time = match.group(2)
+    remainder = normalize_space(match.group(3) or "")
+    session_block = remainder or None
+    return start_time, end_time, session_block
+
+
+def build_slot_index(cells: CellGrid, sections: List[DaySection]) -> SlotIndex:
+    # One TIME_RANGE_RE pass over column B; every consumer reuses the result.
+    index: SlotIndex = {}
+
+    for section in sections:
+        matches: List[Tuple[int, "re.Match[str]"]] = []
+        for offset, value in enumerate(cells.column("B", section.row_start, section.row_end)):
+            if not value:
+                continue
+            match = TIME_RANGE_RE.match(value)
+            if match:
+                matches.append((section.row_start + offset, match))
+
+        slots: List[SlotRow] = []
+        for idx, (slot_row, match) in enumerate(matches):
+            next_slot_row = matches[idx + 1][0] if idx + 1 < len(matches) else section.row_end + 1
+            remainder = normalize_space(match.group(3) or "")
+            slots.append(
+                SlotRow(
+                    slot_row=slot_row,
+                    next_slot_row=next_slot_row,
+                    start_time=match.group(1),
+                    end_time=match.group(2),
+                    session_block=remainder or None,
+                )
+            )
+        index[section.row_start] = slots
+
+    return index
+
+
+def build_theme_maps(
+    cells: CellGrid,
+    layout: LayoutProfile = DEFAULT_LAYOUT,
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    code_to_name: Dict[str, str] = {}
+    name_to_code: Dict[str, str] = {}
+
+    for row_num in layout.theme_rows:
+        for name_col, code_col in layout.theme_columns:
+            name = normalize_space(cells.get(row_num, name_col))
+            code = normalize_space(cells.get(row_num, code_col)).upper()
+            if not name or not code:
+                continue
+            if not THEME_CODE_RE.fullmatch(code):
+                continue
+            code_to_name[code] = name
+            name_to_code[normalize_theme_key(name)] = code
+
+    return code_to_name, name_to_code
+
+
+def parse_theme_and_track(
+    text: str,
+    name_to_code: Dict[str, str],
+) -> Tuple[Optional[str], Optional[int]]:
+    value = normalize_space(text)
+    if not value:
+        return None, None
+
+    upper = value.upper()
+    known_codes = set(name_to_code.values())
+    match = THEME_TRACK_RE.fullmatch(upper)
+    if match:
+        # Guard against generic words (e.g. LUNCH) being misread as theme codes.
+        # Accept if this is a known code, has an explicit numeric track suffix,
+        # or is a short code token (<=4 chars like STS/MED/WEEL is handled below).
+        if not (upper in known_codes or match.group(2) or len(upper) <= 4):
+            return None, None
+        code = match.group(1)
+        track = int(match.group(2)) if match.group(2) else None
+        return code, track
+
+    lookup = name_to_code.get(normalize_theme_key(value))
+    if lookup:
+        return lookup, None
+
+    return None, None
+
+
+def build_column_theme_hints(
+    cells: CellGrid,
+    slot_index: SlotIndex,
+    name_to_code: Dict[str, str],
+    columns: Optional[List[str]] = None,
+) -> Dict[str, str]:
+    counters: Dict[str, Counter] = defaultdict(Counter)
+    columns = columns or iter_cols(COL_START, COL_END)
+
+    for slots in slot_index.values():
+        for slot in slots:
+            session_block = slot.session_block
+            if not session_block or "paper session" not in session_block.lower():
+                continue
+
+            for col in columns:
+                raw = cells.get(slot.slot_row, col)
+                if not raw:
+                    continue
+                theme_code, _track = parse_theme_and_track(raw, name_to_code)
+                if theme_code:
+                    counters[col][theme_code] += 1
+
+    hints: Dict[str, str] = {}
+    for col, counter in counters.items():
+        hints[col] = counter.most_common(1)[0][0]
+    return hints
+
+
+def detect_layout(
+    cells: CellGrid,
+    sections: List[DaySection],
+    fallback: LayoutProfile = DEFAULT_LAYOUT,
+    slot_index: Optional[SlotIndex] = None,
+) -> LayoutProfile:
+    """Locate the theme legend, room columns and roundtable addendum in one scan.
+
+    Every row is walked once: above the first day header, a name cell followed
+    by an upper-case code cell is a legend candidate; anywhere, a "roundtable"
+    (or "round table") cell with a time range is a candidate addendum note,
+    kept if a table of headers and stream codes follows it. Slot rows are
+    never notes: "09:00 - 10:30 Round Table Presentations" in column B is a
+    session the slot walk already handles. Room columns come
+    from the day sections' room rows. A legend or room range that is not found
+    keeps ``fallback``; a missing addendum means no roundtable, since the
+    fallback's rows would only pick up whatever ordinary cells sit there.
+    """
+    columns = cells.columns
+    header_end = sections[0].row_start - 1 if sections else cells.max_row
+
+    if slot_index is None:
+        slot_index = build_slot_index(cells, sections)
+    slot_rows = {slot.slot_row for slots in slot_index.values() for slot in slots}
+
+    legend: Dict[int, List[Tuple[str, str]]] = {}
+    notes: List[Tuple[int, str, str]] = []
+    for row_num in cells.row_numbers():
+        values = cells.row(row_num)
+        in_header = row_num <= header_end
+        slot_row = row_num in slot_rows
+        for idx, value in enumerate(values):
+            if not value:
+                continue
+            if not slot_row and ROUNDTABLE_NOTE_RE.search(value) and TIME_SPAN_RE.search(value):
+                notes.append((row_num, columns[idx], value))
+            if not in_header:
+                continue
+            right = values[idx + 1].strip() if idx + 1 < len(values) else ""
+            if right and THEME_CODE_RE.fullmatch(right) and not THEME_CODE_RE.fullmatch(value.strip()):
+                legend.setdefault(row_num, []).append((columns[idx], columns[idx + 1]))
+
+    roundtable: Optional[RoundtableLayout] = None
+    for note in notes:
+        detected = detect_roundtable(cells, sections, note, fallback.roundtable)
+        if detected.columns:
+            roundtable = detected
+            break
+
+    # An addendum above the first day sits below the legend; its stream-code
+    # row must not count as a legend row.
+    legend_end = header_end + 1
+    if roundtable is not None:
+        legend_end = min(legend_end, roundtable.note_row)
+    legend_rows = tuple(row for row in sorted(legend) if row < legend_end)
+    legend_pairs = sorted({pair for row in legend_rows for pair in legend[row]}, key=lambda p: col_to_num(p[0]))
+
+    room_nums = [
+        col_to_num(col)
+        for section in sections
+        for col in columns
+        if col_to_num(col) >= col_to_num(fallback.col_start) and cells.get(section.room_row, col)
+    ]
+
+    return LayoutProfile(
+        col_start=num_to_col(min(room_nums)) if room_nums else fallback.col_start,
+        col_end=num_to_col(max(room_nums)) if room_nums else fallback.col_end,
+        theme_rows=legend_rows or fallback.theme_rows,
+        theme_columns=tuple(legend_pairs) or fallback.theme_columns,
+        roundtable=roundtable,
+    )
+
+
+def detect_roundtable(
+    cells: CellGrid,
+    sections: List[DaySection],
+    note: Tuple[int, str, str],
+    fallback: Optional[RoundtableLayout],
+) -> RoundtableLayout:
+    note_row, note_col, note_text = note
+    header_row, code_row = note_row + 1, note_row + 2
+    table_columns = tuple(
+        col
+        for col in cells.columns
+        if cells.get(header_row, col)
+        and STREAM_CODE_RE.fullmatch(normalize_space(cells.get(code_row, col)).upper())
+    )
+
+    last_people_row = code_row
+    while any(cells.get(last_people_row + 1, col) for col in table_columns):
+        last_people_row += 1
+
+    # The note may name its day; otherwise it belongs to the day section it sits in.
+    day: Optional[dt.date] = None
+    if DAY_LABEL_RE.search(note_text):
+        day = parse_day_from_label(note_text)
+    else:
+        for section in sections:
+            if section.row_start <= note_row <= section.row_end:
+                day = section.day
+
+    venues = [venue for venue in NOTE_VENUE_RE.findall(note_text) if not NOTE_REMARK_RE.search(venue)]
+    default_prefix = fallback.room_prefix if fallback else RoundtableLayout.room_prefix
+    return RoundtableLayout(
+        note_row=note_row,
+        note_col=note_col,
+        header_row=header_row,
+        code_row=code_row,
+        people_rows=(code_row + 1, last_people_row),
+        columns=table_columns,
+        day=day,
+        room_prefix=normalize_space(venues[0]) if venues else default_prefix,
+    )
@@ -0,0 +1,151 @@
+"""
+Person-identity resolution for names collected from the programme grid.
+
+Names are compared on folded tokens (case, accents, apostrophes, honorifics
+and dots removed), and only within blocks that share a surname key and a
+first initial, so the work stays close to linear in the number of names.
+
+Within a block a variant merges into a fuller one when every token it has
+matches (equal, or an initial of) the fuller name's token in order, and every
+extra token on the fuller side is an initial. So "Jane O'Neill",
+"Jane O’Neill", "Jane A. O'Neill" and "J. O'Neill" resolve to one person,
+while "Jane O'Neill" does not absorb "Jane Anne O'Neill" on its own. A
+variant that could be either of two different people is left alone.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .text import normalize_person_key
+
+HONORIFICS = frozenset({"dr", "prof", "professor", "mr", "mrs", "ms", "mx"})
+
+
+@dataclass(frozen=True)
+class NameParts:
+    tokens: Tuple[str, ...]
+
+    @property
+    def first(self) -> str:
+        return self.tokens[0]
+
+    @property
+    def last(self) -> str:
+        return self.tokens[-1]
+
+    def block_key(self) -> Tuple[str, str]:
+        return (self.last, self.first[0])
+
+    def specificity(self) -> Tuple[int, int]:
+        return (len(self.tokens), sum(len(token) for token in self.tokens))
+
+
+def name_parts(name: str) -> Optional[NameParts]:
+    key = normalize_person_key(name).replace("'", "")
+    tokens = [token for token in key.split() if token]
+    while tokens and tokens[0] in HONORIFICS:
+        tokens = tokens[1:]
+    if len(tokens) < 2:
+        return None
+    return NameParts(tuple(tokens))
+
+
+def has_honorific(name: str) -> bool:
+    tokens = normalize_person_key(name).split()
+    return bool(tokens) and tokens[0].rstrip(".") in HONORIFICS
+
+
+def _token_matches(short: str, full: str) -> bool:
+    return short == full or (len(short) == 1 and full.startswith(short))
+
+
+def compatible(full: NameParts, short: NameParts, initials_only: bool = False) -> bool:
+    """True when ``short`` could be ``full`` written less completely.
+
+    Every token of ``short`` must match a token of ``full`` in order; with
+    ``initials_only`` the tokens only ``full`` has must all be initials.
+    """
+    if full == short or full.last != short.last or not _token_matches(short.first, full.first):
+        return False
+    remaining = list(full.tokens[1:-1])
+    for token in short.tokens[1:-1]:
+        while remaining and not _token_matches(token, remaining[0]):
+            if len(remaining.pop(0)) > 1 and initials_only:
+                return False
+        if not remaining:
+            return False
+        remaining.pop(0)
+    return not initials_only or all(len(token) == 1 for token in remaining)
+
+
+def subsumes(full: NameParts, short: NameParts) -> bool:
+    return compatible(full, short, initials_only=True)
+
+
+def resolve_identities(
+    names: Iterable[str],
+    weights: Optional[Mapping[str, int]] = None,
+) -> Dict[str, str]:
+    """Map every name to the canonical spelling of the person it refers to.
+
+    The canonical spelling is the most frequent (per ``weights``) variant of the
+    fullest form; ties prefer no honorific, then alphabetical order (so plain
+    apostrophes win).
+    """
+    weights = weights or {}
+    variants: Dict[NameParts, List[str]] = defaultdict(list)
+    canonical: Dict[str, str] = {}
+    for name in names:
+        parts = name_parts(name)
+        if parts is None:
+            canonical[name] = name
+        else:
+            variants[parts].append(name)
+
+    blocks: Dict[Tuple[str, str], List[NameParts]] = defaultdict(list)
+    for parts in variants:
+        blocks[parts.block_key()].append(parts)
+    # Initial-only first names ("J. O'Neill") can match anyone sharing the initial.
+    by_surname: Dict[str, List[NameParts]] = defaultdict(list)
+    for parts in variants:
+        by_surname[parts.last].append(parts)
+
+    parent: Dict[NameParts, NameParts] = {}
+    for block in blocks.values():
+        for parts in block:
+            pool = by_surname[parts.last] if len(parts.first) == 1 else block
+            # Every fuller form this could be, merge target or not, must lie on one
+            # chain; "Jane O'Neill" next to "Jane Anne" and "Jane Beth O'Neill" stays put.
+            fuller = sorted((other for other in pool if compatible(other, parts)), key=NameParts.specificity)
+            if not all(compatible(b, a) for a, b in zip(fuller, fuller[1:])):
+                continue
+            targets = [other for other in fuller if subsumes(other, parts)]
+            if targets:
+                parent[parts] = targets[-1]
+
+    groups: Dict[NameParts, List[NameParts]] = defaultdict(list)
+    for parts in variants:
+        root = parts
+        while root in parent:
+            root = parent[root]
+        groups[root].append(parts)
+
+    for root, members in groups.items():
+        spelled = variants[root]
+        chosen = min(spelled, key=lambda name: (-weights.get(name, 0), has_honorific(name), name.casefold(), name))
+        for member in members:
+            for name in variants[member]:
+                canonical[name] = chosen
+    return canonical
+
+
+def alias_map(canonical: Mapping[str, str]) -> Dict[str, List[str]]:
+    """Canonical name -> sorted other spellings, for people with more than one."""
+    aliases: Dict[str, List[str]] = defaultdict(list)
+    for name, chosen in canonical.items():
+        if name != chosen:
+            aliases[chosen].append(name)
+    return {chosen: sorted(names, key=lambda name: (name.casefold(), name)) for chosen, names in aliases.items()}
@@ -0,0 +1,147 @@
+"""
+Layout profiles: where the theme legend, room columns and roundtable addendum sit.
+
+A profile can be written to / read from JSON so a known layout can be pinned;
+otherwise ``grid.detect_layout`` derives one from the parsed cells.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .xlsx import col_to_num, iter_cols
+
+COL_START = "C"
+COL_END = "Y"
+# Widest room column the reader keeps; detected or pinned layouts must fit inside it.
+READ_COL_END = "AZ"
+
+
+@dataclass(frozen=True)
+class RoundtableLayout:
+    note_row: int
+    header_row: int
+    code_row: int
+    people_rows: Tuple[int, int]
+    columns: Tuple[str, ...]
+    note_col: str = "B"
+    # None means the last conference day in the grid.
+    day: Optional[dt.date] = None
+    room_prefix: str = "Market Place Restaurant"
+
+    def people_row_range(self) -> range:
+        return range(self.people_rows[0], self.people_rows[1] + 1)
+
+
+@dataclass(frozen=True)
+class LayoutProfile:
+    col_start: str = COL_START
+    col_end: str = COL_END
+    theme_rows: Tuple[int, ...] = (4, 5, 6, 7)
+    theme_columns: Tuple[Tuple[str, str], ...] = (("B", "C"), ("D", "E"), ("F", "G"), ("H", "I"))
+    roundtable: Optional[RoundtableLayout] = field(
+        default_factory=lambda: RoundtableLayout(
+            note_row=125,
+            header_row=126,
+            code_row=127,
+            people_rows=(128, 131),
+            columns=("D", "E", "F", "G"),
+            day=dt.date(2026, 4, 10),
+        )
+    )
+
+    @property
+    def columns(self) -> List[str]:
+        return iter_cols(self.col_start, self.col_end)
+
+    def validate(self) -> None:
+        if col_to_num(self.col_start) > col_to_num(self.col_end):
+            raise ValueError(f"col_start {self.col_start} is after col_end {self.col_end}")
+        if col_to_num(self.col_end) > col_to_num(READ_COL_END):
+            raise ValueError(f"col_end {self.col_end} is beyond the reader window ({READ_COL_END})")
+
+
+DEFAULT_LAYOUT = LayoutProfile()
+
+
+def layout_to_dict(profile: LayoutProfile) -> Dict[str, object]:
+    data: Dict[str, object] = {
+        "col_start": profile.col_start,
+        "col_end": profile.col_end,
+        "theme_rows": list(profile.theme_rows),
+        "theme_columns": [list(pair) for pair in profile.theme_columns],
+        "roundtable": None,
+    }
+    table = profile.roundtable
+    if table is not None:
+        data["roundtable"] = {
+            "note_row": table.note_row,
+            "note_col": table.note_col,
+            "header_row": table.header_row,
+            "code_row": table.code_row,
+            "people_rows": list(table.people_rows),
+            "columns": list(table.columns),
+            "day": table.day.isoformat() if table.day else None,
+            "room_prefix": table.room_prefix,
+        }
+    return data
+
+
+def layout_from_dict(data: Dict[str, object]) -> LayoutProfile:
+    table = data.get("roundtable")
+    roundtable = None
+    if table:
+        roundtable = RoundtableLayout(
+            note_row=int(table["note_row"]),
+            note_col=str(table.get("note_col", "B")),
+            header_row=int(table["header_row"]),
+            code_row=int(table["code_row"]),
+            people_rows=(int(table["people_rows"][0]), int(table["people_rows"][1])),
+            columns=tuple(table["columns"]),
+            day=dt.date.fromisoformat(table["day"]) if table.get("day") else None,
+            room_prefix=str(table.get("room_prefix", "Market Place Restaurant")),
+        )
+    profile = LayoutProfile(
+        col_start=str(data.get("col_start", COL_START)),
+        col_end=str(data.get("col_end", COL_END)),
+        theme_rows=tuple(int(row) for row in data.get("theme_rows", DEFAULT_LAYOUT.theme_rows)),
+        theme_columns=tuple(
+            (str(name_col), str(code_col))
+            for name_col, code_col in data.get("theme_columns", DEFAULT_LAYOUT.theme_columns)
+        ),
+        roundtable=roundtable,
+    )
+    profile.validate()
+    return profile
+
+
+def read_layout_profile(path: Path) -> LayoutProfile:
+    return layout_from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def write_layout_profile(path: Path, profile: LayoutProfile) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(layout_to_dict(profile), indent=2) + "\n", encoding="utf-8")
+
+
+def add_layout_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--layout",
+        type=Path,
+        help="Layout profile JSON to use instead of detecting the layout from the grid",
+    )
+    parser.add_argument(
+        "--write-layout",
+        type=Path,
+        metavar="PATH",
+        help="Write the detected layout profile to PATH and exit (edit it and pass back with --layout)",
+    )
+
+
+def load_layout_option(path: Optional[Path]) -> Optional[LayoutProfile]:
+    return read_layout_profile(path) if path else None
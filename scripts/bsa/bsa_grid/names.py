@@ -0,0 +1,117 @@
+"""
+Memoized person-name and speaker-line heuristics.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, Iterable
+
+from .profiling import compile_regex
+from .text import normalize_space
+
+NON_NAME_CHAR_RE = compile_regex(r"[^A-Za-z'\-\s]")
+NAME_TOKEN_RE = compile_regex(r"[A-Za-z][A-Za-z'\-]*")
+HONORIFIC_RE = compile_regex(r"^(dr|prof|mr|mrs|ms)\.?\s+", re.I)
+# Dots a name may carry: after a single-letter initial ("J.", "A.") or an honorific.
+NAME_DOT_RE = compile_regex(r"\b([A-Za-z]|dr|prof|mr|mrs|ms|mx)\.", re.I)
+SPEAKER_PREFIXES = (
+    "chair:",
+    "speaker:",
+    "speakers:",
+    "presenter:",
+    "presenters:",
+    "moderator:",
+    "discussant:",
+)
+
+DEFAULT_CACHE_SIZE = 8192
+
+
+def cache_counters(func: Callable) -> Dict[str, int]:
+    info = func.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+
+
+def print_cache_stats(stats: Dict[str, Dict[str, int]]) -> None:
+    for name, counters in stats.items():
+        print(f"Cache {name}: {counters['hits']} hits / {counters['misses']} misses")
+
+
+class NameClassifier:
+    """Person-name / speaker-line classifier with bounded LRU caches.
+
+    Both checks normalise the line first and cache on the normalised text, so
+    chair lines and presenter names repeated across detail rows are classified
+    once per run.
+    """
+
+    def __init__(
+        self,
+        non_name_tokens: Iterable[str],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        extra_name_chars: str = "",
+        dotted_initials: bool = False,
+    ) -> None:
+        self.non_name_tokens = frozenset(non_name_tokens)
+        # Characters besides letters, apostrophes, hyphens and spaces allowed in a name.
+        self.non_name_char_re = (
+            compile_regex(rf"[^A-Za-z'\-\s{re.escape(extra_name_chars)}]") if extra_name_chars else NON_NAME_CHAR_RE
+        )
+        self.dotted_initials = dotted_initials
+        self._person = lru_cache(maxsize=cache_size)(self._classify_person)
+        self._speaker = lru_cache(maxsize=cache_size)(self._classify_speaker)
+
+    def looks_like_person_name(self, line: str) -> bool:
+        return self._person(normalize_space(line))
+
+    def is_speaker_line(self, line: str) -> bool:
+        return self._speaker(normalize_space(line))
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            "looks_like_person_name": cache_counters(self._person),
+            "is_speaker_line": cache_counters(self._speaker),
+        }
+
+    def cache_clear(self) -> None:
+        self._person.cache_clear()
+        self._speaker.cache_clear()
+
+    def _classify_person(self, cleaned: str) -> bool:
+        if not cleaned:
+            return False
+
+        # Any other dot ("St. Helens", "Vol. Two") still rules the line out.
+        checked = NAME_DOT_RE.sub(r"\1", cleaned) if self.dotted_initials else cleaned
+        if self.non_name_char_re.search(checked):
+            return False
+
+        tokens = NAME_TOKEN_RE.findall(cleaned)
+        if not (2 <= len(tokens) <= 5):
+            return False
+
+        if any(token.upper() in self.non_name_tokens for token in tokens):
+            return False
+
+        if not all(token[0].isupper() for token in tokens):
+            return False
+
+        return True
+
+    def _classify_speaker(self, raw: str) -> bool:
+        if not raw:
+            return False
+
+        if raw.lower().startswith(SPEAKER_PREFIXES):
+            return True
+        if HONORIFIC_RE.match(raw):
+            return True
+
+        if "," in raw:
+            first = raw.split(",", 1)[0].strip()
+            if self.looks_like_person_name(first):
+                return True
+
+        return self._person(raw)
@@ -0,0 +1,73 @@
+"""
+Single-pass walk over the programme grid that feeds slot cells to sinks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Protocol, Sequence
+
+from .grid import DaySection, ProgrammeGrid
+from .profiling import count, span
+
+
+@dataclass
+class SlotCell:
+    section: DaySection
+    slot_row: int
+    next_slot_row: int
+    start_time: str
+    end_time: str
+    session_block: Optional[str]
+    col: str
+    base_value: str
+    # One entry per row between this slot and the next ("" for blank cells).
+    detail_values: List[str]
+
+
+class SlotSink(Protocol):
+    def add_slot_cell(self, cell: SlotCell) -> None:
+        ...
+
+    def finish(self) -> object:
+        ...
+
+
+def iter_slot_cells(grid: ProgrammeGrid) -> Iterator[SlotCell]:
+    cells = grid.cells
+    # A pinned layout may name columns the grid was not read with; skip those.
+    columns = [(col, cells.col_index[col]) for col in grid.columns if col in cells.col_index]
+
+    for section in grid.sections:
+        for slot in grid.slots(section):
+            slot_row, next_slot_row = slot.slot_row, slot.next_slot_row
+            slot_values = cells.row(slot_row)
+
+            for col, col_idx in columns:
+                base_value = slot_values[col_idx]
+                if not base_value:
+                    continue
+
+                yield SlotCell(
+                    section=section,
+                    slot_row=slot_row,
+                    next_slot_row=next_slot_row,
+                    start_time=slot.start_time,
+                    end_time=slot.end_time,
+                    session_block=slot.session_block,
+                    col=col,
+                    base_value=base_value,
+                    detail_values=cells.column(col, slot_row + 1, next_slot_row - 1),
+                )
+
+
+def run_sinks(grid: ProgrammeGrid, sinks: Sequence[SlotSink]) -> List[object]:
+    slot_cells = 0
+    with span("event_gen"):
+        for cell in iter_slot_cells(grid):
+            slot_cells += 1
+            for sink in sinks:
+                sink.add_slot_cell(cell)
+    count("slot_cells", slot_cells)
+    with span("sink_finish"):
+        return [sink.finish() for sink in sinks]
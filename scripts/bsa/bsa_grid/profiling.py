@@ -0,0 +1,245 @@
+"""
+Stage timing spans and counters for the generator --profile modes (stdlib only).
+
+- Library code marks stages with ``span("name")`` and ``count("name")``; both are
+  no-ops unless a ``Profiler`` is active, so normal runs pay one global lookup.
+- Spans nest: each reports inclusive seconds and self seconds (minus child
+  spans), so ``xml_parse`` excludes the ``unzip`` reads that happen inside it.
+- The bsa modules compile their patterns with ``compile_regex``; an active
+  profiler switches exactly those patterns (module-level and per-instance)
+  to counting ``regex_evals``, and nothing else in the process is touched.
+- The report is plain JSON; a cProfile/pstats dump can be written alongside.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import re
+import sys
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import AnyStr, BinaryIO, Callable, Dict, Iterator, List, Optional, TypeVar
+
+PROFILE_VERSION = 1
+STDOUT_PATH = Path("-")
+REGEX_METHODS = ("search", "match", "fullmatch", "findall", "finditer", "sub", "subn", "split")
+
+T = TypeVar("T")
+
+_active: Optional["Profiler"] = None
+
+
+class SpanStats:
+    __slots__ = ("calls", "seconds", "child_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.child_seconds = 0.0
+
+
+class Profiler:
+    """Collects span timings and counters for one run; activate with ``with profiler:``."""
+
+    def __init__(self, pstats_path: Optional[Path] = None) -> None:
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Counter = Counter()
+        self.pstats_path = pstats_path
+        self._stack: List[List[float]] = []
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._started = 0.0
+        self.wall_seconds = 0.0
+
+    def __enter__(self) -> "Profiler":
+        global _active
+        if _active is not None:
+            raise RuntimeError("A profiler is already active")
+        _active = self
+        for pattern in list(_patterns):
+            pattern.set_counting(True)
+        self._started = time.perf_counter()
+        if self.pstats_path is not None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        global _active
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            self.pstats_path.parent.mkdir(parents=True, exist_ok=True)
+            self._cprofile.dump_stats(str(self.pstats_path))
+        self.wall_seconds = time.perf_counter() - self._started
+        _active = None
+        for pattern in list(_patterns):
+            pattern.set_counting(False)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        # Each stack frame is [started, child seconds].
+        frame = [time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame[0]
+            self._stack.pop()
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.calls += 1
+            stats.seconds += elapsed
+            stats.child_seconds += frame[1]
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+    def report(self) -> Dict[str, object]:
+        return {
+            "version": PROFILE_VERSION,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "stages": [
+                {
+                    "name": name,
+                    "calls": stats.calls,
+                    "seconds": round(stats.seconds, 6),
+                    "self_seconds": round(stats.seconds - stats.child_seconds, 6),
+                }
+                for name, stats in self.spans.items()
+            ],
+            "counters": dict(sorted(self.counters.items())),
+            "pstats": str(self.pstats_path) if self.pstats_path else None,
+        }
+
+    def write_report(self, path: Path) -> None:
+        text = json.dumps(self.report(), indent=2) + "\n"
+        if path == STDOUT_PATH:
+            sys.stdout.write(text)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+
+class _NullSpan:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    profiler = _active
+    return profiler.span(name) if profiler is not None else NULL_SPAN
+
+
+def count(name: str, amount: int = 1) -> None:
+    profiler = _active
+    if profiler is not None:
+        profiler.counters[name] += amount
+
+
+def active_profiler() -> Optional[Profiler]:
+    return _active
+
+
+class TimedReader:
+    """File-like wrapper that books the time spent in ``read`` to the ``unzip`` span."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        with span("unzip"):
+            return self._stream.read(size)
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._stream, name)
+
+
+class CountingPattern:
+    """Compiled pattern whose evaluations are booked to ``regex_evals`` while a profiler is active.
+
+    Outside a profiled run the methods are the pattern's own, so counting costs
+    nothing in normal builds.
+    """
+
+    def __init__(self, pattern: "re.Pattern[AnyStr]") -> None:
+        self._pattern = pattern
+        self.set_counting(_active is not None)
+        _patterns.add(self)
+
+    def set_counting(self, enabled: bool) -> None:
+        for method in REGEX_METHODS:
+            func = getattr(self._pattern, method)
+            setattr(self, method, self._counted(func) if enabled else func)
+
+    @staticmethod
+    def _counted(func: Callable[..., T]) -> Callable[..., T]:
+        def counted(*args: object, **kwargs: object) -> T:
+            count("regex_evals")
+            return func(*args, **kwargs)
+
+        return counted
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._pattern, name)
+
+
+_patterns: "weakref.WeakSet[CountingPattern]" = weakref.WeakSet()
+
+
+def compile_regex(pattern: AnyStr, flags: int = 0) -> CountingPattern:
+    """``re.compile`` for patterns owned by the bsa modules."""
+    return CountingPattern(re.compile(pattern, flags))
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=STDOUT_PATH,
+        metavar="PATH",
+        help="Write a JSON stage timing and counter breakdown to PATH (stdout if omitted); "
+        "combine with --no-cache to profile a cold build",
+    )
+    parser.add_argument(
+        "--pstats",
+        type=Path,
+        metavar="PATH",
+        help="With --profile, also dump cProfile statistics to PATH (read with python -m pstats)",
+    )
+
+
+def run_profiled(
+    profile_path: Path,
+    pstats_path: Optional[Path],
+    func: Callable[[], T],
+    classifier_stats: Optional[Callable[[], Dict[str, Dict[str, int]]]] = None,
+) -> T:
+    """Run ``func`` under a profiler, then write the report."""
+
+    def classifier_calls() -> Dict[str, int]:
+        if classifier_stats is None:
+            return {}
+        return {
+            f"classifier_calls.{name}": counters["hits"] + counters["misses"]
+            for name, counters in classifier_stats().items()
+        }
+
+    before = classifier_calls()
+    profiler = Profiler(pstats_path)
+    with profiler:
+        result = func()
+    for name, calls in classifier_calls().items():
+        profiler.counters[name] += calls - before.get(name, 0)
+    profiler.write_report(profile_path)
+    return result
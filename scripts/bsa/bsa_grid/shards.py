@@ -0,0 +1,63 @@
+"""
+Content-addressed JSON shards plus a manifest, for datasets fetched piecemeal.
+
+- Each shard is written minified as ``<prefix>-<sha256[:12]>.json``, so a shard
+  whose content did not change keeps its filename and stays cached.
+- The manifest is written last and atomically, so a reader never sees it
+  point at a shard that is not on disk yet.
+- Shards the new manifest no longer references are removed afterwards.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Set
+
+MANIFEST_NAME = "manifest.json"
+SHARD_HASH_LENGTH = 12
+
+
+def shard_bytes(value: object) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def shard_name(prefix: str, data: bytes) -> str:
+    return f"{prefix}-{hashlib.sha256(data).hexdigest()[:SHARD_HASH_LENGTH]}.json"
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def write_shard(directory: Path, prefix: str, value: object) -> str:
+    data = shard_bytes(value)
+    name = shard_name(prefix, data)
+    path = directory / name
+    # Same name means same bytes; leave the file (and its mtime) alone.
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, data)
+    return name
+
+
+def write_manifest(directory: Path, manifest: object) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / MANIFEST_NAME
+    _atomic_write(path, (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
+    return path
+
+
+def prune_shards(directory: Path, keep: Iterable[str], prefixes: Iterable[str]) -> int:
+    keep_names: Set[str] = set(keep)
+    removed = 0
+    for prefix in prefixes:
+        for path in directory.glob(f"{prefix}-*.json"):
+            if path.name not in keep_names:
+                path.unlink()
+                removed += 1
+    return removed
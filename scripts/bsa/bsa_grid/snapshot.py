@@ -0,0 +1,202 @@
+"""
+Compact columnar snapshot of a parsed CellGrid, readable through mmap.
+
+Layout (little-endian, every array section 4-byte aligned):
+
+- header: magic, version, min_row, nrows, ncols, nstrings, ncells
+- string offsets: ``nstrings + 1`` uint32 byte offsets into the string blob
+- cell rows / cell columns / cell string ids: ``ncells`` uint32 each
+- string blob: UTF-8 text of the interned string table
+
+The first ``ncols`` strings are the column names; only non-empty cells are
+stored, in row-major order. Detached rows (see ``cells``) follow the dense
+block, with row offsets past ``nrows``.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from .cells import CellGrid
+
+SNAPSHOT_MAGIC = b"BSAGRID\x00"
+SNAPSHOT_VERSION = 2
+SNAPSHOT_SUFFIX = ".bsagrid"
+HEADER = struct.Struct("<8s6I")
+NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _uint32_bytes(values: List[int]) -> bytes:
+    data = array("I", values)
+    if not NATIVE_LITTLE_ENDIAN:
+        data.byteswap()
+    return data.tobytes()
+
+
+def write_grid_snapshot(path: Path, cells: CellGrid) -> Path:
+    string_ids: Dict[str, int] = {}
+    for col in cells.columns:
+        string_ids.setdefault(col, len(string_ids))
+
+    cell_rows: List[int] = []
+    cell_cols: List[int] = []
+    cell_strings: List[int] = []
+    ncols = cells.ncols
+    for offset, value in enumerate(cells.cells):
+        if value:
+            row_offset, col_idx = divmod(offset, ncols)
+            cell_rows.append(row_offset)
+            cell_cols.append(col_idx)
+            cell_strings.append(string_ids.setdefault(value, len(string_ids)))
+    for row_num, values in cells.detached.items():
+        for col_idx, value in enumerate(values):
+            if value:
+                cell_rows.append(row_num - cells.min_row)
+                cell_cols.append(col_idx)
+                cell_strings.append(string_ids.setdefault(value, len(string_ids)))
+
+    blob = bytearray()
+    offsets = [0]
+    for value in string_ids:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+
+    header = HEADER.pack(
+        SNAPSHOT_MAGIC,
+        SNAPSHOT_VERSION,
+        cells.min_row,
+        len(cells),
+        ncols,
+        len(string_ids),
+        len(cell_rows),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(header)
+        for values in (offsets, cell_rows, cell_cols, cell_strings):
+            handle.write(_uint32_bytes(values))
+        handle.write(blob)
+    tmp_path.replace(path)
+    return path
+
+
+def is_grid_snapshot(path: Path) -> bool:
+    try:
+        with path.open("rb") as handle:
+            return handle.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+
+class GridSnapshot:
+    """Memory-mapped view over a snapshot file; strings decode on demand.
+
+    Use as a context manager (or call ``close``) so the mapping is released.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{self.path} is too short to be a grid snapshot")
+        magic, version, min_row, nrows, ncols, nstrings, ncells = HEADER.unpack_from(self._map, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{self.path} is not a grid snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported grid snapshot version in {self.path}: {version}")
+
+        self.min_row = min_row
+        self.max_row = min_row + nrows - 1
+        self.ncols = ncols
+        self.nstrings = nstrings
+        self.ncells = ncells
+
+        view = memoryview(self._map)
+        self._views = [view]
+        position = HEADER.size
+        arrays = []
+        for count in (nstrings + 1, ncells, ncells, ncells):
+            arrays.append(self._uint32_view(view, position, count))
+            position += count * 4
+        self.offsets, self.cell_rows, self.cell_cols, self.cell_strings = arrays
+        self._blob = view[position:]
+        self._views.append(self._blob)
+        self.columns = [self.string(idx) for idx in range(ncols)]
+
+    def _uint32_view(self, view: memoryview, start: int, count: int):
+        section = view[start : start + count * 4]
+        if NATIVE_LITTLE_ENDIAN:
+            section = section.cast("I")
+            self._views.append(section)
+            return section
+        values = array("I", section.tobytes())
+        values.byteswap()
+        return values
+
+    def string(self, idx: int) -> str:
+        return str(self._blob[self.offsets[idx] : self.offsets[idx + 1]], "utf-8")
+
+    def strings(self) -> List[str]:
+        blob = bytes(self._blob)
+        offsets = self.offsets
+        intern = sys.intern
+        return [intern(blob[offsets[idx] : offsets[idx + 1]].decode("utf-8")) for idx in range(self.nstrings)]
+
+    def iter_rows(self) -> Iterator[Tuple[int, Dict[str, str]]]:
+        """Yield ``(row_num, {col: value})`` in ascending order, like ``iter_first_sheet_rows``."""
+        strings = self.strings()
+        columns = self.columns
+        current_row = None
+        values: Dict[str, str] = {}
+        for row_offset, col_idx, string_id in zip(self.cell_rows, self.cell_cols, self.cell_strings):
+            if row_offset != current_row:
+                if values:
+                    yield self.min_row + current_row, values
+                current_row, values = row_offset, {}
+            values[columns[col_idx]] = strings[string_id]
+        if values:
+            yield self.min_row + current_row, values
+
+    def to_cell_grid(self) -> CellGrid:
+        ncols = self.ncols
+        nrows = self.max_row - self.min_row + 1
+        flat = [""] * (nrows * ncols)
+        detached: Dict[int, List[str]] = {}
+        strings = self.strings()
+        for row_offset, col_idx, string_id in zip(self.cell_rows, self.cell_cols, self.cell_strings):
+            if row_offset < nrows:
+                flat[row_offset * ncols + col_idx] = strings[string_id]
+            else:
+                detached.setdefault(self.min_row + row_offset, [""] * ncols)[col_idx] = strings[string_id]
+        return CellGrid(self.columns, self.min_row, self.max_row, flat, detached)
+
+    def close(self) -> None:
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        self._map.close()
+
+    def __enter__(self) -> "GridSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def read_grid_snapshot(path: Path) -> CellGrid:
+    with GridSnapshot(path) as snapshot:
+        return snapshot.to_cell_grid()
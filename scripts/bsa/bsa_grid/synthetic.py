@@ -0,0 +1,275 @@
+"""
+Synthetic programme-grid workbooks for benchmarking (stdlib zip/XML writers only).
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import io
+import random
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+from xml.sax.saxutils import XMLGenerator
+
+from .grid import COL_END, COL_START
+from .xlsx import NS, iter_cols
+
+MAX_DAYS = 31
+MAX_ROOMS = len(iter_cols(COL_START, COL_END))
+FIRST_DAY_ROW = 140
+
+FIRST_DAY = dt.date(2026, 4, 8)
+
+THEMES = [
+    ("Cities, Mobilities, Place & Space", "CIT"),
+    ("Culture, Media, Sport & Food", "CMSF"),
+    ("Families & Relationships", "FAM"),
+    ("Medicine, Health & Illness", "MED"),
+    ("Race, Ethnicity & Migration", "REM"),
+    ("Science, Technology & Digital Studies", "STDS"),
+    ("Social Divisions / Social Identities", "SDSI"),
+    ("Sociology of Education", "EDU"),
+    ("Theory", "THEO"),
+    ("Work, Employment & Economic Life", "WEEL"),
+    ("Environment & Society", "ENV"),
+    ("Rights, Violence & Crime", "RVC"),
+]
+
+FIRST_NAMES = [
+    "Aisha", "Ben", "Carmen", "Dev", "Elena", "Femi", "Grace", "Hiro", "Ines", "Jonas",
+    "Kemi", "Liam", "Maya", "Nikhil", "Olga", "Pablo", "Qian", "Rosa", "Samir", "Tara",
+]
+LAST_NAMES = [
+    "Adeyemi", "Brennan", "Chowdhury", "Dubois", "Eriksen", "Fischer", "Gupta", "Hughes",
+    "Ivanova", "Jansen", "Kowalski", "Lindqvist", "Moreno", "Nakamura", "O'Brien", "Patel",
+    "Quinn", "Rossi", "Schmidt", "Tanaka",
+]
+PAPER_TITLES = [
+    "Everyday Mobilities After the Pandemic",
+    "Care Work and the Household Economy",
+    "Platform Labour in Regional Cities",
+    "Data Practices in Community Health",
+    "Belonging Across Generations",
+    "Climate Anxiety and Collective Action",
+]
+SLOT_TIMES = [
+    ("09:00", "10:30"),
+    ("11:00", "12:30"),
+    ("13:30", "15:00"),
+    ("15:30", "17:00"),
+    ("17:15", "18:15"),
+]
+
+
+@dataclass
+class SyntheticGridSpec:
+    days: int = 3
+    rooms: int = MAX_ROOMS
+    slots_per_day: int = 5
+    detail_rows: int = 4
+    lines_per_cell: int = 3
+    people: int = 400
+    shared_string_ratio: float = 0.9
+    seed: int = 0
+
+    def validate(self) -> None:
+        if not 1 <= self.days <= MAX_DAYS:
+            raise ValueError(f"days must be between 1 and {MAX_DAYS}")
+        if not 1 <= self.rooms <= MAX_ROOMS:
+            raise ValueError(f"rooms must be between 1 and {MAX_ROOMS} ({COL_START}..{COL_END})")
+        if self.slots_per_day < 1 or self.detail_rows < 0 or self.lines_per_cell < 1:
+            raise ValueError("slots_per_day and lines_per_cell must be >= 1, detail_rows >= 0")
+        if not 0.0 <= self.shared_string_ratio <= 1.0:
+            raise ValueError("shared_string_ratio must be between 0 and 1")
+
+
+def synthetic_people(count: int) -> List[str]:
+    # First/last pairs, then first/middle/last triples once the pairs run out.
+    people: List[str] = []
+    for middle in [""] + FIRST_NAMES:
+        for last in LAST_NAMES:
+            for first in FIRST_NAMES:
+                if len(people) >= max(count, 1):
+                    return people
+                people.append(" ".join(part for part in (first, middle, last) if part))
+    return people
+
+
+def day_label(index: int) -> str:
+    # Consecutive days from FIRST_DAY, weekends included: "Wednesday 8 April 2026".
+    day = FIRST_DAY + dt.timedelta(days=index)
+    return f"{day:%A} {day.day} {day:%B %Y}"
+
+
+def build_synthetic_cells(spec: SyntheticGridSpec) -> Dict[int, Dict[str, str]]:
+    spec.validate()
+    rng = random.Random(spec.seed)
+    rooms = iter_cols(COL_START, COL_END)[: spec.rooms]
+    people = synthetic_people(spec.people)
+    rows: Dict[int, Dict[str, str]] = {}
+
+    def put(row_num: int, col: str, value: str) -> None:
+        rows.setdefault(row_num, {})[col] = value
+
+    # Theme legend (rows 4-7, name/code column pairs).
+    for idx, (name, code) in enumerate(THEMES[:16]):
+        name_col, code_col = [("B", "C"), ("D", "E"), ("F", "G"), ("H", "I")][idx // 4]
+        put(4 + idx % 4, name_col, name)
+        put(4 + idx % 4, code_col, code)
+
+    # Roundtable addendum (rows 125-131).
+    put(125, "B", "Roundtable Presentations 13:30 - 15:00 (Market Place Restaurant)")
+    for offset, col in enumerate(["D", "E", "F", "G"]):
+        put(126, col, f"Table {offset + 1}")
+        put(127, col, rng.choice(THEMES)[1])
+        for row_num in range(128, 132):
+            put(row_num, col, f"{rng.choice(people)}, {rng.choice(PAPER_TITLES)}")
+
+    row_num = FIRST_DAY_ROW
+    for day_index in range(spec.days):
+        put(row_num, "A", day_label(day_index))
+        for idx, col in enumerate(rooms, start=1):
+            put(row_num, col, f"Room {idx:02d}")
+        row_num += 1
+
+        for slot_idx in range(spec.slots_per_day):
+            start, end = SLOT_TIMES[slot_idx % len(SLOT_TIMES)]
+            if slot_idx % 4 == 2:
+                session_block = "Lunch"
+            elif slot_idx % 4 == 3:
+                session_block = "Stream Plenaries"
+            else:
+                session_block = f"Paper Session {slot_idx + 1}"
+            put(row_num, "B", f"{start} - {end} {session_block}")
+
+            for col in rooms:
+                if session_block == "Lunch":
+                    put(row_num, col, "LUNCH")
+                    continue
+                code = rng.choice(THEMES)[1]
+                put(row_num, col, f"{code}{rng.randint(1, 3)}" if rng.random() < 0.7 else code)
+                for detail in range(1, spec.detail_rows + 1):
+                    lines = []
+                    for line_idx in range(spec.lines_per_cell):
+                        if detail == 1 and line_idx == 0:
+                            lines.append(f"Chair: {rng.choice(people)}")
+                        elif line_idx % 2:
+                            lines.append(rng.choice(PAPER_TITLES))
+                        else:
+                            lines.append(f"{rng.choice(people)}, University of {rng.choice(LAST_NAMES)}")
+                    put(row_num + detail, col, "\n".join(lines))
+            row_num += spec.detail_rows + 1
+
+        row_num += 2
+
+    return rows
+
+
+def write_synthetic_workbook(path: Path, spec: SyntheticGridSpec) -> Path:
+    rows = build_synthetic_cells(spec)
+    rng = random.Random(spec.seed + 1)
+    shared: Dict[str, int] = {}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        archive.writestr("_rels/.rels", ROOT_RELS)
+        archive.writestr("xl/workbook.xml", WORKBOOK)
+        archive.writestr("xl/_rels/workbook.xml.rels", WORKBOOK_RELS)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w") as raw:
+            stream = io.TextIOWrapper(raw, encoding="utf-8")
+            xml = XMLGenerator(stream, encoding="utf-8", short_empty_elements=True)
+            xml.startDocument()
+            xml.startElement("worksheet", {"xmlns": NS["m"], "xmlns:r": NS["r"]})
+            xml.startElement("sheetData", {})
+            for row_num in sorted(rows):
+                xml.startElement("row", {"r": str(row_num)})
+                for col in sorted(rows[row_num], key=lambda c: (len(c), c)):
+                    value = rows[row_num][col]
+                    ref = f"{col}{row_num}"
+                    if rng.random() < spec.shared_string_ratio:
+                        idx = shared.setdefault(value, len(shared))
+                        xml.startElement("c", {"r": ref, "t": "s"})
+                        xml.startElement("v", {})
+                        xml.characters(str(idx))
+                        xml.endElement("v")
+                    else:
+                        xml.startElement("c", {"r": ref, "t": "inlineStr"})
+                        xml.startElement("is", {})
+                        xml.startElement("t", {"xml:space": "preserve"})
+                        xml.characters(value)
+                        xml.endElement("t")
+                        xml.endElement("is")
+                    xml.endElement("c")
+                xml.endElement("row")
+            xml.endElement("sheetData")
+            xml.endElement("worksheet")
+            xml.endDocument()
+            stream.flush()
+            stream.detach()
+
+        with archive.open("xl/sharedStrings.xml", "w") as raw:
+            stream = io.TextIOWrapper(raw, encoding="utf-8")
+            xml = XMLGenerator(stream, encoding="utf-8")
+            xml.startDocument()
+            count = str(len(shared))
+            xml.startElement("sst", {"xmlns": NS["m"], "count": count, "uniqueCount": count})
+            for value in shared:
+                xml.startElement("si", {})
+                xml.startElement("t", {"xml:space": "preserve"})
+                xml.characters(value)
+                xml.endElement("t")
+                xml.endElement("si")
+            xml.endElement("sst")
+            xml.endDocument()
+            stream.flush()
+            stream.detach()
+
+    return path
+
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    "</Types>"
+)
+
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+
+WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<workbook xmlns="{NS["m"]}" xmlns:r="{NS["r"]}">'
+    '<sheets><sheet name="Programme grid" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+
+WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+    'Target="sharedStrings.xml"/>'
+    "</Relationships>"
+)
+
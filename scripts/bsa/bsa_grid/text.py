@@ -0,0 +1,99 @@
+"""
+Text normalisation helpers and token sets shared by the BSA generators.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+
+from .profiling import compile_regex
+
+WHITESPACE_RE = compile_regex(r"\s+")
+THEME_KEY_STRIP_RE = compile_regex(r"[^a-z0-9]+")
+APOSTROPHE_RE = compile_regex(r"[\u2018\u2019\u02bc`\u00b4]")
+PERSON_KEY_STRIP_RE = compile_regex(r"[^\w' -]+")
+
+# Tokens that rule a line out as a person's name. Each generator extends this
+# with the extra words its own heuristics need.
+NON_NAME_TOKENS = frozenset(
+    {
+        "ROUND",
+        "TABLE",
+        "PRESENTATION",
+        "PRESENTATIONS",
+        "PAPER",
+        "SESSION",
+        "SPECIAL",
+        "EVENT",
+        "STREAM",
+        "PLENARY",
+        "PLENARIES",
+        "PRESIDENTIAL",
+        "ADDRESS",
+        "REGISTRATION",
+        "REFRESHMENTS",
+        "LUNCH",
+        "RECEPTION",
+        "PUBLISHERS",
+        "FORUM",
+        "SOCIOLOGY",
+        "JOURNAL",
+        "SOCIAL",
+        "ENVIRONMENT",
+        "SOCIETY",
+        "FAMILIES",
+        "RELATIONSHIPS",
+        "RACE",
+        "ETHNICITY",
+        "MIGRATION",
+        "SCIENCE",
+        "TECHNOLOGY",
+        "DIGITAL",
+        "STUDIES",
+        "THEORY",
+        "CULTURE",
+        "MEDIA",
+        "SPORT",
+        "FOOD",
+        "WORK",
+        "EMPLOYMENT",
+        "ECONOMIC",
+        "LIFE",
+        "RIGHTS",
+        "VIOLENCE",
+        "CRIME",
+        "METHODOLOGICAL",
+        "INNOVATIONS",
+        "CITIES",
+        "MOBILITIES",
+        "PLACE",
+        "SPACE",
+        "EMERGING",
+        "THEMES",
+        "MEDICINE",
+        "HEALTH",
+        "ILLNESS",
+        "DIVISIONS",
+        "IDENTITIES",
+    }
+)
+
+
+def normalize_space(text: str) -> str:
+    return WHITESPACE_RE.sub(" ", text.replace("\r", " ").replace("\n", " ")).strip()
+
+
+def normalize_theme_key(text: str) -> str:
+    base = normalize_space(text).lower()
+    base = base.replace("&", " and ")
+    base = THEME_KEY_STRIP_RE.sub(" ", base)
+    return WHITESPACE_RE.sub(" ", base).strip()
+
+
+def normalize_person_key(text: str) -> str:
+    # Case-, accent- and apostrophe-insensitive search key for a person's name.
+    base = unicodedata.normalize("NFKD", normalize_space(text))
+    base = "".join(char for char in base if not unicodedata.combining(char))
+    base = APOSTROPHE_RE.sub("'", base).casefold()
+    base = PERSON_KEY_STRIP_RE.sub(" ", base)
+    return WHITESPACE_RE.sub(" ", base).strip()
@@ -0,0 +1,96 @@
+"""
+Polling file watcher with debounce for the generator --watch modes (stdlib only).
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 1.0
+
+Signature = Optional[Tuple[int, int]]
+
+
+def add_watch_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and rebuild whenever the input workbook is saved",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Seconds between input checks in --watch mode (default {DEFAULT_POLL_INTERVAL})",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f"Seconds the input must stay unchanged before a rebuild (default {DEFAULT_DEBOUNCE})",
+    )
+
+
+def file_signature(path: Path) -> Signature:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def snapshot_signatures(paths: Sequence[Path]) -> Dict[Path, Signature]:
+    return {path: file_signature(path) for path in paths}
+
+
+def wait_for_change(
+    paths: Sequence[Path],
+    previous: Dict[Path, Signature],
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+) -> Dict[Path, Signature]:
+    """Block until a watched file changes and then stays unchanged for ``debounce`` seconds.
+
+    Spreadsheet apps often write a workbook in several steps (temp file, rename,
+    metadata touch), so a burst of saves collapses into one rebuild.
+    """
+    current = previous
+    while current == previous:
+        time.sleep(poll_interval)
+        current = snapshot_signatures(paths)
+
+    settled_at = time.monotonic()
+    while time.monotonic() - settled_at < debounce:
+        time.sleep(min(poll_interval, debounce))
+        latest = snapshot_signatures(paths)
+        if latest != current:
+            current, settled_at = latest, time.monotonic()
+    return current
+
+
+def watch(
+    paths: Sequence[Path],
+    rebuild: Callable[[], object],
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    debounce: float = DEFAULT_DEBOUNCE,
+) -> int:
+    """Run ``rebuild`` now and after every settled change to ``paths`` until interrupted."""
+    signatures = snapshot_signatures(paths)
+    watched = ", ".join(str(path) for path in paths)
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                rebuild()
+            except Exception:
+                # A half-written workbook should not end the session; wait for the next save.
+                traceback.print_exc()
+            print(f"Rebuilt in {time.perf_counter() - started:.3f}s; watching {watched} (Ctrl-C to stop)", flush=True)
+            signatures = wait_for_change(paths, signatures, poll_interval, debounce)
+    except KeyboardInterrupt:
+        return 0
@@ -0,0 +1,255 @@
+"""
+Minimal XLSX reading helpers for the programme grid (stdlib only).
+"""
+
+from __future__ import annotations
+
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from string import digits as DIGITS
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from .profiling import TimedReader, compile_regex, span
+
+NS = {
+    "m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+}
+
+CELL_REF_RE = compile_regex(r"([A-Z]+)(\d+)$")
+
+SST_ROOT_RE = compile_regex(rb"<((?:[\w.-]+:)?sst)\b[^>]*>")
+SST_ITEM_RE = compile_regex(rb"<((?:[\w.-]+:)?si)\b[^>]*?(?:/>|>.*?</\1>)", re.S)
+# Items with "\r" fall back to ElementTree, which normalises line endings to "\n".
+SST_PLAIN_RE = compile_regex(rb"<si>\s*<t(?: xml:space=\"preserve\")?>([^<&\r]*)</t>\s*</si>$")
+
+SHEET_DATA_TAG = f"{{{NS['m']}}}sheetData"
+ROW_TAG = f"{{{NS['m']}}}row"
+
+Rows = Dict[int, Dict[str, str]]
+
+
+def col_to_num(col: str) -> int:
+    total = 0
+    for ch in col:
+        total = total * 26 + (ord(ch) - 64)
+    return total
+
+
+def num_to_col(value: int) -> str:
+    out = ""
+    n = value
+    while n > 0:
+        n, rem = divmod(n - 1, 26)
+        out = chr(65 + rem) + out
+    return out
+
+
+def iter_cols(start: str, end: str) -> List[str]:
+    return [num_to_col(i) for i in range(col_to_num(start), col_to_num(end) + 1)]
+
+
+class SharedStringTable:
+    """Shared-string pool that decodes entries on first use.
+
+    A single regex pass records the byte span of every ``si`` item; plain
+    ``<si><t>..</t></si>`` entries are decoded straight from those bytes and
+    anything richer (runs, phonetics, entities) goes through ElementTree with
+    the result kept in a bounded LRU.
+    """
+
+    def __init__(self, data: bytes = b"", cache_size: int = 4096) -> None:
+        self._data = data
+        self._starts = array("q")
+        self._ends = array("q")
+        self._cache: "OrderedDict[int, str]" = OrderedDict()
+        self._cache_size = cache_size
+        self._wrap_open = b""
+        self._wrap_close = b""
+
+        root = SST_ROOT_RE.search(data)
+        if not root:
+            return
+        # Re-use the root tag so snippets keep their namespace declarations.
+        self._wrap_open = root.group(0)
+        self._wrap_close = b"</" + root.group(1) + b">"
+        for match in SST_ITEM_RE.finditer(data, root.end()):
+            self._starts.append(match.start())
+            self._ends.append(match.end())
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, idx: int) -> str:
+        if idx < 0:
+            idx += len(self._starts)
+        if not 0 <= idx < len(self._starts):
+            raise IndexError("shared string index out of range")
+
+        snippet = self._data[self._starts[idx] : self._ends[idx]]
+        plain = SST_PLAIN_RE.match(snippet)
+        if plain:
+            return plain.group(1).decode("utf-8")
+
+        cached = self._cache.get(idx)
+        if cached is not None:
+            self._cache.move_to_end(idx)
+            return cached
+
+        sst = ET.fromstring(self._wrap_open + snippet + self._wrap_close)
+        value = "".join((t.text or "") for t in sst.findall(".//m:t", NS))
+        self._cache[idx] = value
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return value
+
+
+def parse_shared_strings(archive: zipfile.ZipFile) -> SharedStringTable:
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return SharedStringTable()
+
+    with span("unzip"):
+        data = archive.read("xl/sharedStrings.xml")
+    return SharedStringTable(data)
+
+
+def list_sheets(archive: zipfile.ZipFile) -> List[Tuple[str, str]]:
+    """``(sheet name, archive member)`` for every worksheet, in workbook order."""
+    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
+    sheets = workbook.find("m:sheets", NS)
+
+    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    rel_map = {item.attrib["Id"]: item.attrib["Target"] for item in rels}
+
+    result: List[Tuple[str, str]] = []
+    for sheet in sheets:
+        target = rel_map[sheet.attrib[f"{{{NS['r']}}}id"]]
+        if not target.startswith("xl/"):
+            target = "xl/" + target
+        result.append((sheet.attrib.get("name", ""), target.replace("xl/xl/", "xl/")))
+    return result
+
+
+def resolve_sheet_target(archive: zipfile.ZipFile, sheet: Optional[str] = None) -> str:
+    """Archive member for ``sheet``: a sheet name, a 1-based position, or None for the first."""
+    sheets = list_sheets(archive)
+    if sheet is None:
+        return sheets[0][1]
+    for name, target in sheets:
+        if name.casefold() == sheet.casefold():
+            return target
+    if sheet.isdigit() and 1 <= int(sheet) <= len(sheets):
+        return sheets[int(sheet) - 1][1]
+    names = ", ".join(name for name, _target in sheets)
+    raise KeyError(f"No worksheet {sheet!r} (have: {names})")
+
+
+def resolve_first_sheet_target(archive: zipfile.ZipFile) -> str:
+    return resolve_sheet_target(archive)
+
+
+@dataclass(frozen=True)
+class CellWindow:
+    """Projection applied while reading a sheet.
+
+    ``columns`` is a set of column letters and ``row_ranges`` a sequence of
+    inclusive ``(first, last)`` row numbers; ``None`` keeps everything.
+    """
+
+    columns: Optional[FrozenSet[str]] = None
+    row_ranges: Optional[Tuple[Tuple[int, int], ...]] = None
+
+    def wants_row(self, row_num: int) -> bool:
+        if self.row_ranges is None:
+            return True
+        return any(first <= row_num <= last for first, last in self.row_ranges)
+
+    def last_row(self) -> Optional[int]:
+        if self.row_ranges is None:
+            return None
+        return max((last for _first, last in self.row_ranges), default=0)
+
+
+def iter_sheet_rows(
+    xlsx_path: Path,
+    window: Optional[CellWindow] = None,
+    sheet: Optional[str] = None,
+) -> Iterator[Tuple[int, Dict[str, str]]]:
+    # Parse the sheet incrementally from the zip member stream and clear each
+    # row once read, so memory stays flat regardless of sheet size.
+    window = window or CellWindow()
+    columns = window.columns
+    last_row = window.last_row()
+
+    with zipfile.ZipFile(xlsx_path) as archive:
+        shared = parse_shared_strings(archive)
+        sheet_target = resolve_sheet_target(archive, sheet)
+
+        with archive.open(sheet_target) as member:
+            # Reads from the member are where decompression happens.
+            stream = TimedReader(member)
+            sheet_data: Optional[ET.Element] = None
+
+            for event, elem in ET.iterparse(stream, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == SHEET_DATA_TAG:
+                        sheet_data = elem
+                    continue
+                if elem.tag != ROW_TAG:
+                    continue
+
+                row_num = int(elem.attrib["r"])
+                if last_row is not None and row_num > last_row:
+                    # Rows are stored in ascending order, nothing further is wanted.
+                    break
+
+                row_values: Dict[str, str] = {}
+
+                if window.wants_row(row_num):
+                    for cell in elem.iterfind("m:c", NS):
+                        ref = cell.attrib["r"]
+                        if columns is not None and ref.rstrip(DIGITS) not in columns:
+                            continue
+                        match = CELL_REF_RE.match(ref)
+                        if not match:
+                            continue
+                        col = match.group(1)
+                        ctype = cell.attrib.get("t")
+                        v = cell.find("m:v", NS)
+                        is_node = cell.find("m:is", NS)
+
+                        value = ""
+                        if ctype == "s" and v is not None:
+                            idx = int(v.text)
+                            value = shared[idx] if idx < len(shared) else ""
+                        elif ctype == "inlineStr" and is_node is not None:
+                            value = "".join((t.text or "") for t in is_node.findall(".//m:t", NS))
+                        elif v is not None:
+                            value = v.text or ""
+
+                        if value.strip():
+                            row_values[col] = value.strip()
+
+                # Drop the parsed row (and its slot in sheetData) before moving on.
+                elem.clear()
+                if sheet_data is not None:
+                    sheet_data.clear()
+
+                if row_values:
+                    yield row_num, row_values
+
+
+def iter_first_sheet_rows(
+    xlsx_path: Path,
+    window: Optional[CellWindow] = None,
+) -> Iterator[Tuple[int, Dict[str, str]]]:
+    return iter_sheet_rows(xlsx_path, window)
+
+
+def read_first_sheet_cells(xlsx_path: Path, window: Optional[CellWindow] = None) -> Rows:
+    return dict(iter_first_sheet_rows(xlsx_path, window))
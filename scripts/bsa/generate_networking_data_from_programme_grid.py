@@ -6,32 +6,67 @@ Output JSON structure:
 {
   timezone: "Europe/London",
   topics: [
-    { id, label, kind, code?, people: [..], count }
+    { id, label, kind, code?, person_ids: [..], count }
   ],
-  total_people
+  total_people,
+  people: [name, ..],          // person id = position
+  person_keys: [key, ..],      // normalized search key per person id
+  person_topics: [[..], ..],   // topic positions per person id
+  person_aliases: {id: [..]}   // other spellings merged into a person
 }
+
+Spelling variants of one person (curly vs straight apostrophes, accents,
+middle or first initials) are merged by bsa_grid.identity before ids are
+assigned.
+
+With --shard-dir the same data is also written for lazy loading: a
+manifest.json (topic metadata, each topic's shard file, the people shard)
+plus content-hashed topics-*.json shards holding each topic's names, one
+topic per shard or fixed-size chunks of topics.
+
+--copresence also writes a co-presence graph: for every person id, the
+top-k people they share a session with (same day, time slot and room, or
+the same roundtable), ranked by shared sessions plus shared topics, as
+parallel adjacency lists
+{neighbours: [[id, ..], ..], scores: [[n, ..], ..]} using the same ids.
+
+--json-profile picks the encoding of the main output: pretty (above),
+minified, or columnar (topic fields as parallel arrays and every string in
+one shared table; see columnar_payload). --compress adds .gz/.br siblings
+and --report-sizes prints the byte size of each profile. Columnar output and
+compressed siblings are only useful as served files, so both need an
+--output under public/.
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
-import json
 import re
-import zipfile
-import xml.etree.ElementTree as ET
-from collections import Counter, defaultdict
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-
-NS = {
-    "m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
-    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
-}
-
-COL_START = "C"
-COL_END = "Y"
-TIME_RANGE_RE = re.compile(r"^\s*(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})(.*)$", re.S)
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from bsa_grid import (
+    NON_NAME_TOKENS,
+    ProgrammeGrid,
+    SlotCell,
+    normalize_person_key,
+    normalize_space,
+    parse_theme_and_track,
+    run_sinks,
+)
+from bsa_grid.cache import DEFAULT_CACHE_DIR, BuildCache, derived_cache_key, grid_cache_key
+from bsa_grid.cli import positive_int
+from bsa_grid.encoding import CODECS, available_codecs, encode_json, print_size_report, sibling_path, size_report, write_encoded
+from bsa_grid.graph import top_neighbours
+from bsa_grid.identity import alias_map, resolve_identities
+from bsa_grid.layout import add_layout_arguments, layout_to_dict, load_layout_option, write_layout_profile
+from bsa_grid.names import DEFAULT_CACHE_SIZE, NameClassifier, cache_counters, print_cache_stats
+from bsa_grid.profiling import add_profile_arguments, compile_regex, run_profiled, span
+from bsa_grid.shards import MANIFEST_NAME, prune_shards, write_manifest, write_shard
+from bsa_grid.watch import add_watch_arguments, watch
 
 TOPIC_LABEL_OVERRIDES = {
     "BSA SPECIAL ACTIVITY": "BSA Special Activity",
@@ -41,65 +76,29 @@ TOPIC_LABEL_OVERRIDES = {
     "SPECIAL EVENT": "Special Event",
 }
 
-NON_NAME_TOKENS = {
-    "ROUND",
-    "TABLE",
-    "PRESENTATION",
-    "PRESENTATIONS",
-    "PAPER",
-    "SESSION",
-    "SPECIAL",
-    "EVENT",
-    "STREAM",
-    "PLENARY",
-    "PLENARIES",
-    "PRESIDENTIAL",
-    "ADDRESS",
-    "REGISTRATION",
-    "REFRESHMENTS",
-    "LUNCH",
-    "RECEPTION",
-    "PUBLISHERS",
-    "FORUM",
-    "SOCIOLOGY",
-    "JOURNAL",
-    "SOCIAL",
-    "ENVIRONMENT",
-    "SOCIETY",
-    "FAMILIES",
-    "RELATIONSHIPS",
-    "RACE",
-    "ETHNICITY",
-    "MIGRATION",
-    "SCIENCE",
-    "TECHNOLOGY",
-    "DIGITAL",
-    "STUDIES",
-    "THEORY",
-    "CULTURE",
-    "MEDIA",
-    "SPORT",
-    "FOOD",
-    "WORK",
-    "EMPLOYMENT",
-    "ECONOMIC",
-    "LIFE",
-    "RIGHTS",
-    "VIOLENCE",
-    "CRIME",
-    "METHODOLOGICAL",
-    "INNOVATIONS",
-    "CITIES",
-    "MOBILITIES",
-    "PLACE",
-    "SPACE",
-    "EMERGING",
-    "THEMES",
-    "MEDICINE",
-    "HEALTH",
-    "ILLNESS",
-    "DIVISIONS",
-    "IDENTITIES",
+DEFAULT_INPUT = Path("/Users/abodid/Downloads/Programme grid 2026 v4 - view only.xlsx")
+DEFAULT_OUTPUT = Path("src/data/bsa-networking.json")
+DEFAULT_SHARD_DIR = Path("public/data/bsa-networking")
+# Files under public/ are served as-is; anything else (src/data) is bundled by
+# the networking page, which only reads the pretty/minified shape.
+SERVED_DIR_NAME = "public"
+SHARD_MODES = ("topic", "chunk")
+DEFAULT_CHUNK_SIZE = 8
+TOPIC_SHARD_PREFIX = "topics"
+PEOPLE_SHARD_PREFIX = "people"
+JSON_PROFILES = ("pretty", "minified", "columnar")
+COLUMNAR_VERSION = 1
+META_KEYS = ("timezone", "location", "generated_from", "generated_at", "topic_count", "total_people")
+TOPIC_STRING_COLUMNS = ("id", "label", "kind", "code")
+DEFAULT_COPRESENCE_OUTPUT = Path("public/data/bsa-networking-copresence.json")
+DEFAULT_TOP_K = 10
+COPRESENCE_VERSION = 1
+# Being listed in the same session counts for more than sharing a topic.
+COPRESENCE_WEIGHTS = {"topic": 1, "session": 2}
+
+GENERATED_FROM = "Programme grid 2026 v4 - view only.xlsx (first worksheet)"
+
+PEOPLE_NON_NAME_TOKENS = NON_NAME_TOKENS | {
     "MONOGRAPH",
     "PUBLISHING",
     "PANEL",
@@ -111,297 +110,101 @@ NON_NAME_TOKENS = {
     "INTERNATIONAL",
     "UNIVERSITY",
 }
+# Curly apostrophes and initials' dots are allowed so spelling variants of a
+# person reach identity resolution instead of being dropped.
+PEOPLE_NAME_CHARS = "\u2018\u2019"
+PEOPLE_CLASSIFIER = NameClassifier(
+    PEOPLE_NON_NAME_TOKENS,
+    extra_name_chars=PEOPLE_NAME_CHARS,
+    dotted_initials=True,
+)
+SPECIAL_EVENT_PREFIX_RE = compile_regex(r"^SPECIAL EVENT\*?\s*(.*)$", re.I)
 
+# (id, label, kind, theme code)
+Topic = Tuple[str, str, str, Optional[str]]
 
-def col_to_num(col: str) -> int:
-    total = 0
-    for ch in col:
-        total = total * 26 + (ord(ch) - 64)
-    return total
-
-
-def num_to_col(value: int) -> str:
-    out = ""
-    n = value
-    while n > 0:
-        n, rem = divmod(n - 1, 26)
-        out = chr(65 + rem) + out
-    return out
-
-
-def iter_cols(start: str, end: str) -> List[str]:
-    return [num_to_col(i) for i in range(col_to_num(start), col_to_num(end) + 1)]
-
-
-def normalize_space(text: str) -> str:
-    return re.sub(r"\s+", " ", text.replace("\r", " ").replace("\n", " ")).strip()
-
-
-def normalize_theme_key(text: str) -> str:
-    base = normalize_space(text).lower()
-    base = base.replace("&", " and ")
-    base = re.sub(r"[^a-z0-9]+", " ", base)
-    return re.sub(r"\s+", " ", base).strip()
-
-
-def parse_shared_strings(archive: zipfile.ZipFile) -> List[str]:
-    if "xl/sharedStrings.xml" not in archive.namelist():
-        return []
-
-    sst = ET.fromstring(archive.read("xl/sharedStrings.xml"))
-    values: List[str] = []
-    for si in sst.findall("m:si", NS):
-        values.append("".join((t.text or "") for t in si.findall(".//m:t", NS)))
-    return values
-
-
-def resolve_first_sheet_target(archive: zipfile.ZipFile) -> str:
-    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
-    sheets = workbook.find("m:sheets", NS)
-    first_sheet = list(sheets)[0]
-    rel_id = first_sheet.attrib[f"{{{NS['r']}}}id"]
-
-    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
-    rel_map = {item.attrib["Id"]: item.attrib["Target"] for item in rels}
-
-    target = rel_map[rel_id]
-    if not target.startswith("xl/"):
-        target = "xl/" + target
-    return target.replace("xl/xl/", "xl/")
-
-
-def read_first_sheet_cells(xlsx_path: Path) -> Dict[int, Dict[str, str]]:
-    with zipfile.ZipFile(xlsx_path) as archive:
-        shared = parse_shared_strings(archive)
-        sheet_target = resolve_first_sheet_target(archive)
-        sheet = ET.fromstring(archive.read(sheet_target))
-
-    data: Dict[int, Dict[str, str]] = {}
-    sheet_data = sheet.find("m:sheetData", NS)
-
-    for row in sheet_data.findall("m:row", NS):
-        row_num = int(row.attrib["r"])
-        row_values: Dict[str, str] = {}
-
-        for cell in row.findall("m:c", NS):
-            ref = cell.attrib["r"]
-            match = re.match(r"([A-Z]+)(\d+)$", ref)
-            if not match:
-                continue
-            col = match.group(1)
-            ctype = cell.attrib.get("t")
-            v = cell.find("m:v", NS)
-            is_node = cell.find("m:is", NS)
-
-            value = ""
-            if ctype == "s" and v is not None:
-                idx = int(v.text)
-                value = shared[idx] if idx < len(shared) else ""
-            elif ctype == "inlineStr" and is_node is not None:
-                value = "".join((t.text or "") for t in is_node.findall(".//m:t", NS))
-            elif v is not None:
-                value = v.text or ""
-
-            if value.strip():
-                row_values[col] = value.strip()
-
-        if row_values:
-            data[row_num] = row_values
-
-    return data
-
-
-def parse_day_from_label(label: str) -> dt.date:
-    match = re.search(
-        r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})",
-        label,
-        flags=re.I,
-    )
-    if not match:
-        raise ValueError(f"Could not parse day label: {label}")
-
-    day = int(match.group(2))
-    month_name = match.group(3)
-    year = int(match.group(4))
-
-    month = dt.datetime.strptime(month_name[:3], "%b").month
-    return dt.date(year, month, day)
-
-
-def build_day_sections(rows: Dict[int, Dict[str, str]]) -> List[Tuple[int, int, dt.date]]:
-    candidates: List[Tuple[int, dt.date]] = []
-
-    for row_num in sorted(rows):
-        label = rows[row_num].get("A", "")
-        if re.search(r"\bApril\b\s+\d{4}", label, flags=re.I):
-            if re.search(r"\b(Wednesday|Thursday|Friday)\b", label, flags=re.I):
-                candidates.append((row_num, parse_day_from_label(label)))
 
-    sections: List[Tuple[int, int, dt.date]] = []
-    max_row = max(rows)
-
-    for idx, (row_start, day_date) in enumerate(candidates):
-        next_start = candidates[idx + 1][0] if idx + 1 < len(candidates) else max_row + 1
-        sections.append((row_start, next_start - 1, day_date))
-
-    return sections
+def looks_like_person_name(text: str) -> bool:
+    return PEOPLE_CLASSIFIER.looks_like_person_name(text)
 
 
-def extract_time_block(cell_value: str) -> Optional[Tuple[str, str, Optional[str]]]:
-    match = TIME_RANGE_RE.match(cell_value or "")
-    if not match:
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def name_from_line(line: str) -> Optional[str]:
+    # ``line`` is already whitespace-normalised; None means no person on it.
+    lower = line.lower()
+    if lower.startswith("chair:"):
         return None
 
-    start_time = match.group(1)
-    end_time = match.group(2)
-    remainder = normalize_space(match.group(3) or "")
-    session_block = remainder or None
-    return start_time, end_time, session_block
-
-
-def build_theme_maps(rows: Dict[int, Dict[str, str]]) -> Tuple[Dict[str, str], Dict[str, str]]:
-    code_to_name: Dict[str, str] = {}
-    name_to_code: Dict[str, str] = {}
-
-    for row_num in [4, 5, 6, 7]:
-        row = rows.get(row_num, {})
-        for name_col, code_col in [("B", "C"), ("D", "E"), ("F", "G"), ("H", "I")]:
-            name = normalize_space(row.get(name_col, ""))
-            code = normalize_space(row.get(code_col, "")).upper()
-            if not name or not code:
-                continue
-            if not re.fullmatch(r"[A-Z]{2,6}", code):
-                continue
-            code_to_name[code] = name
-            name_to_code[normalize_theme_key(name)] = code
-
-    return code_to_name, name_to_code
-
-
-def parse_theme(text: str, name_to_code: Dict[str, str]) -> Tuple[Optional[str], Optional[int]]:
-    value = normalize_space(text)
-    if not value:
-        return None, None
-
-    upper = value.upper()
-    known_codes = set(name_to_code.values())
-
-    if re.fullmatch(r"[A-Z]{2,6}\d{0,2}", upper):
-        if not (upper in known_codes or re.search(r"\d", upper) or len(upper) <= 4):
-            return None, None
-        match = re.match(r"^([A-Z]+)(\d+)?$", upper)
-        if match:
-            code = match.group(1)
-            track = int(match.group(2)) if match.group(2) else None
-            return code, track
-
-    code = name_to_code.get(normalize_theme_key(value))
-    if code:
-        return code, None
-
-    return None, None
-
-
-def build_column_theme_hints(
-    rows: Dict[int, Dict[str, str]],
-    day_sections: List[Tuple[int, int, dt.date]],
-    name_to_code: Dict[str, str],
-) -> Dict[str, str]:
-    counters: Dict[str, Counter] = defaultdict(Counter)
-    columns = iter_cols(COL_START, COL_END)
-
-    for day_start, day_end, _day in day_sections:
-        slot_rows = [
-            r
-            for r in range(day_start, day_end + 1)
-            if r in rows and rows[r].get("B") and TIME_RANGE_RE.match(rows[r]["B"])
-        ]
-
-        for slot_row in slot_rows:
-            slot = extract_time_block(rows[slot_row]["B"])
-            if not slot:
-                continue
-            _start, _end, session_block = slot
-            if not session_block or "paper session" not in session_block.lower():
-                continue
+    special_match = SPECIAL_EVENT_PREFIX_RE.match(line)
+    if special_match:
+        remainder = normalize_space(special_match.group(1))
+        if remainder:
+            line = remainder
+        else:
+            return None
+
+    if "," in line:
+        candidate = normalize_space(line.split(",", 1)[0])
+        if looks_like_person_name(candidate):
+            return candidate
+
+    if looks_like_person_name(line):
+        return line
+    return None
 
-            for col in columns:
-                base_value = rows.get(slot_row, {}).get(col)
-                if not base_value:
-                    continue
-                code, _track = parse_theme(base_value, name_to_code)
-                if code:
-                    counters[col][code] += 1
 
-    hints: Dict[str, str] = {}
-    for col, counter in counters.items():
-        hints[col] = counter.most_common(1)[0][0]
-    return hints
+def split_cell_lines(value: str) -> List[str]:
+    lines = [normalize_space(line) for line in value.replace("\r", "").split("\n")]
+    return [line for line in lines if line]
 
 
-def looks_like_person_name(text: str) -> bool:
-    cleaned = normalize_space(text)
-    if not cleaned:
-        return False
+def extract_names_from_cells(values: Sequence[str]) -> List[List[str]]:
+    """Names per cell for a whole block of cells.
 
-    if re.search(r"[^A-Za-z'\-\s]", cleaned):
-        return False
+    Cells are split once per distinct value and each distinct line is
+    classified once, so the work scales with unique lines rather than with
+    every repeated chair or presenter line in the block.
+    """
+    cell_lines: Dict[str, List[str]] = {}
+    line_names: Dict[str, Optional[str]] = {}
 
-    tokens = re.findall(r"[A-Za-z][A-Za-z'\-]*", cleaned)
-    if not (2 <= len(tokens) <= 5):
-        return False
+    for value in values:
+        if not value or value in cell_lines:
+            continue
+        lines = split_cell_lines(value)
+        cell_lines[value] = lines
+        for line in lines:
+            line_names.setdefault(line, None)
 
-    if any(token.upper() in NON_NAME_TOKENS for token in tokens):
-        return False
+    for line in line_names:
+        line_names[line] = name_from_line(line)
 
-    if not all(token[0].isupper() for token in tokens):
-        return False
+    names_by_value: Dict[str, List[str]] = {}
+    for value, lines in cell_lines.items():
+        # stable dedupe while preserving appearance order
+        deduped: List[str] = []
+        for line in lines:
+            name = line_names[line]
+            if name and name not in deduped:
+                deduped.append(name)
+        names_by_value[value] = deduped
 
-    return True
+    return [list(names_by_value.get(value, ())) for value in values]
 
 
 def extract_names_from_cell(value: str) -> List[str]:
-    out: List[str] = []
-    if not value:
-        return out
+    return extract_names_from_cells([value])[0]
 
-    lines = [line.strip() for line in value.replace("\r", "").split("\n")]
 
-    for raw_line in lines:
-        line = normalize_space(raw_line)
-        if not line:
-            continue
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    stats = PEOPLE_CLASSIFIER.cache_stats()
+    stats["name_from_line"] = cache_counters(name_from_line)
+    return stats
 
-        lower = line.lower()
-        if lower.startswith("chair:"):
-            continue
 
-        special_match = re.match(r"^SPECIAL EVENT\*?\s*(.*)$", line, flags=re.I)
-        if special_match:
-            remainder = normalize_space(special_match.group(1))
-            if remainder:
-                line = remainder
-            else:
-                continue
-
-        if "," in line:
-            candidate = normalize_space(line.split(",", 1)[0])
-            if looks_like_person_name(candidate):
-                out.append(candidate)
-                continue
-
-        if looks_like_person_name(line):
-            out.append(line)
-
-    # stable dedupe while preserving appearance order
-    seen = set()
-    deduped = []
-    for name in out:
-        if name in seen:
-            continue
-        seen.add(name)
-        deduped.append(name)
-    return deduped
+def cache_clear() -> None:
+    PEOPLE_CLASSIFIER.cache_clear()
+    name_from_line.cache_clear()
 
 
 def normalize_topic_label(raw: str) -> str:
@@ -418,14 +221,14 @@ def topic_from_slot(
     name_to_code: Dict[str, str],
     code_to_name: Dict[str, str],
     column_theme_hint: Optional[str],
-) -> Optional[Tuple[str, str, str, Optional[str]]]:
+) -> Optional[Topic]:
     base = normalize_space(base_value)
     if not base:
         return None
     if base.lower() == "leave empty":
         return None
 
-    theme_code, _track = parse_theme(base, name_to_code)
+    theme_code, _track = parse_theme_and_track(base, name_to_code)
     if theme_code:
         label = code_to_name.get(theme_code, theme_code)
         return (f"theme:{theme_code}", label, "theme", theme_code)
@@ -458,7 +261,7 @@ def topic_from_slot(
     return None
 
 
-def add_name(topic_map: Dict[str, Dict[str, object]], topic: Tuple[str, str, str, Optional[str]], name: str) -> None:
+def add_name(topic_map: Dict[str, Dict[str, object]], topic: Topic, name: str) -> None:
     topic_id, label, kind, code = topic
     if topic_id not in topic_map:
         topic_map[topic_id] = {
@@ -471,147 +274,622 @@ def add_name(topic_map: Dict[str, Dict[str, object]], topic: Tuple[str, str, str
     topic_map[topic_id]["people_set"].add(name)
 
 
-def generate_networking_data(rows: Dict[int, Dict[str, str]]) -> Dict[str, object]:
-    code_to_name, name_to_code = build_theme_maps(rows)
-    day_sections = build_day_sections(rows)
-    columns = iter_cols(COL_START, COL_END)
-    column_theme_hints = build_column_theme_hints(rows, day_sections, name_to_code)
+def iter_roundtable_cells(grid: ProgrammeGrid) -> Iterator[Tuple[Topic, str, str]]:
+    # Dedicated roundtable table (the addendum below the legend): (topic, table column, cell).
+    cells = grid.cells
+    code_to_name, name_to_code = grid.code_to_name, grid.name_to_code
+    table = grid.layout.roundtable
+    if table is None or not (cells.has_row(table.header_row) and cells.has_row(table.code_row)):
+        return
 
-    topic_map: Dict[str, Dict[str, object]] = {}
-
-    for day_start, day_end, _day in day_sections:
-        slot_rows = [
-            r
-            for r in range(day_start, day_end + 1)
-            if r in rows and rows[r].get("B") and TIME_RANGE_RE.match(rows[r]["B"])
-        ]
+    for col in table.columns:
+        table_name = normalize_space(cells.get(table.header_row, col))
+        stream_code = normalize_space(cells.get(table.code_row, col)).upper()
+        if not table_name or not stream_code:
+            continue
 
-        for idx, slot_row in enumerate(slot_rows):
-            next_slot = slot_rows[idx + 1] if idx + 1 < len(slot_rows) else day_end + 1
-            slot = extract_time_block(rows[slot_row]["B"])
-            if not slot:
-                continue
-            _start, _end, session_block = slot
-
-            for col in columns:
-                base_value = rows.get(slot_row, {}).get(col)
-                if not base_value:
-                    continue
-
-                topic = topic_from_slot(
-                    base_value,
-                    session_block,
-                    name_to_code,
-                    code_to_name,
-                    column_theme_hints.get(col),
-                )
-                if not topic:
-                    continue
-
-                names: List[str] = []
-                names.extend(extract_names_from_cell(base_value))
-                for detail_row in range(slot_row + 1, next_slot):
-                    detail_value = rows.get(detail_row, {}).get(col)
-                    if detail_value:
-                        names.extend(extract_names_from_cell(detail_value))
-
-                for name in names:
-                    add_name(topic_map, topic, name)
-
-    # Add dedicated roundtable table (rows 125-132).
-    row126 = rows.get(126, {})
-    row127 = rows.get(127, {})
-    if row126 and row127:
-        for col in ["D", "E", "F", "G"]:
-            table_name = normalize_space(row126.get(col, ""))
-            stream_code = normalize_space(row127.get(col, "")).upper()
-            if not table_name or not stream_code:
+        theme_code, _track = parse_theme_and_track(stream_code, name_to_code)
+        if theme_code:
+            topic = (
+                f"theme:{theme_code}",
+                code_to_name.get(theme_code, theme_code),
+                "theme",
+                theme_code,
+            )
+        else:
+            topic = (
+                "session:roundtable-presentations",
+                "Roundtable Presentations",
+                "session",
+                None,
+            )
+
+        for row_num in table.people_row_range():
+            cell_value = cells.get(row_num, col)
+            if cell_value:
+                yield topic, col, cell_value
+
+
+class TopicSink:
+    """Collects topic/people membership from slot cells during a grid walk."""
+
+    def __init__(self, grid: ProgrammeGrid) -> None:
+        self.grid = grid
+        self.topic_map: Dict[str, Dict[str, object]] = {}
+        # Cells whose names are extracted in one batch when the walk finishes.
+        self.pending: List[Tuple[Topic, str]] = []
+
+    def add_slot_cell(self, cell: SlotCell) -> None:
+        grid = self.grid
+        topic = topic_from_slot(
+            cell.base_value,
+            cell.session_block,
+            grid.name_to_code,
+            grid.code_to_name,
+            grid.column_theme_hints.get(cell.col),
+        )
+        if not topic:
+            return
+
+        self.pending.append((topic, cell.base_value))
+        for detail_value in cell.detail_values:
+            if detail_value:
+                self.pending.append((topic, detail_value))
+
+    def add_pending_names(self) -> None:
+        names_per_cell = extract_names_from_cells([value for _topic, value in self.pending])
+        for (topic, _value), names in zip(self.pending, names_per_cell):
+            for name in names:
+                add_name(self.topic_map, topic, name)
+        self.pending = []
+
+    def add_roundtables(self) -> None:
+        for topic, _col, cell_value in iter_roundtable_cells(self.grid):
+            self.pending.append((topic, cell_value))
+
+    def finish(self) -> Dict[str, object]:
+        self.add_roundtables()
+        with span("name_extract"):
+            self.add_pending_names()
+
+        topics: List[Dict[str, object]] = []
+
+        for topic_id, payload in self.topic_map.items():
+            people_sorted = sorted(payload["people_set"], key=lambda item: item.casefold())
+            if not people_sorted:
                 continue
 
-            theme_code, _track = parse_theme(stream_code, name_to_code)
-            if theme_code:
-                topic = (
-                    f"theme:{theme_code}",
-                    code_to_name.get(theme_code, theme_code),
-                    "theme",
-                    theme_code,
-                )
-            else:
-                topic = (
-                    "session:roundtable-presentations",
-                    "Roundtable Presentations",
-                    "session",
-                    None,
-                )
-
-            for row_num in [128, 129, 130, 131]:
-                cell_value = rows.get(row_num, {}).get(col)
-                if not cell_value:
-                    continue
-                for name in extract_names_from_cell(cell_value):
-                    add_name(topic_map, topic, name)
+            topic_obj = {
+                "id": payload["id"],
+                "label": payload["label"],
+                "kind": payload["kind"],
+                "people": people_sorted,
+                "count": len(people_sorted),
+            }
+            if payload.get("code"):
+                topic_obj["code"] = payload["code"]
+
+            topics.append(topic_obj)
+
+        return topics_payload(topics)
+
+
+def resolve_topic_people(
+    topics: List[Dict[str, object]],
+    known_aliases: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, List[str]]:
+    """Rewrite each topic's names to canonical spellings; return canonical -> aliases."""
+    occurrences = Counter(name for topic in topics for name in topic["people"])
+    canonical = resolve_identities(occurrences, occurrences)
+    for topic in topics:
+        topic["people"] = sorted({canonical[name] for name in topic["people"]}, key=lambda item: item.casefold())
+        topic["count"] = len(topic["people"])
+
+    aliases = {name: set(names) for name, names in alias_map(canonical).items()}
+    # Aliases resolved earlier (e.g. per sheet before a batch merge) carry over.
+    for name, names in (known_aliases or {}).items():
+        target = canonical.get(name, name)
+        merged = aliases.setdefault(target, set())
+        merged.update(names)
+        merged.add(name)
+        merged.discard(target)
+    return {name: sorted(names, key=lambda item: (item.casefold(), item)) for name, names in aliases.items() if names}
+
+
+def topics_payload(
+    topics: List[Dict[str, object]],
+    generated_from: str = GENERATED_FROM,
+    known_aliases: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, object]:
+    # ``topics`` list their people by name; the payload swaps the names for
+    # integer ids into one shared ``people`` table and adds the inverse index.
+    with span("identity"):
+        aliases = resolve_topic_people(topics, known_aliases)
+    topics.sort(key=lambda item: (item["label"].casefold(), item["id"]))
+    people = sorted({name for topic in topics for name in topic["people"]}, key=lambda name: (name.casefold(), name))
+    person_ids = {name: person_id for person_id, name in enumerate(people)}
+    person_topics: List[List[int]] = [[] for _name in people]
+
+    indexed_topics: List[Dict[str, object]] = []
+    for topic_position, topic in enumerate(topics):
+        indexed: Dict[str, object] = {}
+        for key, value in topic.items():
+            if key != "people":
+                indexed[key] = value
+                continue
+            ids = [person_ids[name] for name in value]
+            for person_id in ids:
+                person_topics[person_id].append(topic_position)
+            indexed["person_ids"] = ids
+        indexed_topics.append(indexed)
 
-    topics: List[Dict[str, object]] = []
-    all_people: Set[str] = set()
+    return {
+        "timezone": "Europe/London",
+        "location": "Manchester",
+        "generated_from": generated_from,
+        "generated_at": dt.datetime.now(dt.UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "topics": indexed_topics,
+        "topic_count": len(indexed_topics),
+        "total_people": len(people),
+        "people": people,
+        "person_keys": [normalize_person_key(name) for name in people],
+        "person_topics": person_topics,
+        "person_aliases": {
+            str(person_ids[name]): aliases[name] for name in sorted(aliases, key=person_ids.__getitem__)
+        },
+    }
 
-    for topic_id, payload in topic_map.items():
-        people_sorted = sorted(payload["people_set"], key=lambda item: item.casefold())
-        if not people_sorted:
-            continue
 
-        for name in people_sorted:
-            all_people.add(name)
+def payload_aliases(payload: Dict[str, object]) -> Dict[str, List[str]]:
+    people = payload["people"]
+    return {people[int(person_id)]: names for person_id, names in payload.get("person_aliases", {}).items()}
 
-        topic_obj = {
-            "id": payload["id"],
-            "label": payload["label"],
-            "kind": payload["kind"],
-            "people": people_sorted,
-            "count": len(people_sorted),
-        }
-        if payload.get("code"):
-            topic_obj["code"] = payload["code"]
 
-        topics.append(topic_obj)
+def topic_people(payload: Dict[str, object], topic: Dict[str, object]) -> List[str]:
+    people = payload["people"]
+    return [people[person_id] for person_id in topic["person_ids"]]
 
-    topics.sort(key=lambda item: (item["label"].casefold(), item["id"]))
 
+def merge_payloads(payloads: Sequence[Dict[str, object]], generated_from: str) -> Dict[str, object]:
+    # Topics with the same id from different sheets pool their people.
+    merged: Dict[str, Dict[str, object]] = {}
+    known_aliases: Dict[str, List[str]] = {}
+    for payload in payloads:
+        for name, names in payload_aliases(payload).items():
+            known_aliases.setdefault(name, []).extend(names)
+        for topic in payload["topics"]:
+            names = topic_people(payload, topic)
+            target = merged.get(topic["id"])
+            if target is None:
+                fields = {key: value for key, value in topic.items() if key != "person_ids"}
+                merged[topic["id"]] = {**fields, "people": names}
+            else:
+                target["people"].extend(names)
+
+    # Identity resolution in topics_payload also dedupes the pooled names.
+    return topics_payload(list(merged.values()), generated_from, known_aliases)
+
+
+def generate_networking_data(grid: ProgrammeGrid) -> Dict[str, object]:
+    (payload,) = run_sinks(grid, [TopicSink(grid)])
+    return payload
+
+
+class SessionSink:
+    """Collects the cells of each session: one day, time slot and room column, or one roundtable."""
+
+    def __init__(self, grid: ProgrammeGrid) -> None:
+        self.grid = grid
+        self.sessions: Dict[Tuple[str, ...], List[str]] = {}
+
+    def add_slot_cell(self, cell: SlotCell) -> None:
+        values = self.sessions.setdefault((cell.section.day.isoformat(), cell.start_time, cell.col), [])
+        values.append(cell.base_value)
+        values.extend(value for value in cell.detail_values if value)
+
+    def finish(self) -> List[List[str]]:
+        for _topic, col, cell_value in iter_roundtable_cells(self.grid):
+            self.sessions.setdefault(("roundtable", col), []).append(cell_value)
+
+        with span("name_extract"):
+            values = [value for session in self.sessions.values() for value in session]
+            names_per_cell = iter(extract_names_from_cells(values))
+            return [
+                [name for _value in session for name in next(names_per_cell)]
+                for session in self.sessions.values()
+            ]
+
+
+def copresence_graph(
+    payload: Dict[str, object],
+    sessions: Sequence[Sequence[str]],
+    top_k: int = DEFAULT_TOP_K,
+) -> Dict[str, object]:
+    # Ids are the payload's person ids; session names are mapped through the
+    # aliases so spelling variants land on the same person. Names outside
+    # every topic have no id and are dropped. Sessions propose the candidates;
+    # shared topics only add to their scores (topics are too large to pair up).
+    person_ids = {name: person_id for person_id, name in enumerate(payload["people"])}
+    for name, names in payload_aliases(payload).items():
+        for alias in names:
+            person_ids[alias] = person_ids[name]
+
+    groups = []
+    for names in sessions:
+        ids = [person_ids[name] for name in names if name in person_ids]
+        if len(ids) > 1:
+            groups.append((ids, COPRESENCE_WEIGHTS["session"]))
+
+    with span("copresence"):
+        neighbours, scores = top_neighbours(
+            len(payload["people"]),
+            groups,
+            top_k,
+            memberships=payload["person_topics"],
+            membership_weight=COPRESENCE_WEIGHTS["topic"],
+        )
     return {
-        "timezone": "Europe/London",
-        "location": "Manchester",
-        "generated_from": "Programme grid 2026 v4 - view only.xlsx (first worksheet)",
-        "generated_at": dt.datetime.now(dt.UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "topics": topics,
-        "topic_count": len(topics),
-        "total_people": len(all_people),
+        "version": COPRESENCE_VERSION,
+        "total_people": payload["total_people"],
+        "top_k": top_k,
+        "weights": dict(COPRESENCE_WEIGHTS),
+        "neighbours": neighbours,
+        "scores": scores,
     }
 
 
+def encode_copresence(graph: Dict[str, object]) -> bytes:
+    with span("serialise"):
+        return encode_json(graph, minified=True)
+
+
+def columnar_payload(payload: Dict[str, object]) -> Dict[str, object]:
+    """Topic fields as parallel arrays; every string is an index into ``strings`` (-1 for none)."""
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(strings)
+            strings.append(value)
+        return string_id
+
+    topics = payload["topics"]
+    columns: Dict[str, object] = {
+        name: [intern(topic.get(name)) for topic in topics] for name in TOPIC_STRING_COLUMNS
+    }
+    columns["count"] = [topic["count"] for topic in topics]
+    columns["person_ids"] = [topic["person_ids"] for topic in topics]
+
+    data: Dict[str, object] = {"format": "columnar", "version": COLUMNAR_VERSION}
+    data.update((key, payload[key]) for key in META_KEYS)
+    data.update(
+        topics=columns,
+        people=[intern(name) for name in payload["people"]],
+        person_keys=[intern(key) for key in payload["person_keys"]],
+        person_topics=payload["person_topics"],
+        person_aliases={
+            person_id: [intern(name) for name in names] for person_id, names in payload["person_aliases"].items()
+        },
+        strings=strings,
+    )
+    return data
+
+
+def expand_columnar(data: Dict[str, object]) -> Dict[str, object]:
+    # Inverse of columnar_payload, mostly as executable documentation of the layout.
+    strings = data["strings"]
+    columns = data["topics"]
+
+    def lookup(string_id: int) -> Optional[str]:
+        return strings[string_id] if string_id >= 0 else None
+
+    topics: List[Dict[str, object]] = []
+    for position, topic_id in enumerate(columns["id"]):
+        topic: Dict[str, object] = {
+            "id": lookup(topic_id),
+            "label": lookup(columns["label"][position]),
+            "kind": lookup(columns["kind"][position]),
+            "person_ids": columns["person_ids"][position],
+            "count": columns["count"][position],
+        }
+        code = lookup(columns["code"][position])
+        if code:
+            topic["code"] = code
+        topics.append(topic)
+
+    payload: Dict[str, object] = {key: data[key] for key in META_KEYS}
+    payload.update(
+        topics=topics,
+        people=[strings[string_id] for string_id in data["people"]],
+        person_keys=[strings[string_id] for string_id in data["person_keys"]],
+        person_topics=data["person_topics"],
+        person_aliases={
+            person_id: [strings[string_id] for string_id in names] for person_id, names in data["person_aliases"].items()
+        },
+    )
+    return payload
+
+
+def encode_payload(payload: Dict[str, object], profile: str = "pretty") -> bytes:
+    if profile == "columnar":
+        return encode_json(columnar_payload(payload), minified=True)
+    return encode_json(payload, minified=profile == "minified")
+
+
+def write_json(
+    path: Path,
+    payload: Dict[str, object],
+    profile: str = "pretty",
+    codecs: Sequence[str] = (),
+) -> List[Path]:
+    with span("serialise"):
+        return write_encoded(path, encode_payload(payload, profile), codecs)
+
+
+def write_sharded_payload(
+    directory: Path,
+    payload: Dict[str, object],
+    mode: str = "topic",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, object]:
+    # Shards come first and the manifest last, so the manifest never points at
+    # a missing file; stale shards go only once the new manifest is in place.
+    topics = payload["topics"]
+    if mode == "topic":
+        groups = [[topic] for topic in topics]
+    else:
+        groups = [topics[start : start + chunk_size] for start in range(0, len(topics), chunk_size)]
+
+    with span("serialise"):
+        entries: List[Dict[str, object]] = []
+        shard_names: List[str] = []
+        for group in groups:
+            name = write_shard(
+                directory,
+                TOPIC_SHARD_PREFIX,
+                {"topics": [{"id": topic["id"], "people": topic_people(payload, topic)} for topic in group]},
+            )
+            shard_names.append(name)
+            for topic in group:
+                entry = {key: value for key, value in topic.items() if key != "person_ids"}
+                entry["shard"] = name
+                entries.append(entry)
+
+        people_name = write_shard(
+            directory,
+            PEOPLE_SHARD_PREFIX,
+            {key: payload[key] for key in ("people", "person_keys", "person_topics", "person_aliases")},
+        )
+        manifest = {key: payload[key] for key in META_KEYS}
+        manifest.update(topics=entries, people_shard=people_name)
+        write_manifest(directory, manifest)
+        prune_shards(directory, [*shard_names, people_name], [TOPIC_SHARD_PREFIX, PEOPLE_SHARD_PREFIX])
+    return manifest
+
+
+def is_served_path(path: Path) -> bool:
+    return SERVED_DIR_NAME in path.resolve().parts[:-1]
+
+
+def payload_content(payload: Dict) -> Dict:
+    # Everything except the run timestamp, for deciding whether the JSON changed.
+    return {key: value for key, value in payload.items() if key != "generated_at"}
+
+
+def build(args: argparse.Namespace, state: Dict[str, object]) -> None:
+    layout = load_layout_option(args.layout)
+    codecs = available_codecs(args.compress)
+    output_paths = [args.output, *(sibling_path(args.output, codec) for codec in codecs)]
+    copresence_paths = (
+        [args.copresence, *(sibling_path(args.copresence, codec) for codec in codecs)] if args.copresence else []
+    )
+    cache = None if args.no_cache else BuildCache(args.cache_dir)
+    graph = None
+    if cache is None:
+        payload_key = None
+        grid = ProgrammeGrid.load(args.input, layout=layout)
+        if args.copresence:
+            payload, sessions = run_sinks(grid, [TopicSink(grid), SessionSink(grid)])
+            graph = copresence_graph(payload, sessions, args.top_k)
+        else:
+            payload = generate_networking_data(grid)
+    else:
+        grid_key = grid_cache_key(args.input)
+        payload_key = derived_cache_key(
+            grid_key,
+            Path(__file__),
+            layout=layout_to_dict(layout) if layout else None,
+        )
+        output_key = derived_cache_key(payload_key, Path(__file__), json_profile=args.json_profile, codecs=codecs)
+        shards_key = derived_cache_key(payload_key, Path(__file__), shard_mode=args.shard_mode, chunk_size=args.chunk_size)
+        graph_key = derived_cache_key(payload_key, Path(__file__), top_k=args.top_k)
+        graph_output_key = derived_cache_key(graph_key, Path(__file__), codecs=codecs)
+        outputs_current = all(cache.output_is_current(path, output_key) for path in output_paths) and all(
+            cache.output_is_current(path, graph_output_key) for path in copresence_paths
+        )
+        if (
+            outputs_current
+            and not args.report_sizes
+            and (not args.shard_dir or cache.output_is_current(args.shard_dir / MANIFEST_NAME, shards_key))
+        ):
+            print(f"Up to date: {args.output}")
+            return
+        load_grid = lru_cache(maxsize=None)(lambda: cache.load_grid(args.input, grid_key, layout))
+        payload = cache.get_or_build(payload_key, "networking", lambda: generate_networking_data(load_grid()))
+        if args.copresence:
+            graph = cache.get_or_build(
+                graph_key,
+                "copresence",
+                lambda: copresence_graph(payload, run_sinks(load_grid(), [SessionSink(load_grid())])[0], args.top_k),
+            )
+
+    if args.report_sizes:
+        print_size_report(size_report({profile: encode_payload(payload, profile) for profile in JSON_PROFILES}))
+
+    # In --watch mode an edit only rewrites the outputs whose content changed. The
+    # topics payload and the co-presence graph are compared separately: moving
+    # someone between two sessions of the same theme changes only the graph.
+    content = payload_content(payload)
+    payload_current = state.get("content") == content and all(path.exists() for path in output_paths)
+    state["content"] = content
+    graph_data = encode_copresence(graph) if graph is not None else None
+    graph_current = graph_data is None or (
+        state.get("copresence") == graph_data and all(path.exists() for path in copresence_paths)
+    )
+    state["copresence"] = graph_data
+    if payload_current and graph_current:
+        print(f"Unchanged: {args.output}")
+        return
+
+    written: List[Path] = []
+    if payload_current:
+        print(f"Unchanged: {args.output}")
+    else:
+        written = write_json(args.output, payload, args.json_profile, codecs)
+        if cache is not None:
+            for path in written:
+                cache.record_output(path, output_key)
+        if args.shard_dir:
+            manifest = write_sharded_payload(args.shard_dir, payload, args.shard_mode, args.chunk_size)
+            if cache is not None:
+                cache.record_output(args.shard_dir / MANIFEST_NAME, shards_key)
+    if graph_current:
+        if graph_data is not None:
+            print(f"Unchanged: {args.copresence}")
+    else:
+        graph_written = write_encoded(args.copresence, graph_data, codecs)
+        if cache is not None:
+            for path in graph_written:
+                cache.record_output(path, graph_output_key)
+        written.extend(graph_written)
+
+    print(f"Generated topics: {payload['topic_count']}")
+    print(f"Total unique people: {payload['total_people']}")
+    for path in written:
+        print(f"Wrote: {path}")
+    if args.shard_dir and not payload_current:
+        shard_count = len({entry["shard"] for entry in manifest["topics"]})
+        print(f"Wrote: {args.shard_dir / MANIFEST_NAME} ({shard_count} topic shards + people shard)")
+    if args.cache_stats:
+        print_cache_stats(cache_stats())
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Generate networking JSON from programme XLSX")
     parser.add_argument(
         "--input",
         type=Path,
-        default=Path("/Users/abodid/Downloads/Programme grid 2026 v4 - view only.xlsx"),
-        help="Path to source XLSX",
+        default=DEFAULT_INPUT,
+        help="Path to source XLSX (or a .bsagrid snapshot of it)",
     )
     parser.add_argument(
         "--output",
         type=Path,
-        default=Path("src/data/bsa-networking.json"),
+        default=DEFAULT_OUTPUT,
         help="Output JSON path",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Build cache directory (parsed grid and derived data keyed by input hash)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the workbook and rewrite the output",
+    )
+    parser.add_argument(
+        "--json-profile",
+        choices=JSON_PROFILES,
+        default="pretty",
+        help="pretty: indented JSON; minified: no whitespace; columnar: parallel arrays plus a string table",
+    )
+    parser.add_argument(
+        "--compress",
+        nargs="+",
+        choices=CODECS,
+        default=[],
+        help="Also write pre-compressed siblings (output.json.gz, output.json.br; br needs the brotli package)",
+    )
+    parser.add_argument(
+        "--report-sizes",
+        action="store_true",
+        help="Print the byte size of every JSON profile, raw and compressed",
+    )
+    parser.add_argument(
+        "--shard-dir",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_SHARD_DIR,
+        metavar="DIR",
+        help=f"Also write a manifest plus content-hashed shards for lazy loading (default {DEFAULT_SHARD_DIR})",
+    )
+    parser.add_argument(
+        "--shard-mode",
+        choices=SHARD_MODES,
+        default="topic",
+        help="topic: one shard per topic; chunk: --chunk-size topics per shard",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Topics per shard with --shard-mode chunk (default {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--copresence",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_COPRESENCE_OUTPUT,
+        metavar="PATH",
+        help=f"Also write the top-k co-presence graph between people (default {DEFAULT_COPRESENCE_OUTPUT})",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=positive_int,
+        default=DEFAULT_TOP_K,
+        help=f"Neighbours kept per person in the co-presence graph (default {DEFAULT_TOP_K})",
+    )
+    add_layout_arguments(parser)
+    add_watch_arguments(parser)
+    add_profile_arguments(parser)
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print name-classifier cache hit/miss counters",
+    )
     args = parser.parse_args()
-
-    rows = read_first_sheet_cells(args.input)
-    payload = generate_networking_data(rows)
-
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-
-    print(f"Generated topics: {payload['topic_count']}")
-    print(f"Total unique people: {payload['total_people']}")
-    print(f"Wrote: {args.output}")
+    if (args.json_profile == "columnar" or args.compress) and not is_served_path(args.output):
+        parser.error(
+            f"--json-profile columnar and --compress need an --output under {SERVED_DIR_NAME}/; "
+            f"{args.output} is bundled by the networking page, which reads plain JSON"
+        )
+    if "br" in args.compress and "br" not in available_codecs(args.compress):
+        print("Skipping .br output: install the optional brotli package (pip install brotli)")
+
+    if args.write_layout:
+        write_layout_profile(args.write_layout, ProgrammeGrid.load(args.input).layout)
+        print(f"Wrote: {args.write_layout}")
+        return 0
+
+    if args.pstats and not args.profile:
+        parser.error("--pstats needs --profile")
+    if args.profile and args.watch:
+        parser.error("--profile profiles a single build; it cannot be combined with --watch")
+
+    state: Dict[str, object] = {}
+    if args.watch:
+        paths = [args.input, *([args.layout] if args.layout else [])]
+        return watch(paths, lambda: build(args, state), args.poll_interval, args.debounce)
+    if args.profile:
+        run_profiled(args.profile, args.pstats, lambda: build(args, state), cache_stats)
+    else:
+        build(args, state)
     return 0
 
 
@@ -6,28 +6,45 @@ Generate BSA schedule seed SQL from the first worksheet of the programme grid XL
 - Builds events by day/time/room from the timetable grid.
 - Removes speaker-name-only lines from title_display.
 - Keeps all time handling in Manchester time (Europe/London).
+- Streams SQL straight to the output file, batching event inserts (--batch-size).
+- Caches the parsed grid and events by input/generator hash; unchanged reruns are no-ops.
+- With --watch, stays running and rebuilds after each (debounced) save of the input.
+- With --apply, loads the same rows into Postgres in one transaction (optional psycopg).
+- Optionally snapshots the generated events and, given a previous snapshot,
+  emits only the inserts/updates/deletes needed to catch the database up.
 """
 
 from __future__ import annotations
 
 import argparse
 import datetime as dt
+import io
+import json
+import os
 import re
-import zipfile
-import xml.etree.ElementTree as ET
-from collections import Counter, defaultdict
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, astuple, dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-
-NS = {
-    "m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
-    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
-}
-
-COL_START = "C"
-COL_END = "Y"
-TIME_RANGE_RE = re.compile(r"^\s*(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})(.*)$", re.S)
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+
+from bsa_grid import (
+    NON_NAME_TOKENS,
+    THEME_TRACK_RE,
+    TIME_SPAN_RE,
+    ProgrammeGrid,
+    SlotCell,
+    col_to_num,
+    normalize_space,
+    parse_theme_and_track,
+    run_sinks,
+)
+from bsa_grid.cache import DEFAULT_CACHE_DIR, BuildCache, derived_cache_key, grid_cache_key
+from bsa_grid.cli import positive_int
+from bsa_grid.layout import add_layout_arguments, layout_to_dict, load_layout_option, write_layout_profile
+from bsa_grid.names import DEFAULT_CACHE_SIZE, NameClassifier, cache_counters, print_cache_stats
+from bsa_grid.profiling import add_profile_arguments, compile_regex, run_profiled, span
+from bsa_grid.watch import add_watch_arguments, watch
 
 GENERIC_LABELS = {
     "BSA SPECIAL ACTIVITY",
@@ -36,77 +53,13 @@ GENERIC_LABELS = {
     "SOCIOLOGY JOURNAL EVENT",
 }
 
-NON_NAME_TOKENS = {
-    "ROUND",
-    "TABLE",
-    "PRESENTATION",
-    "PRESENTATIONS",
-    "PAPER",
-    "SESSION",
-    "SPECIAL",
-    "EVENT",
-    "STREAM",
-    "PLENARY",
-    "PLENARIES",
-    "PRESIDENTIAL",
-    "ADDRESS",
-    "REGISTRATION",
-    "REFRESHMENTS",
-    "LUNCH",
-    "RECEPTION",
-    "PUBLISHERS",
-    "FORUM",
-    "SOCIOLOGY",
-    "JOURNAL",
-    "SOCIAL",
-    "ENVIRONMENT",
-    "SOCIETY",
-    "FAMILIES",
-    "RELATIONSHIPS",
-    "RACE",
-    "ETHNICITY",
-    "MIGRATION",
-    "SCIENCE",
-    "TECHNOLOGY",
-    "DIGITAL",
-    "STUDIES",
-    "THEORY",
-    "CULTURE",
-    "MEDIA",
-    "SPORT",
-    "FOOD",
-    "WORK",
-    "EMPLOYMENT",
-    "ECONOMIC",
-    "LIFE",
-    "RIGHTS",
-    "VIOLENCE",
-    "CRIME",
-    "METHODOLOGICAL",
-    "INNOVATIONS",
-    "CITY",
-    "CITIES",
-    "MOBILITIES",
-    "PLACE",
-    "SPACE",
-    "EMERGING",
-    "THEMES",
-    "MEDICINE",
-    "HEALTH",
-    "ILLNESS",
-    "DIVISIONS",
-    "IDENTITIES",
-    "LIFECOURSE",
-}
+TITLE_NON_NAME_TOKENS = NON_NAME_TOKENS | {"CITY", "LIFECOURSE"}
+TITLE_CLASSIFIER = NameClassifier(TITLE_NON_NAME_TOKENS)
+SPECIAL_EVENT_LABEL_RE = compile_regex(r"^(SPECIAL EVENT\*?)(?:\b.*)?$", re.I)
 
-
-@dataclass
-class DaySection:
-    row_start: int
-    row_end: int
-    day: dt.date
-    day_label: str
-    room_row: int
+DEFAULT_INPUT = Path("/Users/abodid/Downloads/Programme grid 2026 v4 - view only.xlsx")
+DEFAULT_OUTPUT = Path("sql/bsa-schedule/seed/seed_2026-04-08_to_2026-04-10_from_programme_grid.sql")
+DEFAULT_BATCH_SIZE = 500
 
 
 @dataclass
@@ -124,242 +77,25 @@ class EventRow:
     sort_order: Optional[int]
 
 
-def col_to_num(col: str) -> int:
-    total = 0
-    for ch in col:
-        total = total * 26 + (ord(ch) - 64)
-    return total
-
-
-def num_to_col(value: int) -> str:
-    out = ""
-    n = value
-    while n > 0:
-        n, rem = divmod(n - 1, 26)
-        out = chr(65 + rem) + out
-    return out
-
-
-def iter_cols(start: str, end: str) -> List[str]:
-    return [num_to_col(i) for i in range(col_to_num(start), col_to_num(end) + 1)]
-
-
-def normalize_space(text: str) -> str:
-    return re.sub(r"\s+", " ", text.replace("\r", " ").replace("\n", " ")).strip()
-
-
-def normalize_theme_key(text: str) -> str:
-    base = normalize_space(text).lower()
-    base = base.replace("&", " and ")
-    base = re.sub(r"[^a-z0-9]+", " ", base)
-    return re.sub(r"\s+", " ", base).strip()
-
-
-def parse_shared_strings(archive: zipfile.ZipFile) -> List[str]:
-    if "xl/sharedStrings.xml" not in archive.namelist():
-        return []
-
-    sst = ET.fromstring(archive.read("xl/sharedStrings.xml"))
-    values: List[str] = []
-    for si in sst.findall("m:si", NS):
-        values.append("".join((t.text or "") for t in si.findall(".//m:t", NS)))
-    return values
-
-
-def resolve_first_sheet_target(archive: zipfile.ZipFile) -> str:
-    workbook = ET.fromstring(archive.read("xl/workbook.xml"))
-    sheets = workbook.find("m:sheets", NS)
-    first_sheet = list(sheets)[0]
-    rel_id = first_sheet.attrib[f"{{{NS['r']}}}id"]
-
-    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
-    rel_map = {item.attrib["Id"]: item.attrib["Target"] for item in rels}
-
-    target = rel_map[rel_id]
-    if not target.startswith("xl/"):
-        target = "xl/" + target
-    return target.replace("xl/xl/", "xl/")
-
-
-def read_first_sheet_cells(xlsx_path: Path) -> Dict[int, Dict[str, str]]:
-    with zipfile.ZipFile(xlsx_path) as archive:
-        shared = parse_shared_strings(archive)
-        sheet_target = resolve_first_sheet_target(archive)
-        sheet = ET.fromstring(archive.read(sheet_target))
-
-    data: Dict[int, Dict[str, str]] = {}
-    sheet_data = sheet.find("m:sheetData", NS)
-
-    for row in sheet_data.findall("m:row", NS):
-        row_num = int(row.attrib["r"])
-        row_values: Dict[str, str] = {}
-
-        for cell in row.findall("m:c", NS):
-            ref = cell.attrib["r"]
-            match = re.match(r"([A-Z]+)(\d+)$", ref)
-            if not match:
-                continue
-            col = match.group(1)
-            ctype = cell.attrib.get("t")
-            v = cell.find("m:v", NS)
-            is_node = cell.find("m:is", NS)
-
-            value = ""
-            if ctype == "s" and v is not None:
-                idx = int(v.text)
-                value = shared[idx] if idx < len(shared) else ""
-            elif ctype == "inlineStr" and is_node is not None:
-                value = "".join((t.text or "") for t in is_node.findall(".//m:t", NS))
-            elif v is not None:
-                value = v.text or ""
-
-            if value.strip():
-                row_values[col] = value.strip()
-
-        if row_values:
-            data[row_num] = row_values
-
-    return data
-
-
-def parse_day_from_label(label: str) -> dt.date:
-    match = re.search(
-        r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})",
-        label,
-        flags=re.I,
-    )
-    if not match:
-        raise ValueError(f"Could not parse day label: {label}")
-
-    day = int(match.group(2))
-    month_name = match.group(3)
-    year = int(match.group(4))
-
-    month = dt.datetime.strptime(month_name[:3], "%b").month
-    return dt.date(year, month, day)
-
-
-def build_day_sections(rows: Dict[int, Dict[str, str]]) -> List[DaySection]:
-    candidates: List[Tuple[int, dt.date, str]] = []
-
-    for row_num in sorted(rows):
-        label = rows[row_num].get("A", "")
-        if re.search(r"\bApril\b\s+\d{4}", label, flags=re.I):
-            if re.search(r"\b(Wednesday|Thursday|Friday)\b", label, flags=re.I):
-                candidates.append((row_num, parse_day_from_label(label), label))
-
-    sections: List[DaySection] = []
-    max_row = max(rows)
-
-    for idx, (row_num, day_date, day_label) in enumerate(candidates):
-        next_start = candidates[idx + 1][0] if idx + 1 < len(candidates) else max_row + 1
-        row_end = next_start - 1
-
-        room_row = row_num
-        if not rows.get(room_row, {}).get("C"):
-            for probe in range(row_num - 2, row_num + 3):
-                if rows.get(probe, {}).get("C") and rows.get(probe, {}).get("D"):
-                    room_row = probe
-                    break
-
-        sections.append(
-            DaySection(
-                row_start=row_num,
-                row_end=row_end,
-                day=day_date,
-                day_label=day_label,
-                room_row=room_row,
-            )
-        )
-
-    return sections
-
-
-def extract_time_block(cell_value: str) -> Optional[Tuple[str, str, Optional[str]]]:
-    match = TIME_RANGE_RE.match(cell_value or "")
-    if not match:
-        return None
-
-    start_time = match.group(1)
-    end_time = match.group(2)
-    remainder = normalize_space(match.group(3) or "")
-    session_block = remainder or None
-    return start_time, end_time, session_block
-
-
-def parse_theme_and_track(
-    text: str,
-    theme_name_to_code: Dict[str, str],
-) -> Tuple[Optional[str], Optional[int]]:
-    value = normalize_space(text)
-    if not value:
-        return None, None
-
-    upper = value.upper()
-    known_codes = set(theme_name_to_code.values())
-    if re.fullmatch(r"[A-Z]{2,6}\d{0,2}", upper):
-        # Guard against generic words (e.g. LUNCH) being misread as theme codes.
-        # Accept if this is a known code, has an explicit numeric track suffix,
-        # or is a short code token (<=4 chars like STS/MED/WEEL is handled below).
-        if not (upper in known_codes or re.search(r"\d", upper) or len(upper) <= 4):
-            return None, None
-        match = re.match(r"^([A-Z]+)(\d+)?$", upper)
-        if match:
-            code = match.group(1)
-            track = int(match.group(2)) if match.group(2) else None
-            return code, track
-
-    lookup = theme_name_to_code.get(normalize_theme_key(value))
-    if lookup:
-        return lookup, None
-
-    return None, None
-
-
 def looks_like_person_name(line: str) -> bool:
-    cleaned = normalize_space(line)
-    if not cleaned:
-        return False
+    return TITLE_CLASSIFIER.looks_like_person_name(line)
 
-    if re.search(r"[^A-Za-z'\-\s]", cleaned):
-        return False
 
-    tokens = re.findall(r"[A-Za-z][A-Za-z'\-]*", cleaned)
-    if not (2 <= len(tokens) <= 5):
-        return False
-
-    if any(token.upper() in NON_NAME_TOKENS for token in tokens):
-        return False
-
-    if not all(token[0].isupper() for token in tokens):
-        return False
-
-    return True
+def is_speaker_line(line: str) -> bool:
+    return TITLE_CLASSIFIER.is_speaker_line(line)
 
 
-def is_speaker_line(line: str) -> bool:
-    raw = normalize_space(line)
-    if not raw:
-        return False
-
-    lowered = raw.lower()
-    if lowered.startswith("chair:"):
-        return True
-    if lowered.startswith("speaker:") or lowered.startswith("speakers:"):
-        return True
-    if lowered.startswith("presenter:") or lowered.startswith("presenters:"):
-        return True
-    if lowered.startswith("moderator:") or lowered.startswith("discussant:"):
-        return True
-    if re.match(r"^(dr|prof|mr|mrs|ms)\.?\s+", raw, flags=re.I):
-        return True
-
-    if "," in raw:
-        first = raw.split(",", 1)[0].strip()
-        if looks_like_person_name(first):
-            return True
-
-    return looks_like_person_name(raw)
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def clean_title_line(line: str) -> Optional[str]:
+    # ``line`` is already whitespace-normalised; None means drop it from the title.
+    special_match = SPECIAL_EVENT_LABEL_RE.match(line)
+    if special_match:
+        return special_match.group(1).upper()
+    if line.lower().startswith("chair:"):
+        return None
+    if is_speaker_line(line) and not line.upper().startswith("SPECIAL EVENT"):
+        return None
+    return line
 
 
 def clean_title_display(text: str) -> str:
@@ -369,16 +105,9 @@ def clean_title_display(text: str) -> str:
 
     kept: List[str] = []
     for line in lines:
-        special_match = re.match(r"^(SPECIAL EVENT\*?)(?:\b.*)?$", line, flags=re.I)
-        if special_match:
-            special_label = special_match.group(1).upper()
-            kept.append(special_label)
-            continue
-        if line.lower().startswith("chair:"):
-            continue
-        if is_speaker_line(line) and not line.upper().startswith("SPECIAL EVENT"):
-            continue
-        kept.append(line)
+        title_line = clean_title_line(line)
+        if title_line is not None:
+            kept.append(title_line)
 
     if not kept:
         return ""
@@ -386,6 +115,17 @@ def clean_title_display(text: str) -> str:
     return " / ".join(kept)
 
 
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    stats = TITLE_CLASSIFIER.cache_stats()
+    stats["clean_title_line"] = cache_counters(clean_title_line)
+    return stats
+
+
+def cache_clear() -> None:
+    TITLE_CLASSIFIER.cache_clear()
+    clean_title_line.cache_clear()
+
+
 def classify_kind(session_block: Optional[str], title: str, raw: str) -> str:
     text = f"{session_block or ''} {title} {raw}".lower()
 
@@ -430,7 +170,7 @@ def choose_title_raw(base_raw: str, detail_values: List[str]) -> str:
             return detail
 
     # For stream codes, keep stream label unless detail is clearly a non-person special label.
-    if re.fullmatch(r"[A-Z]{2,6}\d{0,2}", normalize_space(base_raw).upper()):
+    if THEME_TRACK_RE.fullmatch(normalize_space(base_raw).upper()):
         for detail in cleaned_details:
             low = detail.lower()
             if is_speaker_line(detail):
@@ -450,165 +190,96 @@ def london_timestamptz(date_value: dt.date, hhmm: str) -> str:
     return f"'{date_value.isoformat()} {int(hour):02d}:{int(minute):02d}:00 Europe/London'::timestamptz"
 
 
-def build_theme_maps(rows: Dict[int, Dict[str, str]]) -> Tuple[Dict[str, str], Dict[str, str]]:
-    code_to_name: Dict[str, str] = {}
-    name_to_code: Dict[str, str] = {}
-
-    for row_num in [4, 5, 6, 7]:
-        row = rows.get(row_num, {})
-        for name_col, code_col in [("B", "C"), ("D", "E"), ("F", "G"), ("H", "I")]:
-            name = normalize_space(row.get(name_col, ""))
-            code = normalize_space(row.get(code_col, "")).upper()
-            if not name or not code:
-                continue
-            if not re.fullmatch(r"[A-Z]{2,6}", code):
-                continue
-            code_to_name[code] = name
-            name_to_code[normalize_theme_key(name)] = code
-
-    return code_to_name, name_to_code
-
-
-def build_column_theme_hints(
-    rows: Dict[int, Dict[str, str]],
-    sections: List[DaySection],
-    name_to_code: Dict[str, str],
-) -> Dict[str, str]:
-    counters: Dict[str, Counter] = defaultdict(Counter)
-    columns = iter_cols(COL_START, COL_END)
-
-    for section in sections:
-        slot_rows = [
-            r
-            for r in range(section.row_start, section.row_end + 1)
-            if r in rows and rows[r].get("B") and TIME_RANGE_RE.match(rows[r]["B"])
-        ]
-        for slot_row in slot_rows:
-            block = extract_time_block(rows[slot_row]["B"])
-            if not block:
-                continue
-            _start, _end, session_block = block
-            if not session_block or "paper session" not in session_block.lower():
-                continue
-
-            row = rows.get(slot_row, {})
-            for col in columns:
-                raw = row.get(col)
-                if not raw:
-                    continue
-                theme_code, _track = parse_theme_and_track(raw, name_to_code)
-                if theme_code:
-                    counters[col][theme_code] += 1
-
-    hints: Dict[str, str] = {}
-    for col, counter in counters.items():
-        hints[col] = counter.most_common(1)[0][0]
-    return hints
-
-
-def generate_events(rows: Dict[int, Dict[str, str]]) -> Tuple[List[EventRow], Dict[str, str], Dict[str, str], Dict[dt.date, str]]:
-    code_to_name, name_to_code = build_theme_maps(rows)
-    sections = build_day_sections(rows)
-    columns = iter_cols(COL_START, COL_END)
-    col_index = {col: idx for idx, col in enumerate(columns, start=1)}
-
-    day_label_map: Dict[dt.date, str] = {}
-    room_names: Dict[str, str] = {}
-
-    for section in sections:
-        day_label_map[section.day] = section.day.strftime("%a %-d %b")
-        room_row = rows.get(section.room_row, {})
-        for col in columns:
-            room = normalize_space(room_row.get(col, ""))
-            if room:
-                room_names[col] = room
-
-    theme_hints = build_column_theme_hints(rows, sections, name_to_code)
-
-    all_events: List[EventRow] = []
-
-    for section in sections:
-        slot_rows = [
-            r
-            for r in range(section.row_start, section.row_end + 1)
-            if r in rows and rows[r].get("B") and TIME_RANGE_RE.match(rows[r]["B"])
-        ]
-
-        for idx, slot_row in enumerate(slot_rows):
-            next_slot_row = slot_rows[idx + 1] if idx + 1 < len(slot_rows) else section.row_end + 1
-            slot = extract_time_block(rows[slot_row]["B"])
-            if not slot:
-                continue
+EventResult = Tuple[List[EventRow], Dict[str, str], Dict[str, str], Dict[dt.date, str]]
+
+
+class EventSink:
+    """Collects schedule events from slot cells during a grid walk."""
+
+    def __init__(self, grid: ProgrammeGrid) -> None:
+        self.grid = grid
+        self.col_index = {col: idx for idx, col in enumerate(grid.columns, start=1)}
+        self.day_label_map: Dict[dt.date, str] = {}
+        self.room_names: Dict[str, str] = {}
+        self.events: List[EventRow] = []
+
+        for section in grid.sections:
+            self.day_label_map[section.day] = section.day.strftime("%a %-d %b")
+            for col in grid.columns:
+                room = normalize_space(grid.cells.get(section.room_row, col))
+                if room:
+                    self.room_names[col] = room
+
+    def add_slot_cell(self, cell: SlotCell) -> None:
+        base_raw = cell.base_value
+        session_block = cell.session_block
+        if normalize_space(base_raw).lower() == "leave empty":
+            return
+
+        room_name = self.room_names.get(cell.col)
+        if not room_name:
+            return
+
+        name_to_code = self.grid.name_to_code
+        chosen_raw = choose_title_raw(base_raw, cell.detail_values)
+
+        title_display = clean_title_display(chosen_raw)
+        if not title_display and session_block:
+            title_display = clean_title_display(session_block)
+        if not title_display:
+            title_display = "Conference Session"
+
+        theme_code, track = parse_theme_and_track(base_raw, name_to_code)
+        if not theme_code:
+            theme_code, track = parse_theme_and_track(chosen_raw, name_to_code)
+        if not theme_code and session_block and "paper session" in session_block.lower():
+            hint_code = self.grid.column_theme_hints.get(cell.col)
+            if hint_code:
+                theme_code = hint_code
+
+        kind = classify_kind(session_block, title_display, chosen_raw)
+
+        self.events.append(
+            EventRow(
+                day=cell.section.day,
+                start_time=cell.start_time,
+                end_time=cell.end_time,
+                session_block=session_block,
+                kind=kind,
+                theme_code=theme_code,
+                track=track,
+                room_name=room_name,
+                title_raw=normalize_space(chosen_raw),
+                title_display=title_display,
+                sort_order=self.col_index[cell.col] * 10,
+            )
+        )
 
-            start_time, end_time, session_block = slot
-            slot_cells = rows.get(slot_row, {})
-
-            for col in columns:
-                base_raw = slot_cells.get(col)
-                if not base_raw:
-                    continue
-                if normalize_space(base_raw).lower() == "leave empty":
-                    continue
-
-                room_name = room_names.get(col)
-                if not room_name:
-                    continue
-
-                detail_values = [rows.get(r, {}).get(col, "") for r in range(slot_row + 1, next_slot_row)]
-                chosen_raw = choose_title_raw(base_raw, detail_values)
-
-                title_display = clean_title_display(chosen_raw)
-                if not title_display and session_block:
-                    title_display = clean_title_display(session_block)
-                if not title_display:
-                    title_display = "Conference Session"
-
-                theme_code, track = parse_theme_and_track(base_raw, name_to_code)
-                if not theme_code:
-                    theme_code, track = parse_theme_and_track(chosen_raw, name_to_code)
-                if not theme_code and session_block and "paper session" in session_block.lower():
-                    hint_code = theme_hints.get(col)
-                    if hint_code:
-                        theme_code = hint_code
-
-                kind = classify_kind(session_block, title_display, chosen_raw)
-
-                all_events.append(
-                    EventRow(
-                        day=section.day,
-                        start_time=start_time,
-                        end_time=end_time,
-                        session_block=session_block,
-                        kind=kind,
-                        theme_code=theme_code,
-                        track=track,
-                        room_name=room_name,
-                        title_raw=normalize_space(chosen_raw),
-                        title_display=title_display,
-                        sort_order=col_index[col] * 10,
-                    )
-                )
+    def add_roundtables(self) -> None:
+        # Extra roundtable block from the lower table (first-sheet addendum).
+        cells = self.grid.cells
+        table = self.grid.layout.roundtable
+        day = self.grid.roundtable_day()
+        if table is None or day is None:
+            return
+        note = cells.get(table.note_row, table.note_col)
+        note_match = TIME_SPAN_RE.search(note)
+        if not (note_match and cells.has_row(table.header_row) and cells.has_row(table.code_row)):
+            return
 
-    # Extra roundtable block from the lower table (first-sheet addendum).
-    row125 = rows.get(125, {})
-    row126 = rows.get(126, {})
-    row127 = rows.get(127, {})
-    note = row125.get("B", "")
-    note_match = re.search(r"(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})", note)
-    if note_match and row126 and row127:
         round_start, round_end = note_match.group(1), note_match.group(2)
-        friday = dt.date(2026, 4, 10)
-        for col in ["D", "E", "F", "G"]:
-            table_name = normalize_space(row126.get(col, ""))
-            stream_code = normalize_space(row127.get(col, "")).upper()
+        first_col = col_to_num(table.columns[0]) if table.columns else 0
+        for col in table.columns:
+            table_name = normalize_space(cells.get(table.header_row, col))
+            stream_code = normalize_space(cells.get(table.code_row, col)).upper()
             if not table_name or not stream_code:
                 continue
 
-            room_name = f"Market Place Restaurant - {table_name}"
-            theme_code, track = parse_theme_and_track(stream_code, name_to_code)
-            all_events.append(
+            room_name = f"{table.room_prefix} - {table_name}"
+            theme_code, track = parse_theme_and_track(stream_code, self.grid.name_to_code)
+            self.events.append(
                 EventRow(
-                    day=friday,
+                    day=day,
                     start_time=round_start,
                     end_time=round_end,
                     session_block="Roundtable Presentations",
@@ -618,15 +289,27 @@ def generate_events(rows: Dict[int, Dict[str, str]]) -> Tuple[List[EventRow], Di
                     room_name=room_name,
                     title_raw="Roundtable Presentations",
                     title_display="Roundtable Presentations",
-                    sort_order=400 + (ord(col) - ord("D")) * 10,
+                    sort_order=400 + (col_to_num(col) - first_col) * 10,
                 )
             )
 
+    def finish(self) -> EventResult:
+        self.add_roundtables()
+
+        return dedupe_events(self.events), self.grid.code_to_name, self.grid.name_to_code, self.day_label_map
+
+
+def dedupe_events(events: Iterable[EventRow]) -> List[EventRow]:
+    with span("dedupe"):
+        return _dedupe_events(events)
+
+
+def _dedupe_events(events: Iterable[EventRow]) -> List[EventRow]:
     # Deduplicate obvious print-layout duplicates by content signature.
     deduped: List[EventRow] = []
     seen = set()
     for event in sorted(
-        all_events,
+        events,
         key=lambda e: (e.day, e.start_time, e.end_time, e.sort_order or 9999, e.room_name or ""),
     ):
         signature = (
@@ -642,100 +325,683 @@ def generate_events(rows: Dict[int, Dict[str, str]]) -> Tuple[List[EventRow], Di
             continue
         seen.add(signature)
         deduped.append(event)
+    return deduped
+
+
+def merge_event_results(results: Sequence[EventResult]) -> EventResult:
+    # Earlier results win when two sheets disagree on a theme name or day label.
+    events: List[EventRow] = []
+    code_to_name: Dict[str, str] = {}
+    name_to_code: Dict[str, str] = {}
+    day_labels: Dict[dt.date, str] = {}
+    for result_events, result_code_to_name, result_name_to_code, result_day_labels in results:
+        events.extend(result_events)
+        for source, target in (
+            (result_code_to_name, code_to_name),
+            (result_name_to_code, name_to_code),
+            (result_day_labels, day_labels),
+        ):
+            for key, value in source.items():
+                target.setdefault(key, value)
+    return dedupe_events(events), code_to_name, name_to_code, day_labels
+
+
+def generate_events(grid: ProgrammeGrid) -> EventResult:
+    (result,) = run_sinks(grid, [EventSink(grid)])
+    return result
+
+
+def sql_text_or_null(value: Optional[str]) -> str:
+    return f"'{escape_sql(value)}'" if value else "null"
+
+
+def sql_int_or_null(value: Optional[int]) -> str:
+    return str(value) if value is not None else "null"
+
+
+def room_id_sql(room_name: Optional[str]) -> str:
+    if not room_name:
+        return "null"
+    return f"(select id from public.rooms where name = '{escape_sql(room_name)}')"
+
+
+def event_values_sql(event: EventRow) -> str:
+    return (
+        "  (\n"
+        f"    '{event.day.isoformat()}',\n"
+        f"    {london_timestamptz(event.day, event.start_time)},\n"
+        f"    {london_timestamptz(event.day, event.end_time)},\n"
+        f"    {sql_text_or_null(event.session_block)},\n"
+        f"    '{event.kind}',\n"
+        f"    {sql_text_or_null(event.theme_code)},\n"
+        f"    {sql_int_or_null(event.track)},\n"
+        f"    {room_id_sql(event.room_name)},\n"
+        f"    '{escape_sql(event.title_raw)}',\n"
+        f"    '{escape_sql(event.title_display)}',\n"
+        f"    {sql_int_or_null(event.sort_order)}\n"
+        "  )"
+    )
 
-    return deduped, code_to_name, name_to_code, day_label_map
 
+EVENT_COLUMNS = (
+    "day, start_at, end_at, session_block, kind, theme_code, track, room_id, title_raw, title_display, sort_order"
+)
 
-def to_sql(
+
+class LineWriter:
+    """Writes lines to a text sink separated by newlines, like ``"\\n".join``."""
+
+    def __init__(self, out: TextIO) -> None:
+        self.out = out
+        self.started = False
+
+    def __call__(self, line: str) -> None:
+        if self.started:
+            self.out.write("\n")
+        self.started = True
+        self.out.write(line)
+
+
+def emit_event_inserts(emit: LineWriter, events: Sequence[EventRow], batch_size: int) -> None:
+    # One bounded insert per batch; VALUES tuples are written as they are built.
+    for start in range(0, len(events), batch_size):
+        batch = events[start : start + batch_size]
+        emit(f"insert into public.events ({EVENT_COLUMNS})")
+        emit("values")
+        last = len(batch) - 1
+        for idx, event in enumerate(batch):
+            emit(event_values_sql(event) + ("," if idx < last else ""))
+        emit(";")
+        emit("")
+
+
+def write_insert_sql(
+    out: TextIO,
     events: List[EventRow],
     code_to_name: Dict[str, str],
     day_labels: Dict[dt.date, str],
-) -> str:
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
     used_days = sorted({event.day for event in events})
     used_themes = sorted({event.theme_code for event in events if event.theme_code})
     used_rooms = sorted({event.room_name for event in events if event.room_name})
 
-    lines: List[str] = []
-    lines.append("-- Generated from: Programme grid 2026 v4 - view only.xlsx (first worksheet)")
-    lines.append("-- Timezone: Manchester (Europe/London)")
-    lines.append("")
-    lines.append("begin;")
-    lines.append("")
+    emit = LineWriter(out)
+    emit("-- Generated from: Programme grid 2026 v4 - view only.xlsx (first worksheet)")
+    emit("-- Timezone: Manchester (Europe/London)")
+    emit("")
+    emit("begin;")
+    emit("")
 
-    lines.append("insert into public.conference_days (day, label)")
-    lines.append("values")
+    emit("insert into public.conference_days (day, label)")
+    emit("values")
     day_values = []
     for day in used_days:
         label = day_labels.get(day, day.strftime("%a %-d %b"))
         day_values.append(f"  ('{day.isoformat()}', '{escape_sql(label)}')")
-    lines.append(",\n".join(day_values))
-    lines.append("on conflict (day) do update")
-    lines.append("set label = excluded.label;")
-    lines.append("")
+    emit(",\n".join(day_values))
+    emit("on conflict (day) do update")
+    emit("set label = excluded.label;")
+    emit("")
 
-    lines.append("insert into public.themes (code, name)")
-    lines.append("values")
+    emit("insert into public.themes (code, name)")
+    emit("values")
     theme_values = []
     for code in used_themes:
         name = code_to_name.get(code, code)
         theme_values.append(f"  ('{escape_sql(code)}', '{escape_sql(name)}')")
-    lines.append(",\n".join(theme_values))
-    lines.append("on conflict (code) do update")
-    lines.append("set name = excluded.name;")
-    lines.append("")
+    emit(",\n".join(theme_values))
+    emit("on conflict (code) do update")
+    emit("set name = excluded.name;")
+    emit("")
 
-    lines.append("insert into public.rooms (name)")
-    lines.append("values")
+    emit("insert into public.rooms (name)")
+    emit("values")
     room_values = [f"  ('{escape_sql(room)}')" for room in used_rooms]
-    lines.append(",\n".join(room_values))
-    lines.append("on conflict (name) do nothing;")
-    lines.append("")
+    emit(",\n".join(room_values))
+    emit("on conflict (name) do nothing;")
+    emit("")
 
     day_list = ", ".join(f"'{day.isoformat()}'" for day in used_days)
-    lines.append(f"delete from public.events where day in ({day_list});")
-    lines.append("")
+    emit(f"delete from public.events where day in ({day_list});")
+    emit("")
+
+    emit_event_inserts(emit, events, batch_size)
+    emit("commit;")
+
+
+SNAPSHOT_VERSION = 1
+
+EventKey = Tuple[dt.date, str, str, Optional[str], Optional[int]]
+
+
+def event_key(event: EventRow) -> EventKey:
+    # Identity of a slot in the grid; everything else on the row is payload.
+    return (event.day, event.start_time, event.end_time, event.room_name, event.sort_order)
+
+
+def event_to_snapshot(event: EventRow) -> Dict[str, object]:
+    data = asdict(event)
+    data["day"] = event.day.isoformat()
+    return data
+
+
+def event_from_snapshot(data: Dict[str, object]) -> EventRow:
+    values = dict(data)
+    values["day"] = dt.date.fromisoformat(str(values["day"]))
+    return EventRow(**values)
+
+
+def event_result_to_cache(result: EventResult) -> Tuple[object, ...]:
+    # Plain data only: a pickled EventRow names its defining module, which is
+    # ``__main__`` when this file runs as a script, so bsa_build.py would load
+    # the same entry as a different class.
+    events, code_to_name, name_to_code, day_labels = result
+    return ([event_to_snapshot(event) for event in events], code_to_name, name_to_code, day_labels)
+
+
+def event_result_from_cache(data: Tuple[object, ...]) -> EventResult:
+    events, code_to_name, name_to_code, day_labels = data
+    return ([event_from_snapshot(item) for item in events], code_to_name, name_to_code, day_labels)
 
-    lines.append(
-        "insert into public.events (day, start_at, end_at, session_block, kind, theme_code, track, room_id, title_raw, title_display, sort_order)"
+
+def write_event_snapshot(path: Path, events: List[EventRow]) -> None:
+    payload = {"version": SNAPSHOT_VERSION, "events": [event_to_snapshot(event) for event in events]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def read_event_snapshot(path: Path) -> List[EventRow]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if payload.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported event snapshot version in {path}: {payload.get('version')!r}")
+    return [event_from_snapshot(item) for item in payload["events"]]
+
+
+@dataclass
+class EventDiff:
+    inserted: List[EventRow] = field(default_factory=list)
+    updated: List[EventRow] = field(default_factory=list)
+    deleted: List[EventRow] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+
+def diff_events(previous: Iterable[EventRow], current: Iterable[EventRow]) -> EventDiff:
+    before = {event_key(event): event for event in previous}
+    diff = EventDiff()
+    seen = set()
+    for event in current:
+        key = event_key(event)
+        seen.add(key)
+        old = before.get(key)
+        if old is None:
+            diff.inserted.append(event)
+        elif astuple(old) != astuple(event):
+            diff.updated.append(event)
+    diff.deleted = [event for key, event in before.items() if key not in seen]
+    return diff
+
+
+def event_match_sql(event: EventRow) -> str:
+    return (
+        f"day = '{event.day.isoformat()}'"
+        f" and start_at = {london_timestamptz(event.day, event.start_time)}"
+        f" and end_at = {london_timestamptz(event.day, event.end_time)}"
+        f" and room_id is not distinct from {room_id_sql(event.room_name)}"
+        f" and sort_order is not distinct from {sql_int_or_null(event.sort_order)}"
+    )
+
+
+def write_incremental_sql(
+    out: TextIO,
+    diff: EventDiff,
+    code_to_name: Dict[str, str],
+    day_labels: Dict[dt.date, str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    changed = diff.inserted + diff.updated
+    used_days = sorted({event.day for event in changed})
+    used_themes = sorted({event.theme_code for event in changed if event.theme_code})
+    used_rooms = sorted({event.room_name for event in changed if event.room_name})
+
+    emit = LineWriter(out)
+    emit("-- Generated from: Programme grid 2026 v4 - view only.xlsx (first worksheet)")
+    emit("-- Timezone: Manchester (Europe/London)")
+    emit(
+        f"-- Incremental: {len(diff.inserted)} inserted, {len(diff.updated)} updated, {len(diff.deleted)} deleted"
     )
-    lines.append("values")
+    emit("")
+    if not diff:
+        emit("-- No event changes")
+        return
+
+    emit("begin;")
+    emit("")
+
+    if used_days:
+        emit("insert into public.conference_days (day, label)")
+        emit("values")
+        day_values = []
+        for day in used_days:
+            label = day_labels.get(day, day.strftime("%a %-d %b"))
+            day_values.append(f"  ('{day.isoformat()}', '{escape_sql(label)}')")
+        emit(",\n".join(day_values))
+        emit("on conflict (day) do update")
+        emit("set label = excluded.label")
+        emit("where conference_days.label is distinct from excluded.label;")
+        emit("")
+
+    if used_themes:
+        emit("insert into public.themes (code, name)")
+        emit("values")
+        theme_values = []
+        for code in used_themes:
+            name = code_to_name.get(code, code)
+            theme_values.append(f"  ('{escape_sql(code)}', '{escape_sql(name)}')")
+        emit(",\n".join(theme_values))
+        emit("on conflict (code) do update")
+        emit("set name = excluded.name")
+        emit("where themes.name is distinct from excluded.name;")
+        emit("")
+
+    if used_rooms:
+        emit("insert into public.rooms (name)")
+        emit("values")
+        emit(",\n".join(f"  ('{escape_sql(room)}')" for room in used_rooms))
+        emit("on conflict (name) do nothing;")
+        emit("")
+
+    # Deletes first so a moved event cannot trip idx_events_unique_slot.
+    for event in diff.deleted:
+        emit(f"delete from public.events where {event_match_sql(event)};")
+    if diff.deleted:
+        emit("")
+
+    for event in diff.updated:
+        emit("update public.events")
+        emit(f"set session_block = {sql_text_or_null(event.session_block)},")
+        emit(f"    kind = '{event.kind}',")
+        emit(f"    theme_code = {sql_text_or_null(event.theme_code)},")
+        emit(f"    track = {sql_int_or_null(event.track)},")
+        emit(f"    title_raw = '{escape_sql(event.title_raw)}',")
+        emit(f"    title_display = '{escape_sql(event.title_display)}'")
+        emit(f"where {event_match_sql(event)};")
+        emit("")
+
+    emit_event_inserts(emit, diff.inserted, batch_size)
+    emit("commit;")
+
+
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_field(value: Optional[object]) -> str:
+    if value is None:
+        return "\\N"
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_row(*values: Optional[object]) -> str:
+    return "\t".join(copy_field(value) for value in values)
+
+
+def london_timestamp_text(date_value: dt.date, hhmm: str) -> str:
+    hour, minute = hhmm.split(":")
+    return f"{date_value.isoformat()} {int(hour):02d}:{int(minute):02d}:00 Europe/London"
+
+
+def write_copy_sql(
+    out: TextIO,
+    events: List[EventRow],
+    code_to_name: Dict[str, str],
+    day_labels: Dict[dt.date, str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """Seed script that loads data with ``COPY ... FROM STDIN`` (run it with psql).
+
+    Rows are copied into temp staging tables, upserted into the lookup tables
+    with one statement each, and events resolve ``room_id`` through a single
+    join on ``public.rooms`` instead of a subquery per row. ``batch_size`` is
+    accepted so every writer shares one signature; COPY streams need no batching.
+    """
+    used_days = sorted({event.day for event in events})
+    used_themes = sorted({event.theme_code for event in events if event.theme_code})
+    used_rooms = sorted({event.room_name for event in events if event.room_name})
+
+    emit = LineWriter(out)
+    emit("-- Generated from: Programme grid 2026 v4 - view only.xlsx (first worksheet)")
+    emit("-- Timezone: Manchester (Europe/London)")
+    emit("-- Format: COPY FROM STDIN (load with psql -f)")
+    emit("")
+    emit("begin;")
+    emit("")
 
-    event_values = []
+    emit("create temp table bsa_seed_days (day date, label text) on commit drop;")
+    emit("copy bsa_seed_days (day, label) from stdin;")
+    for day in used_days:
+        emit(copy_row(day.isoformat(), day_labels.get(day, day.strftime("%a %-d %b"))))
+    emit("\\.")
+    emit("")
+    emit("insert into public.conference_days (day, label)")
+    emit("select day, label from bsa_seed_days")
+    emit("on conflict (day) do update")
+    emit("set label = excluded.label;")
+    emit("")
+
+    emit("create temp table bsa_seed_themes (code text, name text) on commit drop;")
+    emit("copy bsa_seed_themes (code, name) from stdin;")
+    for code in used_themes:
+        emit(copy_row(code, code_to_name.get(code, code)))
+    emit("\\.")
+    emit("")
+    emit("insert into public.themes (code, name)")
+    emit("select code, name from bsa_seed_themes")
+    emit("on conflict (code) do update")
+    emit("set name = excluded.name;")
+    emit("")
+
+    emit("create temp table bsa_seed_rooms (name text) on commit drop;")
+    emit("copy bsa_seed_rooms (name) from stdin;")
+    for room in used_rooms:
+        emit(copy_row(room))
+    emit("\\.")
+    emit("")
+    emit("insert into public.rooms (name)")
+    emit("select name from bsa_seed_rooms")
+    emit("on conflict (name) do nothing;")
+    emit("")
+
+    emit("delete from public.events where day in (select day from bsa_seed_days);")
+    emit("")
+
+    emit(
+        "create temp table bsa_seed_events ("
+        "day date, start_at timestamptz, end_at timestamptz, session_block text, kind text, theme_code text, "
+        "track int, room_name text, title_raw text, title_display text, sort_order int"
+        ") on commit drop;"
+    )
+    emit(
+        "copy bsa_seed_events (day, start_at, end_at, session_block, kind, theme_code, track, room_name, "
+        "title_raw, title_display, sort_order) from stdin;"
+    )
     for event in events:
-        session_block_sql = (
-            f"'{escape_sql(event.session_block)}'" if event.session_block else "null"
+        emit(
+            copy_row(
+                event.day.isoformat(),
+                london_timestamp_text(event.day, event.start_time),
+                london_timestamp_text(event.day, event.end_time),
+                event.session_block or None,
+                event.kind,
+                event.theme_code or None,
+                event.track,
+                event.room_name or None,
+                event.title_raw,
+                event.title_display,
+                event.sort_order,
+            )
         )
-        theme_sql = f"'{escape_sql(event.theme_code)}'" if event.theme_code else "null"
-        track_sql = str(event.track) if event.track is not None else "null"
-        sort_sql = str(event.sort_order) if event.sort_order is not None else "null"
-        room_sql = (
-            f"(select id from public.rooms where name = '{escape_sql(event.room_name)}')"
-            if event.room_name
-            else "null"
+    emit("\\.")
+    emit("")
+    emit(f"insert into public.events ({EVENT_COLUMNS})")
+    emit(
+        "select e.day, e.start_at, e.end_at, e.session_block, e.kind, e.theme_code, e.track, r.id, "
+        "e.title_raw, e.title_display, e.sort_order"
+    )
+    emit("from bsa_seed_events e")
+    emit("left join public.rooms r on r.name = e.room_name;")
+    emit("")
+    emit("commit;")
+
+
+SeedWriter = Callable[..., None]
+
+SEED_FORMATS: Dict[str, SeedWriter] = {
+    "sql": write_insert_sql,
+    "copy": write_copy_sql,
+}
+
+
+def render_sql(writer: SeedWriter, *args, **kwargs) -> str:
+    buffer = io.StringIO()
+    writer(buffer, *args, **kwargs)
+    return buffer.getvalue()
+
+
+def to_sql(
+    events: List[EventRow],
+    code_to_name: Dict[str, str],
+    day_labels: Dict[dt.date, str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> str:
+    return render_sql(write_insert_sql, events, code_to_name, day_labels, batch_size)
+
+
+def to_copy_sql(
+    events: List[EventRow],
+    code_to_name: Dict[str, str],
+    day_labels: Dict[dt.date, str],
+) -> str:
+    return render_sql(write_copy_sql, events, code_to_name, day_labels)
+
+
+def to_incremental_sql(
+    diff: EventDiff,
+    code_to_name: Dict[str, str],
+    day_labels: Dict[dt.date, str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> str:
+    return render_sql(write_incremental_sql, diff, code_to_name, day_labels, batch_size)
+
+
+def write_sql(path: Path, writer: SeedWriter, *args, **kwargs) -> None:
+    # Stream straight into the file so output size does not set peak memory.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with span("serialise"), path.open("w", encoding="utf-8") as out:
+        writer(out, *args, **kwargs)
+
+
+APPLY_DSN_ENV = "BSA_DATABASE_URL"
+POSTGRES_MAX_PARAMS = 65535
+
+
+def load_psycopg():
+    # Optional dependency: only --apply needs a Postgres driver.
+    try:
+        import psycopg
+    except ImportError:
+        return None
+    return psycopg
+
+
+@dataclass
+class ApplyPlan:
+    days: List[Tuple[dt.date, str]]
+    themes: List[Tuple[str, str]]
+    rooms: List[str]
+    events: List[EventRow]
+
+    def row_counts(self) -> Dict[str, int]:
+        return {
+            "conference_days": len(self.days),
+            "themes": len(self.themes),
+            "rooms": len(self.rooms),
+            "events": len(self.events),
+        }
+
+
+def build_apply_plan(
+    events: List[EventRow],
+    code_to_name: Dict[str, str],
+    day_labels: Dict[dt.date, str],
+) -> ApplyPlan:
+    used_days = sorted({event.day for event in events})
+    used_themes = sorted({event.theme_code for event in events if event.theme_code})
+    return ApplyPlan(
+        days=[(day, day_labels.get(day, day.strftime("%a %-d %b"))) for day in used_days],
+        themes=[(code, code_to_name.get(code, code)) for code in used_themes],
+        rooms=sorted({event.room_name for event in events if event.room_name}),
+        events=events,
+    )
+
+
+class BatchInserter:
+    """Runs multi-row inserts as server-side prepared statements.
+
+    Every full batch reuses one statement text, so Postgres parses and plans
+    it once per table; only the final short batch needs a second statement.
+    """
+
+    def __init__(self, cursor, batch_size: int) -> None:
+        self.cursor = cursor
+        self.batch_size = batch_size
+        self.statements = 0
+
+    def insert(self, head: str, placeholders: str, rows: Sequence[Sequence[object]], tail: str = "") -> None:
+        arity = placeholders.count("%s")
+        size = max(1, min(self.batch_size, POSTGRES_MAX_PARAMS // arity))
+        for start in range(0, len(rows), size):
+            batch = rows[start : start + size]
+            values = ", ".join([placeholders] * len(batch))
+            params = [value for row in batch for value in row]
+            self.cursor.execute(f"{head} values {values}{tail}", params, prepare=True)
+            self.statements += 1
+
+
+def apply_plan(connection, plan: ApplyPlan, batch_size: int) -> int:
+    """Loads the plan inside the connection's open transaction; returns statements run."""
+    with connection.cursor() as cursor:
+        inserter = BatchInserter(cursor, batch_size)
+        inserter.insert(
+            "insert into public.conference_days (day, label)",
+            "(%s, %s)",
+            plan.days,
+            " on conflict (day) do update set label = excluded.label",
+        )
+        inserter.insert(
+            "insert into public.themes (code, name)",
+            "(%s, %s)",
+            plan.themes,
+            " on conflict (code) do update set name = excluded.name",
+        )
+        inserter.insert(
+            "insert into public.rooms (name)",
+            "(%s)",
+            [(room,) for room in plan.rooms],
+            " on conflict (name) do nothing",
         )
 
-        event_values.append(
-            "  (\n"
-            f"    '{event.day.isoformat()}',\n"
-            f"    {london_timestamptz(event.day, event.start_time)},\n"
-            f"    {london_timestamptz(event.day, event.end_time)},\n"
-            f"    {session_block_sql},\n"
-            f"    '{event.kind}',\n"
-            f"    {theme_sql},\n"
-            f"    {track_sql},\n"
-            f"    {room_sql},\n"
-            f"    '{escape_sql(event.title_raw)}',\n"
-            f"    '{escape_sql(event.title_display)}',\n"
-            f"    {sort_sql}\n"
-            "  )"
+        # Resolve every room id once instead of a subquery per event row.
+        cursor.execute("select name, id from public.rooms where name = any(%s)", [plan.rooms])
+        room_ids = dict(cursor.fetchall())
+
+        cursor.execute("delete from public.events where day = any(%s)", [[day for day, _label in plan.days]])
+        inserter.insert(
+            f"insert into public.events ({EVENT_COLUMNS})",
+            "(%s, %s::timestamptz, %s::timestamptz, %s, %s, %s, %s, %s, %s, %s, %s)",
+            [
+                (
+                    event.day,
+                    london_timestamp_text(event.day, event.start_time),
+                    london_timestamp_text(event.day, event.end_time),
+                    event.session_block or None,
+                    event.kind,
+                    event.theme_code or None,
+                    event.track,
+                    room_ids.get(event.room_name) if event.room_name else None,
+                    event.title_raw,
+                    event.title_display,
+                    event.sort_order,
+                )
+                for event in plan.events
+            ],
         )
+        return inserter.statements + 2
+
+
+def run_apply(dsn: Optional[str], plan: ApplyPlan, batch_size: int, dry_run: bool) -> None:
+    counts = plan.row_counts()
+    total = sum(counts.values())
+    summary = ", ".join(f"{table}={count}" for table, count in counts.items())
+
+    psycopg = load_psycopg()
+    if psycopg is None or not dsn:
+        # Dry-run fallback: nothing to connect with, so just report the plan.
+        reason = "psycopg is not installed" if psycopg is None else f"no DSN (--dsn or ${APPLY_DSN_ENV})"
+        print(f"Dry run ({reason}): would load {total} rows ({summary})")
+        return
+
+    started = time.perf_counter()
+    with psycopg.connect(dsn) as connection:
+        try:
+            statements = apply_plan(connection, plan, batch_size)
+        except Exception:
+            connection.rollback()
+            raise
+        if dry_run:
+            connection.rollback()
+        else:
+            connection.commit()
+    elapsed = time.perf_counter() - started
+
+    verb = "Rolled back (dry run)" if dry_run else "Applied"
+    rate = total / elapsed if elapsed else float(total)
+    print(f"{verb} {total} rows ({summary}) in {statements} statements, {elapsed:.3f}s ({rate:,.0f} rows/s)")
+
+
+def build(args: argparse.Namespace, state: Dict[str, object]) -> None:
+    plain_run = not (args.since or args.snapshot or args.apply)
+    layout = load_layout_option(args.layout)
+    cache = None if args.no_cache else BuildCache(args.cache_dir)
+    if cache is None:
+        result = generate_events(ProgrammeGrid.load(args.input, layout=layout))
+    else:
+        grid_key = grid_cache_key(args.input)
+        layout_option = layout_to_dict(layout) if layout else None
+        output_key = derived_cache_key(
+            grid_key,
+            Path(__file__),
+            format=args.format,
+            batch_size=args.batch_size,
+            layout=layout_option,
+        )
+        if plain_run and cache.output_is_current(args.output, output_key):
+            print(f"Up to date: {args.output}")
+            return
+        result = event_result_from_cache(
+            cache.get_or_build(
+                derived_cache_key(grid_key, Path(__file__), layout=layout_option),
+                "events",
+                lambda: event_result_to_cache(generate_events(cache.load_grid(args.input, grid_key, layout))),
+            )
+        )
+    events, code_to_name, _name_to_code, day_labels = result
 
-    lines.append(",\n".join(event_values))
-    lines.append(";")
-    lines.append("")
-    lines.append("commit;")
+    # In --watch mode an edit that leaves the events unchanged does not touch the output.
+    unchanged = plain_run and state.get("result") == result and args.output.exists()
+    state["result"] = result
+    if unchanged:
+        print(f"Unchanged: {args.output}")
+        return
 
-    return "\n".join(lines)
+    print(f"Generated {len(events)} events")
+    if args.since:
+        diff = diff_events(read_event_snapshot(args.since), events)
+        write_sql(args.output, write_incremental_sql, diff, code_to_name, day_labels, args.batch_size)
+        print(f"Changes since {args.since}: {len(diff.inserted)} inserted, {len(diff.updated)} updated, {len(diff.deleted)} deleted")
+    else:
+        write_sql(args.output, SEED_FORMATS[args.format], events, code_to_name, day_labels, args.batch_size)
+        if cache is not None:
+            cache.record_output(args.output, output_key)
+    if args.snapshot:
+        write_event_snapshot(args.snapshot, events)
+        print(f"Wrote: {args.snapshot}")
+    print(f"Wrote: {args.output}")
+    if args.apply:
+        run_apply(args.dsn, build_apply_plan(events, code_to_name, day_labels), args.batch_size, args.dry_run)
+    if args.cache_stats:
+        print_cache_stats(cache_stats())
 
 
 def main() -> int:
@@ -743,26 +1009,96 @@ def main() -> int:
     parser.add_argument(
         "--input",
         type=Path,
-        default=Path("/Users/abodid/Downloads/Programme grid 2026 v4 - view only.xlsx"),
-        help="Path to source XLSX",
+        default=DEFAULT_INPUT,
+        help="Path to source XLSX (or a .bsagrid snapshot of it)",
     )
     parser.add_argument(
         "--output",
         type=Path,
-        default=Path("sql/bsa-schedule/seed/seed_2026-04-08_to_2026-04-10_from_programme_grid.sql"),
+        default=DEFAULT_OUTPUT,
         help="Output SQL file",
     )
+    parser.add_argument(
+        "--format",
+        choices=sorted(SEED_FORMATS),
+        default="sql",
+        help="sql: plain insert statements; copy: COPY FROM STDIN blocks for psql",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=positive_int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Events per insert statement (default {DEFAULT_BATCH_SIZE})",
+    )
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        help="Also write the generated events to this JSON snapshot (input for a later --since run)",
+    )
+    parser.add_argument(
+        "--since",
+        type=Path,
+        help="Previous event snapshot; write only the inserts/updates/deletes since it",
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Also load the seed into Postgres in one transaction (needs the optional psycopg package)",
+    )
+    parser.add_argument(
+        "--dsn",
+        default=os.environ.get(APPLY_DSN_ENV),
+        help=f"Postgres connection string for --apply (default ${APPLY_DSN_ENV})",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --apply, roll the transaction back instead of committing",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Build cache directory (parsed grid and derived data keyed by input hash)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-parse the workbook and rewrite the output",
+    )
+    add_layout_arguments(parser)
+    add_watch_arguments(parser)
+    add_profile_arguments(parser)
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print name-classifier cache hit/miss counters",
+    )
     args = parser.parse_args()
-
-    rows = read_first_sheet_cells(args.input)
-    events, code_to_name, _name_to_code, day_labels = generate_events(rows)
-
-    sql = to_sql(events, code_to_name, day_labels)
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(sql, encoding="utf-8")
-
-    print(f"Generated {len(events)} events")
-    print(f"Wrote: {args.output}")
+    if args.write_layout:
+        write_layout_profile(args.write_layout, ProgrammeGrid.load(args.input).layout)
+        print(f"Wrote: {args.write_layout}")
+        return 0
+    if args.since and args.format != "sql":
+        parser.error("--since only supports --format sql")
+    if args.apply and args.since:
+        parser.error("--apply loads full days; it cannot be combined with --since")
+    if args.apply and not args.dry_run and (not args.dsn or load_psycopg() is None):
+        parser.error(f"--apply needs psycopg (pip install 'psycopg[binary]') and --dsn or ${APPLY_DSN_ENV}; use --dry-run to preview")
+
+    if args.pstats and not args.profile:
+        parser.error("--pstats needs --profile")
+    if args.profile and args.watch:
+        parser.error("--profile profiles a single build; it cannot be combined with --watch")
+
+    state: Dict[str, object] = {}
+    if args.watch:
+        paths = [args.input, *([args.layout] if args.layout else [])]
+        return watch(paths, lambda: build(args, state), args.poll_interval, args.debounce)
+    if args.profile:
+        run_profiled(args.profile, args.pstats, lambda: build(args, state), cache_stats)
+    else:
+        build(args, state)
     return 0
 
 
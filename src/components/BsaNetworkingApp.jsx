@@ -5,8 +5,33 @@ function normalizeQuery(text) {
   return (text || "").trim().toLowerCase();
 }
 
+// Same folding as the generator's person_keys: accents, curly apostrophes and case.
+function normalizePersonQuery(text) {
+  return (text || "")
+    .normalize("NFKD")
+    .replace(/[\u0300-\u036f]/g, "")
+    .replace(/[\u2018\u2019\u02bc`\u00b4]/g, "'")
+    .toLowerCase()
+    .replace(/[^\p{L}\p{N}' -]+/gu, " ")
+    .replace(/\s+/g, " ")
+    .trim();
+}
+
+// Older payloads list names per topic; indexed ones list ids into `people`.
+function topicPeople(topic, people) {
+  if (topic.person_ids) {
+    return topic.person_ids.map((id) => people[id]);
+  }
+  return topic.people || [];
+}
+
+const MAX_PERSON_MATCHES = 12;
+
 const BsaNetworkingApp = ({
   topics = [],
+  people = [],
+  personKeys = [],
+  personTopics = [],
   totalPeople = 0,
   topicCount = 0,
   location = "Manchester",
@@ -14,8 +39,23 @@ const BsaNetworkingApp = ({
 }) => {
   const [selectedTopicIds, setSelectedTopicIds] = useState([]);
   const [topicQuery, setTopicQuery] = useState("");
+  const [personQuery, setPersonQuery] = useState("");
 
   const normalizedTopicQuery = normalizeQuery(topicQuery);
+  const normalizedPersonQuery = normalizePersonQuery(personQuery);
+
+  const personMatches = useMemo(() => {
+    if (!normalizedPersonQuery) {
+      return [];
+    }
+    const matches = [];
+    for (let id = 0; id < personKeys.length && matches.length < MAX_PERSON_MATCHES; id += 1) {
+      if (personKeys[id].includes(normalizedPersonQuery)) {
+        matches.push(id);
+      }
+    }
+    return matches;
+  }, [personKeys, normalizedPersonQuery]);
 
   const topicMap = useMemo(() => {
     const map = new Map();
@@ -46,9 +86,9 @@ const BsaNetworkingApp = ({
   const selectedTopicBlocks = useMemo(() => {
     return selectedTopics.map((topic) => ({
       ...topic,
-      filteredPeople: topic.people || [],
+      filteredPeople: topicPeople(topic, people),
     }));
-  }, [selectedTopics]);
+  }, [selectedTopics, people]);
 
   const aggregatedPeople = useMemo(() => {
     const merged = new Set();
@@ -87,6 +127,16 @@ const BsaNetworkingApp = ({
     setSelectedTopicIds([]);
   };
 
+  const selectPersonTopics = (personId) => {
+    setSelectedTopicIds((current) => {
+      const set = new Set(current);
+      for (const position of personTopics[personId] || []) {
+        set.add(topics[position].id);
+      }
+      return Array.from(set);
+    });
+  };
+
   return (
     <div className="bsa-net-app">
       <header className="bsa-net-hero">
@@ -126,6 +176,36 @@ const BsaNetworkingApp = ({
           />
         </div>
 
+        <div className="bsa-net-control-row">
+          <label htmlFor="bsa-person-search">Find a person</label>
+          <input
+            id="bsa-person-search"
+            type="search"
+            value={personQuery}
+            onChange={(event) => setPersonQuery(event.target.value)}
+            placeholder="Search a name to select their topics"
+            autoComplete="off"
+            disabled={!personKeys.length}
+          />
+        </div>
+
+        {personMatches.length > 0 && (
+          <div className="bsa-net-pill-wrap" role="list" aria-label="Matching people">
+            {personMatches.map((personId) => (
+              <button
+                type="button"
+                key={`person-${personId}`}
+                className="bsa-net-pill"
+                onClick={() => selectPersonTopics(personId)}
+                role="listitem"
+              >
+                <span className="bsa-net-pill-label">{people[personId]}</span>
+                <span className="bsa-net-pill-count">{(personTopics[personId] || []).length}</span>
+              </button>
+            ))}
+          </div>
+        )}
+
         <div className="bsa-net-actions">
           <button type="button" onClick={selectAllFiltered} disabled={!filteredPills.length}>
             Select shown topics
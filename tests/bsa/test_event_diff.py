@@ -0,0 +1,81 @@
+import datetime as dt
+import io
+import sys
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts" / "bsa"))
+
+from generate_seed_from_programme_grid import (  # noqa: E402
+    EventRow,
+    diff_events,
+    read_event_snapshot,
+    write_event_snapshot,
+    write_incremental_sql,
+)
+
+DAY = dt.date(2026, 4, 8)
+
+
+def event(room, title="Paper Session", start="09:00", **changes):
+    row = EventRow(
+        day=DAY,
+        start_time=start,
+        end_time="10:30",
+        session_block="Paper Session 1",
+        kind="session",
+        theme_code="CIT",
+        track=None,
+        room_name=room,
+        title_raw=title,
+        title_display=title,
+        sort_order=None,
+    )
+    return replace(row, **changes)
+
+
+BASE = [event("Room 1"), event("Room 2"), event("Room 3")]
+
+# (label, current events, expected (inserted, updated, deleted) rooms)
+DIFF_CASES = [
+    ("unchanged", BASE, ([], [], [])),
+    ("new slot", BASE + [event("Room 4")], (["Room 4"], [], [])),
+    ("removed slot", BASE[:2], ([], [], ["Room 3"])),
+    ("retitled", [BASE[0], event("Room 2", title="Renamed"), BASE[2]], ([], ["Room 2"], [])),
+    ("theme changed", [BASE[0], BASE[1], event("Room 3", theme_code="MED")], ([], ["Room 3"], [])),
+    ("moved room", [BASE[0], BASE[1], event("Room 5")], (["Room 5"], [], ["Room 3"])),
+    ("moved time", [event("Room 1", start="11:00"), BASE[1], BASE[2]], (["Room 1"], [], ["Room 1"])),
+]
+
+
+def rooms(events):
+    return [item.room_name for item in events]
+
+
+class DiffEventsTest(unittest.TestCase):
+    def test_classification(self):
+        for label, current, expected in DIFF_CASES:
+            with self.subTest(label):
+                diff = diff_events(BASE, current)
+                self.assertEqual((rooms(diff.inserted), rooms(diff.updated), rooms(diff.deleted)), expected)
+                self.assertEqual(bool(diff), any(expected))
+
+    def test_snapshot_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "events.json"
+            write_event_snapshot(path, BASE)
+            self.assertEqual(read_event_snapshot(path), BASE)
+            self.assertFalse(diff_events(read_event_snapshot(path), BASE))
+
+    def test_incremental_sql_deletes_before_inserts(self):
+        out = io.StringIO()
+        write_incremental_sql(out, diff_events(BASE, [BASE[0], BASE[1], event("Room 5")]), {"CIT": "Cities"}, {})
+        sql = out.getvalue()
+        self.assertIn("-- Incremental: 1 inserted, 0 updated, 1 deleted", sql)
+        self.assertLess(sql.index("delete from public.events"), sql.index("insert into public.events"))
+
+
+if __name__ == "__main__":
+    unittest.main()
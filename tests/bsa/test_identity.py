@@ -0,0 +1,69 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts" / "bsa"))
+
+from bsa_grid.identity import alias_map, resolve_identities  # noqa: E402
+
+# (names, expected canonical spelling per name; names not listed map to themselves)
+MERGE_CASES = [
+    (
+        "initial and full first name",
+        ["Jane O'Neill", "J. O'Neill"],
+        {"J. O'Neill": "Jane O'Neill"},
+    ),
+    (
+        "middle initial, curly apostrophe and honorific",
+        ["Jane O'Neill", "Jane O’Neill", "Dr Jane O'Neill", "Jane A. O'Neill"],
+        {
+            "Jane O'Neill": "Jane A. O'Neill",
+            "Jane O’Neill": "Jane A. O'Neill",
+            "Dr Jane O'Neill": "Jane A. O'Neill",
+        },
+    ),
+    (
+        "chained aliases resolve to the fullest form",
+        ["Kemi Rossi", "Kemi R. Rossi", "Kemi Rosa Rossi"],
+        {"Kemi Rossi": "Kemi Rosa Rossi", "Kemi R. Rossi": "Kemi Rosa Rossi"},
+    ),
+    (
+        "initial picks the one matching middle name",
+        ["Aisha B. Adeyemi", "Aisha Ben Adeyemi", "Aisha Carmen Adeyemi"],
+        {"Aisha B. Adeyemi": "Aisha Ben Adeyemi"},
+    ),
+]
+
+SEPARATE_CASES = [
+    ("different first names, same initial", ["Sam Lee", "Sara Lee"]),
+    ("initial shared by two people", ["J. O'Neill", "Jane O'Neill", "John O'Neill"]),
+    ("different middle initials", ["Jane A. Smith", "Jane B. Smith"]),
+    ("short form between two middle names", ["Aisha Adeyemi", "Aisha Ben Adeyemi", "Aisha Carmen Adeyemi"]),
+    ("full middle name is not an initial", ["Jane O'Neill", "Jane Anne O'Neill", "Jane Beth O'Neill"]),
+]
+
+
+class ResolveIdentitiesTest(unittest.TestCase):
+    def test_merges(self):
+        for label, names, expected in MERGE_CASES:
+            with self.subTest(label):
+                canonical = resolve_identities(names)
+                self.assertEqual(canonical, {name: expected.get(name, name) for name in names})
+
+    def test_keeps_people_apart(self):
+        for label, names in SEPARATE_CASES:
+            with self.subTest(label):
+                canonical = resolve_identities(names)
+                self.assertEqual(canonical, {name: name for name in names})
+
+    def test_weights_pick_spelling(self):
+        canonical = resolve_identities(["Jane O'Neill", "Jane O’Neill"], {"Jane O’Neill": 3})
+        self.assertEqual(set(canonical.values()), {"Jane O’Neill"})
+
+    def test_alias_map(self):
+        canonical = resolve_identities(["Kemi Rossi", "Kemi R. Rossi", "Kemi Rosa Rossi", "Sam Lee"])
+        self.assertEqual(alias_map(canonical), {"Kemi Rosa Rossi": ["Kemi R. Rossi", "Kemi Rossi"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts" / "bsa"))
+
+from bsa_grid import ProgrammeGrid  # noqa: E402
+from bsa_grid.synthetic import SyntheticGridSpec, build_synthetic_cells  # noqa: E402
+
+ADDENDUM_ROWS = range(125, 132)
+FIRST_SLOT_ROW = 141
+
+
+def synthetic_rows(**overrides):
+    return build_synthetic_cells(SyntheticGridSpec(days=1, rooms=6, slots_per_day=2, **overrides))
+
+
+def without_addendum(rows):
+    return {row: values for row, values in rows.items() if row not in ADDENDUM_ROWS}
+
+
+class RoundtableDetectionTest(unittest.TestCase):
+    def test_addendum_note_variants(self):
+        cases = [
+            ("Roundtable Presentations 13:30 - 15:00 (Market Place Restaurant)", "Market Place Restaurant"),
+            ("Round Table Presentations 13:30 - 15:00 (Atrium)", "Atrium"),
+            ("Roundtables (Friday) 13:30 - 15:00 (Atrium)", "Atrium"),
+            ("Roundtables 13:30 - 15:00 (tbc)", "Market Place Restaurant"),
+            ("Roundtables 13:30 - 15:00 (13:30 start)", "Market Place Restaurant"),
+        ]
+        for note, room_prefix in cases:
+            with self.subTest(note=note):
+                rows = synthetic_rows()
+                rows[125]["B"] = note
+                table = ProgrammeGrid.from_rows(rows).layout.roundtable
+                self.assertIsNotNone(table)
+                self.assertEqual(table.note_row, 125)
+                self.assertEqual(table.columns, ("D", "E", "F", "G"))
+                self.assertEqual(table.people_rows, (128, 131))
+                self.assertEqual(table.room_prefix, room_prefix)
+
+    def test_no_addendum_means_no_roundtable(self):
+        grid = ProgrammeGrid.from_rows(without_addendum(synthetic_rows()))
+        self.assertIsNone(grid.layout.roundtable)
+
+    def test_slot_label_is_not_an_addendum_note(self):
+        # A roundtable session in the slot walk, with table-like detail rows under it.
+        rows = without_addendum(synthetic_rows())
+        rows[FIRST_SLOT_ROW]["B"] = "09:00 - 10:30 Round Table Presentations"
+        for offset, col in enumerate("DEFG"):
+            rows[FIRST_SLOT_ROW + 1][col] = f"Table {offset + 1}"
+            rows[FIRST_SLOT_ROW + 2][col] = "CIT"
+        grid = ProgrammeGrid.from_rows(rows)
+        self.assertIsNone(grid.layout.roundtable)
+        self.assertEqual(len(grid.slots(grid.sections[0])), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import re
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts" / "bsa"))
+
+from bsa_grid.names import NameClassifier  # noqa: E402
+from bsa_grid.profiling import Profiler, compile_regex  # noqa: E402
+
+
+class RegexCountingTest(unittest.TestCase):
+    def test_counts_only_owned_patterns_while_profiling(self):
+        pattern = compile_regex(r"\d+")
+        pattern.search("a1")
+        with Profiler() as profiler:
+            pattern.search("a1")
+            pattern.findall("1 2")
+            re.search(r"\d", "a1")
+        pattern.search("a1")
+        self.assertEqual(profiler.counters["regex_evals"], 2)
+
+    def test_counts_instance_patterns(self):
+        classifier = NameClassifier((), extra_name_chars="’")
+        with Profiler() as profiler:
+            classifier.looks_like_person_name("Jane O’Neill")
+        self.assertGreaterEqual(profiler.counters["regex_evals"], 1)
+        with Profiler() as profiler:
+            classifier.non_name_char_re.search("x")
+        self.assertEqual(profiler.counters["regex_evals"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()